@@ -1,4 +1,5 @@
 # FILE: app/__init__.py
+import os
 from flask import Flask
 from flask_caching import Cache
 from flask_cors import CORS  # Import CORS
@@ -6,11 +7,25 @@ from .config import Config
 
 cache = Cache()
 
+# Relative paths in these settings are taken relative to the instance folder
+INSTANCE_PATH_SETTINGS = (
+    "CACHE_DIR",
+    "CACHE_SQLITE_PATH",
+    "CACHE_LOCK_DIR",
+    "LOCAL_DB_PATH",
+)
+
 
 def create_app(config_class=Config):
     """Creates and configures the Flask application instance."""
     app = Flask(__name__, instance_relative_config=False)
     app.config.from_object(config_class)
+    for name in INSTANCE_PATH_SETTINGS:
+        path = app.config.get(name)
+        if path and not os.path.isabs(path):
+            # Resolved here rather than against the working directory of
+            # whatever process (gunicorn, CLI, benchmarks) created the app
+            app.config[name] = os.path.join(app.instance_path, path)
 
     # Logging config could go here if desired
     print("--- App Configuration (API Mode) ---")  # Indicate API Mode
@@ -24,6 +39,14 @@ def create_app(config_class=Config):
     cache.init_app(app)
     CORS(app)  # <<< ENABLE CORS for all routes (adjust for production)
 
+    from .utils import init_request_deadlines
+
+    init_request_deadlines(app)  # Per-request budget for upstream calls
+
+    from .congress_registry import init_congress_registry
+
+    init_congress_registry(app)  # Congress list in memory, refreshed in background
+
     # Register Blueprints
     from .main.routes import main_bp
 
@@ -56,4 +79,22 @@ def create_app(config_class=Config):
         nominations_bp, url_prefix="/api"
     )  # Handles /api/nominations, /api/nomination/*
 
+    from .diagnostics.routes import diagnostics_bp
+
+    app.register_blueprint(
+        diagnostics_bp, url_prefix="/api/diagnostics"
+    )  # Handles /api/diagnostics/*
+
+    from .search.routes import search_bp
+
+    app.register_blueprint(search_bp, url_prefix="/api/search")  # Handles /api/search/*
+
+    from .admin.routes import admin_bp
+
+    app.register_blueprint(admin_bp, url_prefix="/api/admin")  # Handles /api/admin/*
+
+    from .cli import civictrack_cli
+
+    app.cli.add_command(civictrack_cli)  # flask civictrack ...
+
     return app
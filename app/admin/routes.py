@@ -0,0 +1,63 @@
+# FILE: app/admin/routes.py
+import hmac
+from functools import wraps
+from flask import Blueprint, jsonify, request, current_app
+from app.cache_tags import INVALIDATION_MODES, MODE_PURGE
+from app.services import invalidate_cache_tags
+
+# Blueprint prefix '/api/admin' is set during registration in app/__init__.py
+admin_bp = Blueprint("admin", __name__)
+
+
+def require_admin_token(view):
+    """Allows the request only with ``Authorization: Bearer <ADMIN_TOKEN>``."""
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        expected = current_app.config.get("ADMIN_TOKEN")
+        if not expected:
+            return jsonify({"error": "Admin API is disabled."}), 403
+        auth = request.headers.get("Authorization", "")
+        token = auth[7:] if auth.startswith("Bearer ") else ""
+        if not hmac.compare_digest(token.encode(), expected.encode()):
+            current_app.logger.warning(
+                f"Rejected admin request from {request.remote_addr}"
+            )
+            return jsonify({"error": "Invalid admin token."}), 401
+        return view(*args, **kwargs)
+
+    return wrapper
+
+
+@admin_bp.route("/cache/invalidate", methods=["POST"])  # /api/admin/cache/invalidate
+@require_admin_token
+def invalidate_cache_api():
+    """API: Purges or refreshes cached data by tag, optionally re-warming it.
+
+    Body: ``{"tags": ["congress:118", "member:A000360", "bill:118:hr:1"],
+    "mode": "purge" | "refresh", "rewarm": false}``; the tag "all" covers
+    everything.
+    """
+    body = request.get_json(silent=True) or {}
+    tags = body.get("tags")
+    mode = body.get("mode", MODE_PURGE)
+    if not isinstance(tags, list) or not tags:
+        return jsonify({"error": "Body must include a non-empty 'tags' list."}), 400
+    if mode not in INVALIDATION_MODES:
+        return jsonify({"error": f"'mode' must be one of {INVALIDATION_MODES}."}), 400
+    normalized, error = invalidate_cache_tags(
+        tags, mode=mode, rewarm=bool(body.get("rewarm"))
+    )
+    if error:
+        return jsonify({"error": error}), 400
+    return (
+        jsonify(
+            {
+                "tags": normalized,
+                "mode": mode,
+                "rewarm": bool(body.get("rewarm")),
+                "error": None,
+            }
+        ),
+        200,
+    )
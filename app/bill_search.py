@@ -0,0 +1,217 @@
+# FILE: app/bill_search.py
+import functools
+import html
+import re
+import sqlite3
+from flask import current_app
+
+from .local_db import get_local_db
+
+# Full-text index over bill titles and summaries (SQLite FTS5), filled as a
+# side effect of payloads the app already fetches: bill list blocks, bill
+# records (detail pages, the bill sync) and the summaries sub-resource. The
+# index covers the bills the app has seen; `flask civictrack sync-bills`
+# fills in a whole Congress.
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS bill_docs ("
+    " id INTEGER PRIMARY KEY,"
+    " congress INTEGER NOT NULL,"
+    " bill_type TEXT NOT NULL,"  # Lower case, as in URLs
+    " number INTEGER NOT NULL,"
+    " title TEXT,"
+    " summary TEXT,"  # Plain text of the summary, tags stripped
+    " latest_action_date TEXT,"
+    " UNIQUE (congress, bill_type, number)"
+    ")",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS bill_fts USING fts5("
+    " title, summary, content='bill_docs', content_rowid='id',"
+    " tokenize='porter unicode61')",
+    # External-content FTS: triggers keep the index in step with bill_docs
+    "CREATE TRIGGER IF NOT EXISTS bill_docs_ai AFTER INSERT ON bill_docs BEGIN"
+    " INSERT INTO bill_fts (rowid, title, summary)"
+    " VALUES (new.id, new.title, new.summary); END",
+    "CREATE TRIGGER IF NOT EXISTS bill_docs_ad AFTER DELETE ON bill_docs BEGIN"
+    " INSERT INTO bill_fts (bill_fts, rowid, title, summary)"
+    " VALUES ('delete', old.id, old.title, old.summary); END",
+    "CREATE TRIGGER IF NOT EXISTS bill_docs_au AFTER UPDATE ON bill_docs BEGIN"
+    " INSERT INTO bill_fts (bill_fts, rowid, title, summary)"
+    " VALUES ('delete', old.id, old.title, old.summary);"
+    " INSERT INTO bill_fts (rowid, title, summary)"
+    " VALUES (new.id, new.title, new.summary); END",
+)
+
+TITLE_WEIGHT = 10.0  # bm25 weight of a title match relative to the summary
+RANK_CANDIDATES = 1000  # Newest matches ranked per query; also caps the count
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _db():
+    db = get_local_db()
+    db.ensure_schema("bill_search", _SCHEMA)
+    return db
+
+
+def _best_effort(f):
+    """Indexing rides along with requests; index errors never fail them."""
+
+    @functools.wraps(f)
+    def wrapper(*args, **kwargs):
+        try:
+            return f(*args, **kwargs)
+        except sqlite3.Error as e:
+            current_app.logger.warning(f"Bill search index update failed: {e}")
+            return None
+
+    return wrapper
+
+
+def _plain_text(markup):
+    return " ".join(html.unescape(_TAG_RE.sub(" ", markup or "")).split())
+
+
+def _doc_key(item):
+    try:
+        return int(item["congress"]), str(item["type"]).lower(), int(item["number"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+@_best_effort
+def index_bills(items):
+    """Adds or updates titles from bill list items or bill records.
+
+    Summaries already indexed are kept.
+    """
+    rows = []
+    for item in items or []:
+        key = _doc_key(item) if isinstance(item, dict) else None
+        if key is None or not item.get("title"):
+            continue
+        latest_action = item.get("latestAction") or {}
+        rows.append((*key, item["title"], latest_action.get("actionDate")))
+    if not rows:
+        return 0
+    with _db().transaction() as conn:
+        conn.executemany(
+            "INSERT INTO bill_docs (congress, bill_type, number, title,"
+            " latest_action_date) VALUES (?, ?, ?, ?, ?)"
+            " ON CONFLICT (congress, bill_type, number) DO UPDATE SET"
+            " title = excluded.title,"
+            " latest_action_date = COALESCE(excluded.latest_action_date,"
+            " latest_action_date)"
+            " WHERE title IS NOT excluded.title"
+            " OR latest_action_date IS NOT excluded.latest_action_date",
+            rows,
+        )
+    return len(rows)
+
+
+@_best_effort
+def index_bill_summary(bill, summaries):
+    """Indexes a bill record's title with the text of its newest summary."""
+    key = _doc_key(bill) if isinstance(bill, dict) else None
+    texts = [s for s in summaries or [] if isinstance(s, dict) and s.get("text")]
+    if key is None or not texts:
+        return False
+    newest = max(texts, key=lambda s: str(s.get("updateDate") or s.get("actionDate")))
+    latest_action = bill.get("latestAction") or {}
+    with _db().transaction() as conn:
+        conn.execute(
+            "INSERT INTO bill_docs (congress, bill_type, number, title, summary,"
+            " latest_action_date) VALUES (?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT (congress, bill_type, number) DO UPDATE SET"
+            " title = COALESCE(excluded.title, title), summary = excluded.summary,"
+            " latest_action_date = COALESCE(excluded.latest_action_date,"
+            " latest_action_date)"
+            " WHERE summary IS NOT excluded.summary OR title IS NOT excluded.title",
+            (
+                *key,
+                bill.get("title"),
+                _plain_text(newest["text"]),
+                latest_action.get("actionDate"),
+            ),
+        )
+    return True
+
+
+def _match_expression(query):
+    """Turns free text into an FTS5 query that can't be a syntax error.
+
+    Every word must match and the last may be a prefix (search-as-you-type);
+    FTS5 operators in the input are quoted and match as plain words.
+    """
+    terms = _TERM_RE.findall(query or "")
+    if not terms:
+        return None
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def search_bills(query, congress=None, bill_type=None, offset=0, limit=20):
+    """Returns ``(results, total)``, best matches first (bm25).
+
+    A common term matches most of a Congress, so only the newest
+    RANK_CANDIDATES matches are ranked and counted; ``total`` and paging
+    stop there. Snippets are made for the returned page only, in one pass
+    over the page's rowid range (each MATCH re-reads the term's doclists).
+    """
+    match = _match_expression(query)
+    if match is None:
+        return [], 0
+    where, params = ["bill_fts MATCH ?"], [match]
+    if congress:
+        where.append("d.congress = ?")
+        params.append(int(congress))
+    if bill_type:
+        where.append("d.bill_type = ?")
+        params.append(bill_type.lower())
+    where_sql = " AND ".join(where)
+    join_sql = " JOIN bill_docs d ON d.id = bill_fts.rowid" if len(where) > 1 else ""
+    conn = _db().connection()
+    # COUNT(*) OVER () counts the candidate window: the capped total
+    page = conn.execute(
+        "SELECT rowid, score, COUNT(*) OVER () FROM ("
+        f"SELECT bill_fts.rowid AS rowid, bm25(bill_fts, {TITLE_WEIGHT}, 1.0) AS score"
+        f" FROM bill_fts{join_sql} WHERE {where_sql}"
+        " ORDER BY bill_fts.rowid DESC LIMIT ?"
+        ") ORDER BY score LIMIT ? OFFSET ?",
+        params + [RANK_CANDIDATES, limit, offset],
+    ).fetchall()
+    if not page:
+        total = conn.execute(
+            f"SELECT COUNT(*) FROM (SELECT 1 FROM bill_fts{join_sql}"
+            f" WHERE {where_sql} LIMIT ?)",
+            params + [RANK_CANDIDATES],
+        ).fetchone()[0]
+        return [], total
+    total = page[0][2]
+    scores = {row[0]: row[1] for row in page}
+    placeholders = ", ".join("?" * len(scores))
+    # CASE keeps snippet() to the page's rows; the rest of the range is skipped
+    snippets = {
+        row[0]: row[1]
+        for row in conn.execute(
+            f"SELECT rowid, CASE WHEN rowid IN ({placeholders}) THEN"
+            " snippet(bill_fts, 1, '<mark>', '</mark>', '…', 16) END"
+            " FROM bill_fts WHERE bill_fts MATCH ? AND rowid BETWEEN ? AND ?",
+            [*scores, match, min(scores), max(scores)],
+        )
+        if row[0] in scores
+    }
+    rows = conn.execute(
+        "SELECT id, congress, bill_type, number, title, latest_action_date"
+        f" FROM bill_docs WHERE id IN ({placeholders})",
+        list(scores),
+    ).fetchall()
+    results = []
+    for row in sorted(rows, key=lambda row: scores[row["id"]]):
+        result = dict(row)
+        doc_id = result.pop("id")
+        result["snippet"] = snippets.get(doc_id)
+        result["score"] = scores[doc_id]
+        results.append(result)
+    return results, total
@@ -0,0 +1,361 @@
+# FILE: app/bill_store.py
+import json
+import sqlite3
+import time
+from flask import current_app
+
+from . import bill_search, cache_tags
+from .local_db import get_local_db
+from .utils import _make_api_request, _run_concurrently
+
+# Raw bill records kept current by an incremental sync (``flask civictrack
+# sync-bills``) rather than by cache TTLs. Each Congress has an updateDate
+# watermark; a sync pages through /bill/{congress} oldest update first from
+# it and fetches detail records only for bills whose updateDate moved, so a
+# re-sync costs the changed rows plus the list pages. fetch_entity reads
+# this store before the cache.
+#
+# The list is paged by key, not offset: each page is asked for from the
+# newest updateDate already processed. A bill updated mid-sync moves to the
+# end of the list, which would shift later rows past an offset cursor.
+
+SYNC_PAGE_SIZE = 250  # Largest page Congress.gov serves
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS bills ("
+    " congress INTEGER NOT NULL,"
+    " bill_type TEXT NOT NULL,"  # Lower case, as in URLs
+    " number INTEGER NOT NULL,"
+    " update_date TEXT NOT NULL,"  # Normalized updateDate (see below)
+    " record TEXT NOT NULL,"  # JSON of the /bill/{c}/{type}/{n} "bill" object
+    " synced_at REAL NOT NULL,"
+    " PRIMARY KEY (congress, bill_type, number)"
+    ")",
+    "CREATE INDEX IF NOT EXISTS bills_update_date ON bills (congress, update_date)",
+    "CREATE TABLE IF NOT EXISTS bill_sync_state ("
+    " congress INTEGER PRIMARY KEY,"
+    " watermark TEXT,"  # Newest updateDate fully synced
+    " last_run_at REAL"  # End of the last sync that completed
+    ")",
+)
+
+
+def _db():
+    db = get_local_db()
+    db.ensure_schema("bills", _SCHEMA)
+    return db
+
+
+def _normalize_update_date(value):
+    """updateDate as a comparable "YYYY-MM-DDTHH:MM:SSZ" string."""
+    value = str(value or "")
+    return value + "T00:00:00Z" if len(value) == 10 else value
+
+
+def _bill_identity(item):
+    """Returns ``(type, number)`` of a list item or record, or None."""
+    try:
+        return str(item["type"]).lower(), int(item["number"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+# --- Reads ---
+def get_stored_bill(congress, bill_type, number):
+    """Returns the synced raw record, or None.
+
+    Records of a Congress whose last completed sync is older than
+    BILL_STORE_MAX_AGE are not served, so a store nobody syncs any more
+    falls back to the cache and upstream. So does a store that can't be
+    read.
+    """
+    try:
+        key = (int(congress), str(bill_type).lower(), int(number))
+    except (TypeError, ValueError):
+        return None
+    try:
+        row = (
+            _db()
+            .connection()
+            .execute(
+                "SELECT b.record, s.last_run_at FROM bills b"
+                " JOIN bill_sync_state s ON s.congress = b.congress"
+                " WHERE b.congress = ? AND b.bill_type = ? AND b.number = ?",
+                key,
+            )
+            .fetchone()
+        )
+    except sqlite3.Error as e:
+        # A locked or damaged store must not fail the request
+        current_app.logger.warning(f"Bill store read failed for {key}: {e}")
+        return None
+    if row is None or row["last_run_at"] is None:
+        return None
+    max_age = current_app.config.get("BILL_STORE_MAX_AGE", 2 * 86400)
+    if max_age and time.time() - row["last_run_at"] > max_age:
+        return None
+    return json.loads(row["record"])
+
+
+def sync_state(congress):
+    """Returns ``{"watermark", "last_run_at", "bills"}`` for a Congress."""
+    conn = _db().connection()
+    row = conn.execute(
+        "SELECT watermark, last_run_at FROM bill_sync_state WHERE congress = ?",
+        (int(congress),),
+    ).fetchone()
+    count = conn.execute(
+        "SELECT COUNT(*) FROM bills WHERE congress = ?", (int(congress),)
+    ).fetchone()[0]
+    return {
+        "watermark": row["watermark"] if row else None,
+        "last_run_at": row["last_run_at"] if row else None,
+        "bills": count,
+    }
+
+
+# --- Invalidation ---
+def discard_outdated(items):
+    """Drops stored bills that list summaries show to have changed since.
+
+    They are served from the cache or upstream until the next sync stores
+    them again.
+    """
+    rows = []
+    for item in items or []:
+        identity = _bill_identity(item) if isinstance(item, dict) else None
+        if identity is None or not item.get("congress") or not item.get("updateDate"):
+            continue
+        try:
+            congress = int(item["congress"])
+        except (TypeError, ValueError):
+            continue
+        rows.append((congress, *identity, _normalize_update_date(item["updateDate"])))
+    if not rows:
+        return 0
+    with _db().transaction() as conn:
+        before = conn.total_changes
+        conn.executemany(
+            "DELETE FROM bills WHERE congress = ? AND bill_type = ? AND number = ?"
+            " AND update_date < ?",
+            rows,
+        )
+        return conn.total_changes - before
+
+
+def discard_tagged(tags):
+    """Drops or stops serving the stored bills that cache tags cover.
+
+    "bill:<c>:<type>:<n>" drops that bill; "congress:<n>" and "all" stop
+    serving the Congress's (every Congress's) records until its next
+    completed sync confirms them.
+    """
+    rows, congresses, everything = [], [], False
+    for tag in tags:
+        kind, _, rest = tag.partition(":")
+        if kind == cache_tags.ALL_TAG:
+            everything = True
+        elif kind == "congress" and rest.isdigit():
+            congresses.append((int(rest),))
+        elif kind == "bill":
+            congress, bill_type, number = rest.split(":")
+            if congress.isdigit() and number.isdigit():
+                rows.append((int(congress), bill_type, int(number)))
+    if not (rows or congresses or everything):
+        return 0
+    with _db().transaction() as conn:
+        if everything:
+            conn.execute("UPDATE bill_sync_state SET last_run_at = NULL")
+        else:
+            conn.executemany(
+                "UPDATE bill_sync_state SET last_run_at = NULL WHERE congress = ?",
+                congresses,
+            )
+        conn.executemany(
+            "DELETE FROM bills WHERE congress = ? AND bill_type = ? AND number = ?",
+            rows,
+        )
+    return len(rows) + len(congresses) + everything
+
+
+# --- Sync ---
+def _stored_update_dates(congress, items):
+    """Returns {(type, number): stored update_date} for a page of list items."""
+    numbers = sorted(
+        {identity[1] for identity in map(_bill_identity, items) if identity}
+    )
+    if not numbers:
+        return {}
+    placeholders = ", ".join("?" * len(numbers))
+    rows = (
+        _db()
+        .connection()
+        .execute(
+            "SELECT bill_type, number, update_date FROM bills"
+            f" WHERE congress = ? AND number IN ({placeholders})",
+            [congress, *numbers],
+        )
+        .fetchall()
+    )
+    return {(row["bill_type"], row["number"]): row["update_date"] for row in rows}
+
+
+def _store_records(congress, fetched):
+    """Upserts ``[(item, record)]``; ``item`` supplies the watermark updateDate.
+
+    Titles are added to the search index as well.
+    """
+    now = time.time()
+    rows = []
+    for item, record in fetched:
+        bill_type, number = _bill_identity(item)
+        update_date = max(
+            _normalize_update_date(item.get("updateDate")),
+            _normalize_update_date(record.get("updateDate")),
+        )
+        rows.append((congress, bill_type, number, update_date, json.dumps(record), now))
+    with _db().transaction() as conn:
+        conn.executemany(
+            "INSERT INTO bills"
+            " (congress, bill_type, number, update_date, record, synced_at)"
+            " VALUES (?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT (congress, bill_type, number) DO UPDATE SET"
+            " update_date = excluded.update_date, record = excluded.record,"
+            " synced_at = excluded.synced_at",
+            rows,
+        )
+    bill_search.index_bills([record for _, record in fetched])
+
+
+def _save_sync_state(congress, watermark, completed):
+    with _db().transaction() as conn:
+        conn.execute(
+            "INSERT INTO bill_sync_state (congress, watermark, last_run_at)"
+            " VALUES (?, ?, ?)"
+            " ON CONFLICT (congress) DO UPDATE SET watermark = excluded.watermark,"
+            " last_run_at = COALESCE(excluded.last_run_at, last_run_at)",
+            (congress, watermark, time.time() if completed else None),
+        )
+
+
+def sync_bills(congress, full=False):
+    """Upserts the bills of ``congress`` that changed since the last sync.
+
+    With ``full`` the whole Congress is listed again, but still only bills
+    whose updateDate moved are fetched. The watermark advances after every
+    page to the newest updateDate processed, so an interrupted sync resumes
+    from there. Cached views of every stored bill are purged through their
+    cache tags. Returns a stats dict whose ``error`` is set if the sync
+    stopped early.
+    """
+    congress = int(congress)
+    watermark = sync_state(congress)["watermark"]
+    stats = {
+        "congress": congress,
+        "from": None if full else watermark,
+        "pages": 0,
+        "seen": 0,
+        "changed": 0,
+        "failed": 0,
+        "watermark": watermark,
+        "error": None,
+    }
+
+    def fetch_record(item):
+        bill_type, number = _bill_identity(item)
+        data, error = _make_api_request(f"/bill/{congress}/{bill_type}/{number}")
+        if error or not data or not isinstance(data.get("bill"), dict):
+            return None
+        return data["bill"]
+
+    processed = {}  # (type, number) -> updateDate handled in this run
+    cursor, offset = stats["from"], 0
+    while True:
+        params = {"sort": "updateDate asc", "offset": offset, "limit": SYNC_PAGE_SIZE}
+        if cursor:
+            params["fromDateTime"] = cursor
+        data, error = _make_api_request(f"/bill/{congress}", params=params)
+        if error or not data or not isinstance(data.get("bills"), list):
+            stats["error"] = error or "Invalid bill list format"
+            break
+        listed = [
+            item
+            for item in data["bills"]
+            if isinstance(item, dict)
+            and _bill_identity(item)
+            and item.get("updateDate")
+        ]
+        # Each page starts with the rows at the cursor again; skip those
+        items = [
+            item
+            for item in listed
+            if processed.get(_bill_identity(item), "")
+            < _normalize_update_date(item["updateDate"])
+        ]
+        stats["pages"] += 1
+        stats["seen"] += len(items)
+
+        stored = _stored_update_dates(congress, items)
+        changed = [
+            item
+            for item in items
+            if stored.get(_bill_identity(item), "")
+            < _normalize_update_date(item["updateDate"])
+        ]
+        records = _run_concurrently(
+            fetch_record,
+            changed,
+            max_workers=current_app.config.get("BILL_SYNC_WORKERS", 4),
+        )
+        fetched = [(item, record) for item, record in zip(changed, records) if record]
+        if fetched:
+            _store_records(congress, fetched)
+            # New or not, a stored bill outdates views cached from upstream
+            cache_tags.invalidate(
+                [
+                    cache_tags.bill_tag(congress, *_bill_identity(item))
+                    for item, _ in fetched
+                ]
+            )
+        stats["changed"] += len(fetched)
+        stats["failed"] += len(changed) - len(fetched)
+
+        failed_from = min(
+            (
+                _normalize_update_date(item["updateDate"])
+                for item, record in zip(changed, records)
+                if not record
+            ),
+            default=None,
+        )
+        done = [
+            _normalize_update_date(item["updateDate"])
+            for item in items
+            if failed_from is None
+            or _normalize_update_date(item["updateDate"]) < failed_from
+        ]
+        if done and max(done) > (stats["watermark"] or ""):
+            stats["watermark"] = max(done)  # Nothing older is left to fetch
+        if failed_from is not None:
+            stats["error"] = (
+                f"{stats['failed']} bill fetches failed from updateDate {failed_from}"
+            )
+            _save_sync_state(congress, stats["watermark"], completed=False)
+            break  # The next sync retries from the watermark
+
+        for item in items:
+            processed[_bill_identity(item)] = _normalize_update_date(item["updateDate"])
+        if len(data["bills"]) < SYNC_PAGE_SIZE:
+            _save_sync_state(congress, stats["watermark"], completed=True)
+            break
+        _save_sync_state(congress, stats["watermark"], completed=False)
+        page_newest = max(
+            (_normalize_update_date(item["updateDate"]) for item in listed),
+            default=None,
+        )
+        if page_newest and page_newest != cursor:
+            cursor, offset = page_newest, 0
+        else:
+            offset += SYNC_PAGE_SIZE  # A full page of one updateDate; step over it
+    current_app.logger.info(f"Bill sync finished: {stats}")
+    return stats
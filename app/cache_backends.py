@@ -0,0 +1,549 @@
+# FILE: app/cache_backends.py
+import os
+import pickle
+import sqlite3
+import struct
+import threading
+from collections import OrderedDict
+from time import time
+
+from flask_caching.backends.base import BaseCache
+from flask_caching.backends.filesystemcache import FileSystemCache
+from werkzeug.utils import import_string
+
+from .cache_serializers import PickleSerializer, StreamSerializer, make_serializer
+
+
+def _load_backend_class(name):
+    """Resolves a CACHE_TYPE-style name (plain flask-caching name or import path)."""
+    if "." not in name:
+        name = "flask_caching.backends." + name
+    return import_string(name)
+
+
+class ExpiringFileSystemCache(FileSystemCache):
+    """FileSystemCache that can also report when an entry expires.
+
+    ``get_with_expiry`` reads the value and its expiry from the one file, so a
+    front tier can promote entries without outliving them. Values are written
+    with the configured CACHE_SERIALIZER.
+    """
+
+    @classmethod
+    def factory(cls, app, config, args, kwargs):
+        cache = super().factory(app, config, args, kwargs)
+        cache.serializer = StreamSerializer(
+            make_serializer(
+                config.get("CACHE_SERIALIZER", "pickle"),
+                min_bytes=config.get("CACHE_COMPRESS_MIN_BYTES", 1024),
+            )
+        )
+        return cache
+
+    def get_with_expiry(self, key):
+        """Returns ``(value, expires_at)``; ``expires_at`` is 0 for no expiry."""
+        filename = self._get_filename(key)
+        try:
+            with self._safe_stream_open(filename, "rb") as f:
+                expires_at = struct.unpack("I", f.read(4))[0]
+                if expires_at == 0 or expires_at >= time():
+                    return self.serializer.load(f), expires_at
+        except FileNotFoundError:
+            pass
+        except (OSError, EOFError, struct.error, pickle.PickleError, ValueError):
+            pass
+        return None, None
+
+
+class TieredCache(BaseCache):
+    """Byte-bounded in-process LRU (L1) in front of a shared cache (L2).
+
+    Writes go to both tiers; reads try L1, then L2, promoting L2 hits. L1
+    stores pickled bytes, so callers always get their own copy and the byte
+    budget is exact. An L1 entry never outlives its L2 entry: it expires at
+    the L2 expiry, or earlier (``l1_max_ttl``) so that writes and deletes made
+    by other workers are picked up promptly. L2 hits are only promoted when
+    the L2 backend can report the entry's expiry (``get_with_expiry``). Keys
+    starting with one of ``bypass_prefixes`` (e.g. cache tag versions, which
+    must be seen by every worker at once) are never held in L1.
+    """
+
+    def __init__(
+        self,
+        l2,
+        max_bytes=64 * 1024 * 1024,
+        max_item_bytes=4 * 1024 * 1024,
+        l1_max_ttl=60,
+        bypass_prefixes=(),
+        default_timeout=300,
+    ):
+        super().__init__(default_timeout=default_timeout)
+        self.l2 = l2
+        self.bypass_prefixes = tuple(bypass_prefixes)
+        self.max_bytes = max_bytes
+        self.max_item_bytes = min(max_item_bytes, max_bytes)
+        self.l1_max_ttl = l1_max_ttl
+        self._reset_l1()
+
+    def _reset_l1(self):
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (expires_at, payload bytes)
+        self._bytes = 0
+        self._stats = {
+            "l1_hits": 0,
+            "l2_hits": 0,
+            "misses": 0,
+            "l1_evictions": 0,
+            "l1_too_large": 0,
+        }
+
+    @classmethod
+    def factory(cls, app, config, args, kwargs):
+        l2_class = _load_backend_class(config.get("CACHE_L2_TYPE", "FileSystemCache"))
+        l2 = l2_class.factory(app, config, args, dict(kwargs))  # CACHE_ARGS go to L2
+        kwargs.update(
+            dict(
+                max_bytes=config.get("CACHE_L1_MAX_BYTES", 64 * 1024 * 1024),
+                max_item_bytes=config.get("CACHE_L1_MAX_ITEM_BYTES", 4 * 1024 * 1024),
+                l1_max_ttl=config.get("CACHE_L1_MAX_TTL", 60),
+                bypass_prefixes=config.get("CACHE_L1_BYPASS_PREFIXES", ()),
+            )
+        )
+        return cls(l2, **kwargs)
+
+    # --- L1 bookkeeping (callers hold self._lock) ---
+    def _check_pid(self):
+        if self._pid != os.getpid():  # Forked: the parent's lock may be held
+            self._reset_l1()
+
+    def _l1_discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1])
+
+    def _l1_put(self, key, value, expires_at):
+        """Stores ``value`` in L1 until ``expires_at`` (capped by l1_max_ttl)."""
+        if key.startswith(self.bypass_prefixes):
+            return
+        cap = time() + self.l1_max_ttl
+        expires_at = cap if not expires_at else min(expires_at, cap)
+        if expires_at <= time():
+            return
+        try:
+            payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        with self._lock:
+            self._check_pid()
+            self._l1_discard(key)
+            if len(payload) > self.max_item_bytes:
+                self._stats["l1_too_large"] += 1
+                return
+            self._entries[key] = (expires_at, payload)
+            self._bytes += len(payload)
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self._stats["l1_evictions"] += 1
+
+    def _l1_get(self, key):
+        with self._lock:
+            self._check_pid()
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time():
+                self._l1_discard(key)
+                return None
+            self._entries.move_to_end(key)
+            self._stats["l1_hits"] += 1
+            payload = entry[1]
+        return pickle.loads(payload)
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    # --- Cache API ---
+    def get(self, key):
+        value = self._l1_get(key)
+        if value is not None:
+            return value
+        get_with_expiry = getattr(self.l2, "get_with_expiry", None)
+        if get_with_expiry is not None:
+            value, expires_at = get_with_expiry(key)
+            if value is not None:
+                self._l1_put(key, value, expires_at)
+        else:
+            value = self.l2.get(key)
+        self._count("l2_hits" if value is not None else "misses")
+        return value
+
+    def set(self, key, value, timeout=None):
+        timeout = self._normalize_timeout(timeout)
+        result = self.l2.set(key, value, timeout=timeout)
+        if result:
+            self._l1_put(key, value, int(time() + timeout) if timeout else 0)
+        else:
+            with self._lock:
+                self._l1_discard(key)
+        return result
+
+    def add(self, key, value, timeout=None):
+        timeout = self._normalize_timeout(timeout)
+        result = self.l2.add(key, value, timeout=timeout)
+        if result:
+            self._l1_put(key, value, int(time() + timeout) if timeout else 0)
+        return result
+
+    def delete(self, key):
+        with self._lock:
+            self._l1_discard(key)
+        return self.l2.delete(key)
+
+    def delete_many(self, *keys):
+        with self._lock:
+            for key in keys:
+                self._l1_discard(key)
+        return self.l2.delete_many(*keys)
+
+    def has(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] >= time():
+                return True
+        return self.l2.has(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        return self.l2.clear()
+
+    def stats(self):
+        """Per-tier hit counts and L1 occupancy for this worker."""
+        with self._lock:
+            self._check_pid()
+            stats = dict(self._stats)
+            stats.update(
+                l1_entries=len(self._entries),
+                l1_bytes=self._bytes,
+                l1_max_bytes=self.max_bytes,
+                l2_type=type(self.l2).__name__,
+                pid=os.getpid(),
+            )
+        if hasattr(self.l2, "stats"):
+            stats["l2"] = self.l2.stats()
+        return stats
+
+
+class SQLiteCache(BaseCache):
+    """Shared cache in a single SQLite file (WAL mode) with a byte budget.
+
+    Safe for many gunicorn workers: each thread of each process has its own
+    connection, and WAL lets readers proceed while one writer commits.
+    Expiry is indexed, so expired rows are purged without a scan. Once the
+    stored payloads exceed ``max_bytes``, the least recently (``"lru"``) or
+    least frequently (``"lfu"``) used rows are evicted down to
+    ``EVICT_TO_RATIO`` of the budget. Reads record access in memory and flush
+    it in batches, so a hit costs no write transaction.
+    """
+
+    EVICT_TO_RATIO = 0.9
+    MAINTENANCE_EVERY = 200  # Writes between purge/eviction passes
+    TOUCH_FLUSH_INTERVAL = 5.0  # Seconds between access-stat flushes
+
+    def __init__(
+        self,
+        path,
+        max_bytes=512 * 1024 * 1024,
+        eviction="lru",
+        busy_timeout=10.0,
+        serializer=None,
+        default_timeout=300,
+    ):
+        super().__init__(default_timeout=default_timeout)
+        self.serializer = serializer or PickleSerializer()
+        if eviction not in ("lru", "lfu"):
+            raise ValueError(f"Unknown cache eviction policy: {eviction}")
+        self.path = path
+        self.max_bytes = max_bytes
+        self.eviction = eviction
+        self.busy_timeout = busy_timeout
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._reset_process_state()
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                " key TEXT PRIMARY KEY,"
+                " value BLOB NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " expires_at REAL,"  # NULL means never expires
+                " accessed_at REAL NOT NULL,"
+                " hits INTEGER NOT NULL DEFAULT 0"
+                ")"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS cache_expires_at ON cache (expires_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS cache_accessed_at ON cache (accessed_at)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS cache_hits ON cache (hits)")
+
+    def _reset_process_state(self):
+        self._pid = os.getpid()
+        self._local = threading.local()
+        self._state_lock = threading.Lock()
+        self._touched = {}  # key -> [hits, last access] not yet flushed
+        self._last_flush = time()
+        self._writes = 0
+        self._stats = {"evicted": 0, "expired_purged": 0, "maintenance_runs": 0}
+
+    @classmethod
+    def factory(cls, app, config, args, kwargs):
+        path = config.get("CACHE_SQLITE_PATH") or os.path.join(
+            config.get("CACHE_DIR") or "flask_cache", "cache.sqlite3"
+        )
+        args.insert(0, path)
+        kwargs.update(
+            dict(
+                max_bytes=config.get("CACHE_MAX_BYTES", 512 * 1024 * 1024),
+                eviction=config.get("CACHE_EVICTION", "lru"),
+                serializer=make_serializer(
+                    config.get("CACHE_SERIALIZER", "pickle"),
+                    min_bytes=config.get("CACHE_COMPRESS_MIN_BYTES", 1024),
+                ),
+            )
+        )
+        return cls(*args, **kwargs)
+
+    def _connection(self):
+        """Returns this thread's connection (new after a fork)."""
+        if self._pid != os.getpid():
+            self._reset_process_state()
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path,
+                timeout=self.busy_timeout,
+                isolation_level=None,  # Autocommit; explicit BEGIN where needed
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # --- Access tracking and eviction ---
+    def _touch(self, key):
+        now = time()
+        with self._state_lock:
+            entry = self._touched.setdefault(key, [0, now])
+            entry[0] += 1
+            entry[1] = now
+            due = now - self._last_flush >= self.TOUCH_FLUSH_INTERVAL
+            if due:
+                touched, self._touched = self._touched, {}
+                self._last_flush = now
+        if due:
+            self._flush_touches(touched)
+
+    def _flush_touches(self, touched):
+        try:
+            self._connection().executemany(
+                "UPDATE cache SET hits = hits + ?, accessed_at = MAX(accessed_at, ?)"
+                " WHERE key = ?",
+                [(hits, accessed, key) for key, (hits, accessed) in touched.items()],
+            )
+        except sqlite3.Error:
+            pass  # Access stats are advisory; never fail a read over them
+
+    def _after_write(self):
+        with self._state_lock:
+            self._writes += 1
+            due = self._writes >= self.MAINTENANCE_EVERY
+            if due:
+                self._writes = 0
+        if due:
+            self.maintain()
+
+    def maintain(self):
+        """Purges expired rows, then evicts down to the byte budget."""
+        conn = self._connection()
+        with self._state_lock:
+            touched, self._touched = self._touched, {}
+            self._last_flush = time()
+        self._flush_touches(touched)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                purged = conn.execute(
+                    "DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                    (time(),),
+                ).rowcount
+                total = conn.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM cache"
+                ).fetchone()[0]
+                evicted = 0
+                if total > self.max_bytes:
+                    excess = total - int(self.max_bytes * self.EVICT_TO_RATIO)
+                    order = (
+                        "accessed_at" if self.eviction == "lru" else "hits, accessed_at"
+                    )
+                    victims = []
+                    for key, size in conn.execute(
+                        f"SELECT key, size FROM cache ORDER BY {order}"
+                    ):
+                        victims.append((key,))
+                        excess -= size
+                        if excess <= 0:
+                            break
+                    conn.executemany("DELETE FROM cache WHERE key = ?", victims)
+                    evicted = len(victims)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error:
+            return False
+        with self._state_lock:
+            self._stats["expired_purged"] += purged
+            self._stats["evicted"] += evicted
+            self._stats["maintenance_runs"] += 1
+        return True
+
+    # --- Cache API ---
+    def _expires_at(self, timeout):
+        timeout = self._normalize_timeout(timeout)
+        return time() + timeout if timeout else None
+
+    def get_with_expiry(self, key):
+        """Returns ``(value, expires_at)``; ``expires_at`` is 0 for no expiry."""
+        try:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT value, expires_at FROM cache WHERE key = ?"
+                    " AND (expires_at IS NULL OR expires_at > ?)",
+                    (key, time()),
+                )
+                .fetchone()
+            )
+        except sqlite3.Error:
+            return None, None
+        if row is None:
+            return None, None
+        try:
+            value = self.serializer.loads(row[0])
+        except (pickle.PickleError, EOFError, AttributeError, ImportError, ValueError):
+            return None, None
+        self._touch(key)
+        return value, row[1] or 0
+
+    def get(self, key):
+        return self.get_with_expiry(key)[0]
+
+    def set(self, key, value, timeout=None):
+        payload = self.serializer.dumps(value)
+        now = time()
+        try:
+            self._connection().execute(
+                "INSERT OR REPLACE INTO cache"
+                " (key, value, size, expires_at, accessed_at, hits)"
+                " VALUES (?, ?, ?, ?, ?, 0)",
+                (key, payload, len(payload), self._expires_at(timeout), now),
+            )
+        except sqlite3.Error:
+            return False
+        self._after_write()
+        return True
+
+    def add(self, key, value, timeout=None):
+        payload = self.serializer.dumps(value)
+        now = time()
+        try:
+            added = (
+                self._connection()
+                .execute(
+                    "INSERT INTO cache"
+                    " (key, value, size, expires_at, accessed_at, hits)"
+                    " VALUES (?, ?, ?, ?, ?, 0)"
+                    " ON CONFLICT (key) DO UPDATE SET value = excluded.value,"
+                    " size = excluded.size, expires_at = excluded.expires_at,"
+                    " accessed_at = excluded.accessed_at, hits = 0"
+                    " WHERE cache.expires_at IS NOT NULL AND cache.expires_at <= ?",
+                    (key, payload, len(payload), self._expires_at(timeout), now, now),
+                )
+                .rowcount
+            )
+        except sqlite3.Error:
+            return False
+        if added:
+            self._after_write()
+        return bool(added)
+
+    def delete(self, key):
+        try:
+            return bool(
+                self._connection()
+                .execute("DELETE FROM cache WHERE key = ?", (key,))
+                .rowcount
+            )
+        except sqlite3.Error:
+            return False
+
+    def delete_many(self, *keys):
+        try:
+            self._connection().executemany(
+                "DELETE FROM cache WHERE key = ?", [(key,) for key in keys]
+            )
+        except sqlite3.Error:
+            return False
+        return True
+
+    def has(self, key):
+        try:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT 1 FROM cache WHERE key = ?"
+                    " AND (expires_at IS NULL OR expires_at > ?)",
+                    (key, time()),
+                )
+                .fetchone()
+            )
+        except sqlite3.Error:
+            return False
+        return row is not None
+
+    def clear(self):
+        try:
+            self._connection().execute("DELETE FROM cache")
+        except sqlite3.Error:
+            return False
+        return True
+
+    def stats(self):
+        """Row count, stored bytes and eviction counters for diagnostics."""
+        try:
+            rows, total = (
+                self._connection()
+                .execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache")
+                .fetchone()
+            )
+        except sqlite3.Error:
+            rows, total = None, None
+        with self._state_lock:
+            stats = dict(self._stats)
+        stats.update(
+            rows=rows,
+            bytes=total,
+            max_bytes=self.max_bytes,
+            eviction=self.eviction,
+            serializer=self.serializer.name,
+            pid=os.getpid(),
+        )
+        return stats
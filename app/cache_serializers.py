@@ -0,0 +1,163 @@
+# FILE: app/cache_serializers.py
+import pickle
+import threading
+import zlib
+
+try:  # Optional: pip install msgpack zstandard
+    import msgpack
+    import zstandard
+except ImportError:
+    msgpack = None
+    zstandard = None
+
+# One-byte format tag in front of every payload, so entries written by any
+# serializer stay readable after CACHE_SERIALIZER changes. Untagged payloads
+# starting with the pickle protocol byte predate the tags.
+TAG_PICKLE = b"p"
+TAG_ZLIB_PICKLE = b"z"
+TAG_MSGPACK = b"m"
+TAG_ZSTD_MSGPACK = b"M"
+TAG_ZSTD_PICKLE = b"Z"
+_LEGACY_PICKLE = 0x80
+
+_zstd_local = threading.local()  # zstd (de)compressors aren't thread-safe
+
+
+def _zstd_compressor(level):
+    compressors = _zstd_local.__dict__.setdefault("compressors", {})
+    if level not in compressors:
+        compressors[level] = zstandard.ZstdCompressor(level=level)
+    return compressors[level]
+
+
+def _zstd_decompressor():
+    if not hasattr(_zstd_local, "decompressor"):
+        _zstd_local.decompressor = zstandard.ZstdDecompressor()
+    return _zstd_local.decompressor
+
+
+def _require_msgpack_zstd():
+    if msgpack is None or zstandard is None:
+        raise RuntimeError(
+            "The msgpack-zstd cache serializer needs the msgpack and "
+            "zstandard packages."
+        )
+
+
+def loads(payload):
+    """Decodes a payload written by any serializer in this module.
+
+    Raises ValueError for unknown or corrupt payloads.
+    """
+    try:
+        return _decode(payload)
+    except zlib.error as e:
+        raise ValueError(f"Corrupt cache payload: {e}") from e
+    except Exception as e:
+        if zstandard is not None and isinstance(e, zstandard.ZstdError):
+            raise ValueError(f"Corrupt cache payload: {e}") from e
+        raise
+
+
+def _decode(payload):
+    tag, body = payload[:1], payload[1:]
+    if tag == TAG_PICKLE:
+        return pickle.loads(body)
+    if tag == TAG_ZLIB_PICKLE:
+        return pickle.loads(zlib.decompress(body))
+    if tag in (TAG_MSGPACK, TAG_ZSTD_MSGPACK, TAG_ZSTD_PICKLE):
+        _require_msgpack_zstd()
+        if tag != TAG_MSGPACK:
+            body = _zstd_decompressor().decompress(body)
+        if tag == TAG_ZSTD_PICKLE:
+            return pickle.loads(body)
+        return msgpack.unpackb(body, raw=False, strict_map_key=False)
+    if payload[:1] == bytes([_LEGACY_PICKLE]):
+        return pickle.loads(payload)
+    raise ValueError(f"Unknown cache payload format: {tag!r}")
+
+
+class PickleSerializer:
+    """Plain pickle, the format the cache used before serializers existed."""
+
+    name = "pickle"
+
+    def __init__(self, min_bytes=None):
+        self.min_bytes = min_bytes
+
+    def dumps(self, value):
+        return TAG_PICKLE + pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+    loads = staticmethod(loads)
+
+
+class ZlibSerializer(PickleSerializer):
+    """Pickle, zlib-compressed when at least ``min_bytes`` long."""
+
+    name = "zlib"
+
+    def __init__(self, min_bytes=1024, level=6):
+        super().__init__(min_bytes)
+        self.level = level
+
+    def dumps(self, value):
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        if len(data) >= self.min_bytes:
+            compressed = zlib.compress(data, self.level)
+            if len(compressed) < len(data):
+                return TAG_ZLIB_PICKLE + compressed
+        return TAG_PICKLE + data
+
+
+class MsgpackZstdSerializer(PickleSerializer):
+    """msgpack, zstd-compressed when at least ``min_bytes`` long.
+
+    msgpack has no tuples or sets (tuples come back as lists); values it can't
+    encode at all fall back to pickle inside the same zstd framing.
+    """
+
+    name = "msgpack-zstd"
+
+    def __init__(self, min_bytes=1024, level=3):
+        _require_msgpack_zstd()
+        super().__init__(min_bytes)
+        self.level = level
+
+    def dumps(self, value):
+        try:
+            data = msgpack.packb(value, use_bin_type=True)
+            plain_tag, compressed_tag = TAG_MSGPACK, TAG_ZSTD_MSGPACK
+        except (TypeError, ValueError, OverflowError):
+            data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+            plain_tag, compressed_tag = TAG_PICKLE, TAG_ZSTD_PICKLE
+        if len(data) >= self.min_bytes:
+            compressed = _zstd_compressor(self.level).compress(data)
+            if len(compressed) < len(data):
+                return compressed_tag + compressed
+        return plain_tag + data
+
+
+SERIALIZERS = {
+    cls.name: cls for cls in (PickleSerializer, ZlibSerializer, MsgpackZstdSerializer)
+}
+
+
+def make_serializer(name, min_bytes=1024):
+    """Builds the serializer configured by CACHE_SERIALIZER."""
+    try:
+        return SERIALIZERS[name](min_bytes=min_bytes)
+    except KeyError:
+        raise ValueError(f"Unknown cache serializer: {name}") from None
+
+
+class StreamSerializer:
+    """Adapts a serializer to cachelib's file-based dump(value, f)/load(f)."""
+
+    def __init__(self, serializer):
+        self.serializer = serializer
+
+    def dump(self, value, f):
+        f.write(self.serializer.dumps(value))
+
+    def load(self, f):
+        return self.serializer.loads(f.read())
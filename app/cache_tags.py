@@ -0,0 +1,121 @@
+# FILE: app/cache_tags.py
+import time
+from flask import current_app
+
+from . import cache
+
+# Version-based cache tags. Each tag has a version in the shared cache; cached
+# entries remember the versions of their tags when they were computed, and
+# invalidating a tag just bumps its version. Nothing has to enumerate the
+# entries of a tag. Each worker trusts the versions it read for
+# CACHE_TAG_CHECK_INTERVAL seconds, so cache hits don't read the shared cache;
+# other workers see an invalidation within that interval, the invalidating
+# worker at once.
+#
+# Tag names: "congress:<n>", "member:<bioguide id>", "bill:<c>:<type>:<n>",
+# and "all", which every tagged entry carries.
+
+# Tag versions are never held in the in-process L1 (CACHE_L1_BYPASS_PREFIXES)
+TAG_KEY_PREFIX = "tag:"
+MODE_PURGE = "purge"  # Outdated entries are misses
+MODE_REFRESH = "refresh"  # Outdated entries are served stale while refreshed
+INVALIDATION_MODES = (MODE_PURGE, MODE_REFRESH)
+_MAX_HELD_STATES = 50000  # Bound on the per-worker copy of tag states
+ALL_TAG = "all"  # Invalidating it outdates every tagged entry
+
+_held_states = {}  # tag -> (trusted until, state) in this worker
+
+
+def _as_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return value  # Left as is; such a tag never matches a valid one
+
+
+def congress_tag(congress):
+    return f"congress:{_as_int(congress)}"
+
+
+def member_tag(bioguide_id):
+    return f"member:{str(bioguide_id).upper()}"
+
+
+def bill_tag(congress, item_type, number):
+    return f"bill:{_as_int(congress)}:{str(item_type).lower()}:{_as_int(number)}"
+
+
+def _tag_key(tag):
+    return f"{TAG_KEY_PREFIX}{tag}"
+
+
+def _hold_state(tag, state, now):
+    interval = current_app.config.get("CACHE_TAG_CHECK_INTERVAL", 2)
+    if interval > 0:
+        _held_states[tag] = (now + interval, state)
+
+
+def _read_states(tags):
+    """Returns {tag: {"version", "mode"} or None}.
+
+    Read from this worker's recent copies, falling back to the shared cache
+    for tags not read within CACHE_TAG_CHECK_INTERVAL.
+    """
+    now = time.monotonic()
+    states, missing = {}, []
+    for tag in tags:
+        held = _held_states.get(tag)
+        if held is not None and held[0] > now:
+            states[tag] = held[1]
+        else:
+            missing.append(tag)
+    if missing:
+        if len(_held_states) > _MAX_HELD_STATES:
+            _held_states.clear()
+        fetched = cache.get_many(*[_tag_key(tag) for tag in missing])
+        for tag, state in zip(missing, fetched):
+            states[tag] = state
+            _hold_state(tag, state, now)
+    return states
+
+
+def snapshot(tags):
+    """Current versions of ``tags``, to be stored with a freshly computed entry.
+
+    Take the snapshot before computing the value, so an invalidation that
+    lands mid-computation still outdates it.
+    """
+    return {
+        tag: (state or {}).get("version", 0)
+        for tag, state in _read_states([*tags, ALL_TAG]).items()
+    }
+
+
+def outdated(tag_snapshot):
+    """Returns None if the snapshot is current, else the invalidation mode.
+
+    When several tags moved, purge wins over refresh.
+    """
+    if not tag_snapshot:
+        return None
+    mode = None
+    for tag, state in _read_states(tag_snapshot).items():
+        state = state or {}
+        if state.get("version", 0) != tag_snapshot[tag]:
+            if state.get("mode", MODE_PURGE) == MODE_PURGE:
+                return MODE_PURGE
+            mode = MODE_REFRESH
+    return mode
+
+
+def invalidate(tags, mode=MODE_PURGE):
+    """Bumps each tag's version; entries tagged with any of them go stale."""
+    if mode not in INVALIDATION_MODES:
+        raise ValueError(f"Unknown invalidation mode: {mode}")
+    version = time.time_ns()
+    now = time.monotonic()
+    for tag in tags:
+        state = {"version": version, "mode": mode}
+        cache.set(_tag_key(tag), state, timeout=0)
+        _hold_state(tag, state, now)
+    return version
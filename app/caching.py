@@ -0,0 +1,380 @@
+# FILE: app/caching.py
+import functools
+import hashlib
+import inspect
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from flask import current_app
+
+from . import cache, cache_tags
+from .entities import entity_stats
+from .utils import SingleFlight, _deadline_remaining, background_priority
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, cross-worker locking is skipped
+    fcntl = None
+
+_memo_single_flight = SingleFlight()
+
+
+# --- Cross-worker fill lock ---
+def _try_lock_file(path):
+    """Opens and flocks ``path`` without blocking; returns the fd or None.
+
+    A lock file is unlinked by its holder on release, so after locking we
+    check the path still refers to the inode we hold before trusting it.
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return None
+    try:
+        if os.fstat(fd).st_ino == os.stat(path).st_ino:
+            return fd
+    except FileNotFoundError:
+        pass
+    os.close(fd)  # Stale file replaced by a newer holder; try again
+    return None
+
+
+@contextmanager
+def _cross_worker_lock(key):
+    """Holds an exclusive per-key flock shared by all gunicorn workers.
+
+    If the lock can't be taken within CACHE_LOCK_TIMEOUT, or before the
+    current request's deadline if that is sooner, the caller proceeds
+    unlocked rather than failing the request.
+    """
+    lock_dir = current_app.config.get("CACHE_LOCK_DIR")
+    if fcntl is None or not lock_dir:
+        yield False
+        return
+    path = os.path.join(lock_dir, hashlib.md5(key.encode()).hexdigest() + ".lock")
+    fd = None
+    try:
+        os.makedirs(lock_dir, exist_ok=True)
+        wait = current_app.config.get("CACHE_LOCK_TIMEOUT", 30)
+        remaining = _deadline_remaining()
+        if remaining is not None:
+            wait = max(0, min(wait, remaining))
+        deadline = time.monotonic() + wait
+        while True:
+            fd = _try_lock_file(path)
+            if fd is not None or time.monotonic() >= deadline:
+                break
+            time.sleep(0.05)
+    except OSError as e:
+        current_app.logger.warning(f"Cache lock unavailable for {key}: {e}")
+    if fd is None:
+        current_app.logger.warning(f"No cache fill lock for {key}; filling anyway.")
+        yield False
+        return
+    try:
+        yield True
+    finally:
+        try:
+            os.unlink(path)  # Keep the lock directory from growing
+        except OSError:
+            pass
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+# --- Error-aware caching policy ---
+RESULT_OK = "ok"
+RESULT_NOT_FOUND = "not_found"  # Cached briefly (CACHE_NEGATIVE_TTL)
+RESULT_TRANSIENT = "transient"  # Never cached
+
+_NOT_FOUND_RE = re.compile(r"\bAPI HTTP 404\b")
+
+
+def classify_result(value):
+    """Sorts a service result into ok / not found / transient failure.
+
+    Service functions report failure as ``None`` or a dict with an ``error``.
+    An upstream 404 is an answer and may be cached for a short while; every
+    other error (timeouts, network errors, 5xx, 429, open circuits, exhausted
+    deadlines or budgets, malformed payloads) is assumed to be transient.
+    """
+    if value is None:
+        return RESULT_TRANSIENT
+    if isinstance(value, dict) and value.get("error"):
+        if _NOT_FOUND_RE.search(str(value["error"])):
+            return RESULT_NOT_FOUND
+        return RESULT_TRANSIENT
+    return RESULT_OK
+
+
+# --- Stale-while-revalidate bookkeeping ---
+_ENVELOPE_MARKER = "__memo__"
+
+_refresh_executor = None
+_refresh_executor_pid = None
+_refresh_lock = threading.Lock()
+_refreshing = set()  # Keys with a background refresh queued or running
+
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+def _count(name, outcome):
+    with _stats_lock:
+        counters = _stats.setdefault(
+            name,
+            {
+                "hit": 0,
+                "stale": 0,
+                "miss": 0,
+                "refresh": 0,
+                "refresh_failed": 0,
+                "negative_cached": 0,
+                "error_not_cached": 0,
+            },
+        )
+        counters[outcome] += 1
+
+
+def memo_stats():
+    """Returns this worker's per-function memoize counters and cache tier stats."""
+    with _stats_lock:
+        stats = {name: dict(counters) for name, counters in _stats.items()}
+    for counters in stats.values():
+        lookups = counters["hit"] + counters["stale"] + counters["miss"]
+        counters["hit_ratio"] = (
+            (counters["hit"] + counters["stale"]) / lookups if lookups else 0.0
+        )
+    backend = cache.cache
+    tiers = backend.stats() if hasattr(backend, "stats") else None
+    return {
+        "functions": stats,
+        "tiers": tiers,
+        "entities": entity_stats(),
+        "pid": os.getpid(),
+    }
+
+
+def _get_refresh_executor():
+    """Returns this worker process's background refresh pool."""
+    global _refresh_executor, _refresh_executor_pid
+    pid = os.getpid()
+    if _refresh_executor is not None and _refresh_executor_pid == pid:
+        return _refresh_executor
+    with _refresh_lock:
+        if _refresh_executor is None or _refresh_executor_pid != pid:
+            _refresh_executor = ThreadPoolExecutor(
+                max_workers=current_app.config.get("CACHE_REFRESH_WORKERS", 4),
+                thread_name_prefix="cache-refresh",
+            )
+            _refresh_executor_pid = pid
+            _refreshing.clear()
+    return _refresh_executor
+
+
+def submit_background(func, *args):
+    """Runs ``func(*args)`` on the refresh pool at background priority.
+
+    Used for re-warming after an invalidation.
+    """
+    app = current_app._get_current_object()
+
+    def run():
+        try:
+            with app.app_context(), background_priority():
+                func(*args)
+        except Exception as e:
+            app.logger.exception(f"Background task {func.__name__} raised: {e}")
+
+    return _get_refresh_executor().submit(run)
+
+
+def _unwrap(entry):
+    """Returns (value, soft_expires, tag snapshot) for a cached envelope.
+
+    Entries are plain dicts so any cache serializer can store them; values
+    written before envelopes existed read as a miss.
+    """
+    if isinstance(entry, dict) and _ENVELOPE_MARKER in entry:
+        return entry["value"], entry[_ENVELOPE_MARKER], entry.get("tags")
+    return None, None, None
+
+
+def _lookup(key):
+    """Returns ``(value, state)`` with state "fresh", "stale" or "miss".
+
+    An entry whose tags were invalidated since it was computed is a miss
+    (purge) or stale (refresh).
+    """
+    value, soft_expires, tag_snapshot = _unwrap(cache.get(key))
+    if value is None:
+        return None, "miss"
+    mode = cache_tags.outdated(tag_snapshot)
+    if mode == cache_tags.MODE_PURGE:
+        return None, "miss"
+    if mode == cache_tags.MODE_REFRESH or (
+        soft_expires is not None and soft_expires <= time.time()
+    ):
+        return value, "stale"
+    return value, "fresh"
+
+
+# --- Memoization with stampede protection ---
+def memoize(
+    timeout=None, response_filter=None, stale_ttl=None, tags=None, normalize=None
+):
+    """Caches a service function's result, keyed on its arguments.
+
+    Drop-in for ``cache.memoize`` with stale-while-revalidate: ``timeout`` is
+    the soft TTL, either in seconds or a callable computing it from the
+    result (returning None falls back to CACHE_DEFAULT_TIMEOUT). Past it the
+    cached value is still served for up to ``stale_ttl`` more seconds
+    (CACHE_STALE_TTL by default) while one background refresh replaces it; a
+    failed refresh leaves the stale value in place, so the last good result
+    keeps being served until the hard TTL.
+
+    ``tags(**arguments)`` names the cache tags of a call from its arguments
+    (see ``cache_tags``); invalidating any of them purges or refreshes the
+    entry. ``normalize(**arguments)`` returns the canonical arguments the
+    call is keyed on and made with, so that e.g. "HR" and "hr" share one
+    entry.
+
+    Misses are protected against stampedes: concurrent callers in this process
+    share one computation, and across workers only the holder of the key's
+    fill lock computes while the others wait and then read its result.
+    Failures are cached per ``classify_result``; ``response_filter(result)``
+    can veto caching other results.
+    """
+
+    def decorator(f):
+        name = f"{f.__module__}.{f.__qualname__}"
+        signature = inspect.signature(f)
+
+        def _arguments(args, kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            if normalize is None:
+                return dict(bound.arguments)
+            return normalize(**bound.arguments)
+
+        def make_cache_key(*args, **kwargs):
+            arg_repr = repr(tuple(_arguments(args, kwargs).values()))
+            return f"memo:{name}:{hashlib.md5(arg_repr.encode()).hexdigest()}"
+
+        def _ttls(value):
+            config = current_app.config
+            soft = timeout(value) if callable(timeout) else timeout
+            if soft is None:
+                soft = config.get("CACHE_DEFAULT_TIMEOUT", 300)
+            stale = stale_ttl
+            if stale is None:
+                stale = config.get("CACHE_STALE_TTL", 0)
+            return soft, stale
+
+        def _tag_snapshot(args, kwargs):
+            if not tags:
+                return None
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return cache_tags.snapshot(tags(**bound.arguments))
+
+        def _store(key, value, tag_snapshot=None):
+            """Writes ``value`` in an envelope; False if it must not be cached.
+
+            Transient failures are never cached and 404s only for
+            CACHE_NEGATIVE_TTL, without a stale window.
+            """
+            outcome = classify_result(value)
+            if outcome == RESULT_TRANSIENT:
+                _count(name, "error_not_cached")
+                return False
+            if response_filter is not None and not response_filter(value):
+                return False
+            soft, stale = _ttls(value)
+            if outcome == RESULT_NOT_FOUND:
+                negative = current_app.config.get("CACHE_NEGATIVE_TTL", 300)
+                soft = min(soft, negative) if soft else negative
+                stale = 0
+                _count(name, "negative_cached")
+            if not soft:  # 0 means never expire, as in flask-caching
+                soft_expires, hard = None, 0
+            else:
+                soft_expires, hard = time.time() + soft, soft + stale
+            entry = {_ENVELOPE_MARKER: soft_expires, "value": value}
+            if tag_snapshot:
+                entry["tags"] = tag_snapshot
+            cache.set(key, entry, timeout=hard)
+            return True
+
+        def _fill(key, args, kwargs):
+            with _cross_worker_lock(key):
+                value, state = _lookup(key)  # Another worker may have filled it
+                if state != "miss":
+                    return value
+                tag_snapshot = _tag_snapshot(args, kwargs)
+                value = f(*args, **kwargs)
+                _store(key, value, tag_snapshot)
+                return value
+
+        def _refresh(app, key, args, kwargs):
+            try:
+                with app.app_context(), background_priority():
+                    with _cross_worker_lock(key):
+                        if _lookup(key)[1] == "fresh":
+                            return  # Another worker refreshed it meanwhile
+                        tag_snapshot = _tag_snapshot(args, kwargs)
+                        fresh = f(*args, **kwargs)
+                        if not _store(key, fresh, tag_snapshot):
+                            _count(name, "refresh_failed")
+                            app.logger.warning(
+                                f"Background refresh of {name} failed; "
+                                "keeping the stale value."
+                            )
+                            return
+                        _count(name, "refresh")
+            except Exception as e:
+                _count(name, "refresh_failed")
+                app.logger.exception(f"Background refresh of {name} raised: {e}")
+            finally:
+                with _refresh_lock:
+                    _refreshing.discard(key)
+
+        def _schedule_refresh(key, args, kwargs):
+            executor = _get_refresh_executor()
+            with _refresh_lock:
+                if key in _refreshing:
+                    return
+                _refreshing.add(key)
+            app = current_app._get_current_object()
+            try:
+                executor.submit(_refresh, app, key, args, kwargs)
+            except RuntimeError:  # Interpreter shutting down
+                with _refresh_lock:
+                    _refreshing.discard(key)
+
+        @functools.wraps(f)
+        def decorated_function(*args, **kwargs):
+            if normalize is not None:
+                args, kwargs = (), _arguments(args, kwargs)
+            key = make_cache_key(*args, **kwargs)
+            value, state = _lookup(key)
+            if state == "fresh":
+                _count(name, "hit")
+                return value
+            if state == "stale":
+                _count(name, "stale")
+                _schedule_refresh(key, args, kwargs)
+                return value
+            _count(name, "miss")
+            return _memo_single_flight.do(key, lambda: _fill(key, args, kwargs))
+
+        decorated_function.uncached = f
+        decorated_function.make_cache_key = make_cache_key
+        return decorated_function
+
+    return decorator
@@ -0,0 +1,127 @@
+# FILE: app/circuit.py
+import threading
+import time
+from flask import current_app
+
+CIRCUIT_OPEN_ERROR = "Circuit open"  # Prefix of errors returned while open
+
+# Endpoint prefix -> breaker family; amendments share the bill family
+ENDPOINT_FAMILIES = (
+    ("/bill", "bill"),
+    ("/amendment", "bill"),
+    ("/member", "member"),
+    ("/committee", "committee"),
+    ("/nomination", "nomination"),
+)
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def endpoint_family(endpoint):
+    """Maps an API endpoint path to its circuit breaker family."""
+    for prefix, family in ENDPOINT_FAMILIES:
+        if endpoint.startswith(prefix):
+            return family
+    return "other"
+
+
+class CircuitBreaker:
+    """Classic closed/open/half-open breaker for one upstream endpoint family.
+
+    After ``failure_threshold`` consecutive failures (timeouts, network errors,
+    5xx) the breaker opens and calls fail fast for ``reset_timeout`` seconds.
+    Then a single trial call is let through (half-open): success closes the
+    breaker, failure re-opens it.
+    """
+
+    def __init__(self, family, failure_threshold=5, reset_timeout=30.0):
+        self.family = family
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+        self.rejected_total = 0
+        self.opened_total = 0
+
+    def allow(self):
+        """Returns True if a call may go upstream now."""
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open":
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    self.rejected_total += 1
+                    return False
+                self.state = "half-open"
+                self._trial_in_flight = False
+            if self._trial_in_flight:  # half-open: one trial call at a time
+                self.rejected_total += 1
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def cancel(self):
+        """Releases a granted half-open trial that was never sent upstream."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self):
+        with self._lock:
+            self.state = "closed"
+            self.consecutive_failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            self._trial_in_flight = False
+            if (
+                self.state == "half-open"
+                or self.consecutive_failures >= self.failure_threshold
+            ):
+                if self.state != "open":
+                    self.opened_total += 1
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+    def snapshot(self):
+        with self._lock:
+            retry_in = None
+            if self.state == "open":
+                retry_in = max(
+                    0.0, self.reset_timeout - (time.monotonic() - self.opened_at)
+                )
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "retry_in_seconds": retry_in,
+                "opened_total": self.opened_total,
+                "rejected_total": self.rejected_total,
+            }
+
+
+def get_breaker(family):
+    """Returns the process-wide breaker for an endpoint family."""
+    breaker = _breakers.get(family)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(family)
+            if breaker is None:
+                config = current_app.config
+                breaker = CircuitBreaker(
+                    family,
+                    failure_threshold=config.get("CIRCUIT_FAILURE_THRESHOLD", 5),
+                    reset_timeout=config.get("CIRCUIT_RESET_TIMEOUT", 30.0),
+                )
+                _breakers[family] = breaker
+    return breaker
+
+
+def breakers_snapshot():
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {family: breaker.snapshot() for family, breaker in breakers.items()}
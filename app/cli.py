@@ -0,0 +1,52 @@
+# FILE: app/cli.py
+import click
+from flask.cli import AppGroup
+
+from .bill_store import sync_bills
+from .cache_tags import MODE_PURGE, MODE_REFRESH
+from .services import invalidate_cache_tags, rewarm_cache_tags
+from .utils import background_priority
+
+# Registered in create_app; run as `flask --app app civictrack <command>`
+civictrack_cli = AppGroup("civictrack", help="CivicTrack maintenance commands.")
+
+
+@civictrack_cli.command("invalidate")
+@click.argument("tags", nargs=-1, required=True)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Serve stale entries while they refresh instead of purging them.",
+)
+@click.option("--rewarm", is_flag=True, help="Recompute the purged views now.")
+def invalidate_command(tags, refresh, rewarm):
+    """Invalidates cached data by tag (all, congress:N, member:ID, bill:C:TYPE:N)."""
+    mode = MODE_REFRESH if refresh else MODE_PURGE
+    normalized, error = invalidate_cache_tags(list(tags), mode=mode)
+    if error:
+        raise click.UsageError(error)
+    click.echo(f"Invalidated ({mode}): {', '.join(normalized)}")
+    if rewarm:
+        with background_priority():
+            rewarm_cache_tags(normalized)
+        click.echo("Re-warmed.")
+
+
+@civictrack_cli.command("sync-bills")
+@click.option("--congress", type=int, required=True, help="Congress to sync.")
+@click.option(
+    "--full",
+    is_flag=True,
+    help="List every bill again instead of starting from the watermark.",
+)
+def sync_bills_command(congress, full):
+    """Upserts bills changed since the last sync into the local bill store."""
+    with background_priority():
+        stats = sync_bills(congress, full=full)
+    click.echo(
+        f"Congress {congress}: {stats['seen']} listed in {stats['pages']} pages, "
+        f"{stats['changed']} changed, {stats['failed']} failed; "
+        f"watermark {stats['watermark']}"
+    )
+    if stats["error"]:
+        raise click.ClickException(f"Sync stopped early: {stats['error']}")
@@ -1,24 +1,11 @@
 # FILE: app/committees/routes.py
 from flask import Blueprint, jsonify, request, current_app
-from app.services import get_congress_list, get_committees_list, get_committee_details
+from app.congress_registry import get_congress_registry
+from app.services import get_committees_list, get_committee_details
 
 # Blueprint prefix '/api' is set during registration
 committees_bp = Blueprint("committees", __name__)
 
-AVAILABLE_CONGRESSES = None
-DEFAULT_CONGRESS = None
-
-
-@committees_bp.before_request
-def load_committee_config_data():
-    global AVAILABLE_CONGRESSES, DEFAULT_CONGRESS
-    AVAILABLE_CONGRESSES = get_congress_list() or []
-    DEFAULT_CONGRESS = (
-        AVAILABLE_CONGRESSES[0]["number"] if AVAILABLE_CONGRESSES else 118
-    )
-    current_app.logger.info("Committee Blueprint: Loaded Congress list and default.")
-
-
 # --- REMOVED Page Route: /committees ---
 
 
@@ -26,7 +13,6 @@ def load_committee_config_data():
 @committees_bp.route("/committees")  # Accessible at /api/committees
 def get_committees_list_api():
     """API endpoint to fetch list of committees based on filters."""
-    global AVAILABLE_CONGRESSES  # Use loaded list
     congress = request.args.get("congress", default=None, type=str)
     chamber = request.args.get("chamber", default=None, type=str)
     offset = request.args.get("offset", default=0, type=int)
@@ -37,8 +23,9 @@ def get_committees_list_api():
     if chamber and chamber.lower() not in valid_chambers:
         chamber = None
     if congress:
-        valid_congress_numbers = [c.get("number") for c in AVAILABLE_CONGRESSES]
-        if not congress.isdigit() or int(congress) not in valid_congress_numbers:
+        if not congress.isdigit() or not get_congress_registry().is_valid_congress(
+            congress
+        ):
             congress = None
     if limit > 100 or limit < 1:
         limit = 25
@@ -6,16 +6,105 @@ class Config:
     """Flask configuration variables."""
 
     SECRET_KEY = os.environ.get("SECRET_KEY") or "dev-secret-key-please-change"
+    # Bearer token for /api/admin and its cache purge API; unset disables it
+    ADMIN_TOKEN = os.environ.get("CIVICTRACK_ADMIN_TOKEN")
 
     # Cache Config
-    CACHE_TYPE = "FileSystemCache"
-    CACHE_DIR = "flask_cache"  # Relative path within instance folder
+    # In-process LRU (L1) in front of the shared on-disk cache (L2). L2 is one
+    # SQLite file shared by all workers; ExpiringFileSystemCache uses CACHE_DIR
+    CACHE_TYPE = "app.cache_backends.TieredCache"
+    CACHE_L2_TYPE = "app.cache_backends.SQLiteCache"
+    CACHE_DIR = "flask_cache"  # Relative to the instance folder
+    CACHE_SQLITE_PATH = None  # Defaults to CACHE_DIR/cache.sqlite3
+    CACHE_MAX_BYTES = 512 * 1024 * 1024  # SQLite payload budget before eviction
+    CACHE_EVICTION = "lru"  # "lru" or "lfu"
+    # L2 payload format: "pickle", "zlib" or "msgpack-zstd" (needs msgpack and
+    # zstandard); payloads below CACHE_COMPRESS_MIN_BYTES aren't compressed
+    CACHE_SERIALIZER = "zlib"
+    CACHE_COMPRESS_MIN_BYTES = 1024
+    CACHE_L1_MAX_BYTES = 64 * 1024 * 1024  # Pickled bytes held per worker
+    CACHE_L1_MAX_ITEM_BYTES = 4 * 1024 * 1024  # Larger values stay L2-only
+    CACHE_L1_MAX_TTL = 60  # Seconds; bounds staleness vs. other workers' writes
+    CACHE_L1_BYPASS_PREFIXES = ("tag:",)  # Always read from L2 (tag versions)
+    CACHE_TAG_CHECK_INTERVAL = 2  # Seconds a worker reuses tag versions it read
     CACHE_DEFAULT_TIMEOUT = 3600  # 1 hour default
+    # Cross-worker fill locks so only one gunicorn worker computes a missing key
+    CACHE_LOCK_DIR = "flask_cache_locks"  # Relative to the instance folder
+    CACHE_LOCK_TIMEOUT = 30  # Seconds; never beyond the request's deadline
+    # Stale-while-revalidate: past its TTL a memoized value is served for up to
+    # this long while a background refresh runs; failed refreshes keep it
+    CACHE_STALE_TTL = 7 * 86400
+    CACHE_REFRESH_WORKERS = 4  # Background refresh threads per worker
+    # Upstream 404s are cached this long; other failures are never cached
+    CACHE_NEGATIVE_TTL = 300
+    # Adaptive TTLs for bills, amendments and nominations: entities of a closed
+    # Congress rarely change; current ones by days since their latest action
+    CACHE_TTL_CLOSED_CONGRESS = 21 * 86400
+    CACHE_TTL_HOT = 600  # Latest action within CACHE_TTL_HOT_DAYS
+    CACHE_TTL_HOT_DAYS = 3
+    CACHE_TTL_WARM = 2 * 3600  # Latest action within CACHE_TTL_WARM_DAYS
+    CACHE_TTL_WARM_DAYS = 30
+    CACHE_TTL_COLD = 12 * 3600  # Current Congress, quiet for longer than that
+
+    # Local SQLite database for queryable data (app/local_db), shared by workers
+    LOCAL_DB_PATH = None  # Defaults to CACHE_DIR/civictrack.sqlite3
+    LOCAL_DB_BUSY_TIMEOUT = 10.0  # Seconds to wait on another worker's write
+    MEMBER_MIRROR_TTL = 900  # Seconds before a mirrored roster is re-synced
+    MEMBER_SEARCH_REFRESH = 60  # Seconds between name index checks of the mirror
+    # Incremental bill sync (flask civictrack sync-bills); synced records are
+    # read before the cache while their Congress synced within the max age
+    BILL_SYNC_WORKERS = 4  # Concurrent detail fetches for changed bills
+    BILL_STORE_MAX_AGE = 2 * 86400  # Seconds; 0 serves synced records forever
 
     # API Key and Base URL
     CONGRESS_GOV_API_KEY = os.environ.get("CONGRESS_GOV_API_KEY")
     API_BASE_URL = "https://api.congress.gov/v3"
 
+    # Upstream HTTP client (one pooled keep-alive session per worker process)
+    API_POOL_SIZE = int(os.environ.get("API_POOL_SIZE", 20))
+    API_CONNECT_TIMEOUT = 3.05  # Seconds to establish the TCP/TLS connection
+    API_READ_TIMEOUT = 15  # Seconds to wait for the response body
+    API_MAX_RETRIES = 3  # Retries on connect errors, 429 and 5xx
+    API_RETRY_BACKOFF = 0.5  # Exponential backoff factor between retries
+    API_RETRY_JITTER = 0.5  # Random extra delay (0..N seconds) added per retry
+    API_RETRY_AFTER_CAP = 10  # Never honour a Retry-After longer than this
+
+    # Congress.gov quota (per API key, per hour), enforced with a token bucket
+    API_HOURLY_QUOTA = int(os.environ.get("API_HOURLY_QUOTA", 5000))
+    API_BACKGROUND_RESERVE = 0.2  # Share of the quota background work can't touch
+    API_RATE_LIMIT_MAX_WAIT = 5.0  # Seconds an interactive call may queue for a token
+
+    # Priority scheduler: concurrent upstream calls per worker (interactive first)
+    API_MAX_CONCURRENT = API_POOL_SIZE
+    API_SCHEDULER_MAX_WAIT = 30.0  # Seconds a call may wait for a slot
+
+    # Failure handling: total upstream budget per incoming request, and
+    # per-family (bill/member/committee/nomination) circuit breakers
+    REQUEST_DEADLINE = 25  # Seconds; keep below gunicorn's worker timeout
+    CIRCUIT_FAILURE_THRESHOLD = 5  # Consecutive failures before opening
+    CIRCUIT_RESET_TIMEOUT = 30.0  # Seconds open before a trial call
+
+    # Parallel enrichment of member sponsored/cosponsored items
+    ENRICHMENT_MAX_WORKERS = int(os.environ.get("ENRICHMENT_MAX_WORKERS", 8))
+    STREAM_FIRST_PAGE_SIZE = 20  # Small first page so NDJSON streams start fast
+
+    # Concurrent sub-resource loading on detail pages
+    SUB_RESOURCE_MAX_WORKERS = 6
+    DETAIL_FETCH_DEADLINE = 10  # Seconds for all sections of one detail page
+
+    # Concurrent page fetching for the member directory
+    MEMBER_PAGE_MAX_WORKERS = 6
+
+    # Bills, committees and nominations lists are cached as fixed upstream
+    # blocks (250 is the largest page Congress.gov serves); any offset/limit
+    # window is sliced from them. Closed Congresses use CACHE_TTL_CLOSED_CONGRESS
+    LIST_BLOCK_SIZE = 250
+    LIST_BLOCK_TTL = 1800
+
+    # In-memory Congress list used to validate ?congress= (app/congress_registry)
+    CONGRESS_REGISTRY_REFRESH = 6 * 3600  # Seconds between reloads; 0: load once
+    CONGRESS_REGISTRY_RETRY = 60  # Seconds between attempts until first loaded
+
     # --- Constants ---
     AMENDMENT_TYPES = {"samdt", "hamdt", "sa", "ha", "suamdt"}
     BILL_TYPES = {"hr", "s", "hres", "sres", "hjres", "sjres", "hconres", "sconres"}
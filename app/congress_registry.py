@@ -0,0 +1,186 @@
+# FILE: app/congress_registry.py
+import os
+import threading
+import time
+from collections import namedtuple
+from datetime import date
+from flask import current_app
+
+from .utils import background_priority
+
+# The list of Congresses changes once every two years, yet every list route
+# validates its ``congress`` argument against it. The registry keeps it in
+# process memory as an immutable snapshot that is replaced wholesale by a
+# background thread, so request handlers read it without locks or cache
+# round trips.
+
+_Snapshot = namedtuple("_Snapshot", "congresses numbers current loaded_at")
+_EMPTY = _Snapshot(congresses=(), numbers=frozenset(), current=None, loaded_at=None)
+
+_registry = None
+_registry_pid = None
+_registry_lock = threading.Lock()
+
+
+def _estimated_current_congress():
+    """Newest Congress by the calendar (Congresses start in odd years)."""
+    return (date.today().year - 1789) // 2 + 1
+
+
+def _as_congress_number(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class CongressRegistry:
+    """In-memory Congress list for one worker process, refreshed in the background."""
+
+    def __init__(self, app, refresh_interval, retry_interval, snapshot=_EMPTY):
+        self._app = app
+        self.refresh_interval = refresh_interval
+        self.retry_interval = retry_interval
+        self._snapshot = snapshot  # Replaced, never mutated
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def loaded(self):
+        return self._snapshot.loaded_at is not None
+
+    def congresses(self):
+        """Congresses newest first, as returned by get_congress_list."""
+        return list(self._snapshot.congresses)
+
+    def current_congress(self):
+        """Newest known Congress number (by the calendar until loaded)."""
+        return self._snapshot.current or _estimated_current_congress()
+
+    def is_valid_congress(self, value):
+        """True if ``value`` (int or digit string) names a known Congress.
+
+        Until the list has been loaded any Congress up to the current one by
+        the calendar is accepted, rather than rejecting every request.
+        """
+        number = _as_congress_number(value)
+        if number is None:
+            return False
+        snapshot = self._snapshot
+        if snapshot.loaded_at is None:
+            return 1 <= number <= _estimated_current_congress()
+        return number in snapshot.numbers
+
+    def refresh(self):
+        """Reloads the Congress list (needs an app context).
+
+        A failed load keeps the previous snapshot; returns True on success.
+        """
+        from .services import get_congress_list
+
+        with self._refresh_lock:
+            congresses = get_congress_list()
+            if not congresses:
+                current_app.logger.warning(
+                    "Congress registry: list unavailable; keeping "
+                    f"{len(self._snapshot.numbers)} known congresses."
+                )
+                return False
+            numbers = frozenset(c["number"] for c in congresses)
+            self._snapshot = _Snapshot(
+                congresses=tuple(congresses),
+                numbers=numbers,
+                current=max(numbers),
+                loaded_at=time.time(),
+            )
+            current_app.logger.info(
+                f"Congress registry: loaded {len(numbers)} congresses "
+                f"(current {max(numbers)})."
+            )
+            return True
+
+    def start(self):
+        """Starts the refresh thread, which also does the first load.
+
+        With refreshing disabled (interval 0) the thread exits once the
+        list has loaded.
+        """
+        if self._thread is not None or (self.loaded and not self.refresh_interval):
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="congress-registry", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        delay = self.refresh_interval if self.loaded else 0
+        while not self._stop.wait(delay):
+            try:
+                with self._app.app_context(), background_priority():
+                    self.refresh()
+            except Exception as e:
+                self._app.logger.exception(f"Congress registry refresh raised: {e}")
+            if self.loaded and not self.refresh_interval:
+                return
+            delay = self.refresh_interval if self.loaded else self.retry_interval
+
+    def snapshot(self):
+        snapshot = self._snapshot
+        return {
+            "loaded": snapshot.loaded_at is not None,
+            "loaded_at": snapshot.loaded_at,
+            "count": len(snapshot.numbers),
+            "current": self.current_congress(),
+            "refresh_interval": self.refresh_interval,
+            "pid": os.getpid(),
+        }
+
+
+def _build_registry(app, snapshot=_EMPTY):
+    config = app.config
+    return CongressRegistry(
+        app,
+        refresh_interval=config.get("CONGRESS_REGISTRY_REFRESH", 6 * 3600),
+        retry_interval=config.get("CONGRESS_REGISTRY_RETRY", 60),
+        snapshot=snapshot,
+    )
+
+
+def init_congress_registry(app):
+    """Creates the registry and starts its refresh thread.
+
+    The first load runs on that thread, not here: an upstream call at
+    startup would hold up every worker boot and CLI command. Until it
+    lands, validation falls back to the calendar.
+    """
+    global _registry, _registry_pid
+    registry = _build_registry(app)
+    with _registry_lock:
+        if _registry is not None and _registry_pid == os.getpid():
+            _registry.stop()
+        _registry, _registry_pid = registry, os.getpid()
+    registry.start()
+    return registry
+
+
+def get_congress_registry():
+    """Returns this worker process's registry.
+
+    A worker forked after startup inherits the parent's snapshot but not its
+    refresh thread, so it gets a registry of its own seeded with it.
+    """
+    global _registry, _registry_pid
+    pid = os.getpid()
+    if _registry is not None and _registry_pid == pid:
+        return _registry
+    with _registry_lock:
+        if _registry is None or _registry_pid != pid:
+            inherited = _registry._snapshot if _registry is not None else _EMPTY
+            _registry = _build_registry(current_app._get_current_object(), inherited)
+            _registry_pid = pid
+            _registry.start()
+    return _registry
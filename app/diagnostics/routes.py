@@ -0,0 +1,53 @@
+# FILE: app/diagnostics/routes.py
+from flask import Blueprint, jsonify
+from app.caching import memo_stats
+from app.circuit import breakers_snapshot
+from app.congress_registry import get_congress_registry
+from app.member_search import get_member_index
+from app.ratelimit import get_rate_limiter
+from app.scheduler import get_scheduler
+
+# Blueprint prefix '/api/diagnostics' is set during registration
+diagnostics_bp = Blueprint("diagnostics", __name__)
+
+
+@diagnostics_bp.route("/ratelimit")  # Accessible at /api/diagnostics/ratelimit
+def get_rate_limit_api():
+    """API: Reports this worker's view of the Congress.gov API quota."""
+    return jsonify({"rateLimit": get_rate_limiter().snapshot(), "error": None}), 200
+
+
+@diagnostics_bp.route("/scheduler")  # Accessible at /api/diagnostics/scheduler
+def get_scheduler_api():
+    """API: Reports upstream queue depth and wait times per priority class."""
+    return jsonify({"scheduler": get_scheduler().snapshot(), "error": None}), 200
+
+
+@diagnostics_bp.route("/circuits")  # Accessible at /api/diagnostics/circuits
+def get_circuits_api():
+    """API: Reports circuit breaker state per upstream endpoint family."""
+    return jsonify({"circuits": breakers_snapshot(), "error": None}), 200
+
+
+@diagnostics_bp.route("/cache")  # Accessible at /api/diagnostics/cache
+def get_cache_api():
+    """API: Reports memoize counts per service function and per-tier cache hits."""
+    return jsonify({"cache": memo_stats(), "error": None}), 200
+
+
+@diagnostics_bp.route("/congresses")  # Accessible at /api/diagnostics/congresses
+def get_congresses_api():
+    """API: Reports this worker's in-memory Congress registry."""
+    return (
+        jsonify({"congresses": get_congress_registry().snapshot(), "error": None}),
+        200,
+    )
+
+
+@diagnostics_bp.route("/member-search")  # Accessible at /api/diagnostics/member-search
+def get_member_search_api():
+    """API: Reports this worker's in-memory member name index."""
+    return (
+        jsonify({"memberSearch": get_member_index().snapshot(), "error": None}),
+        200,
+    )
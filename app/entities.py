@@ -0,0 +1,136 @@
+# FILE: app/entities.py
+import threading
+from flask import current_app
+
+from . import bill_search, bill_store, cache, cache_tags
+from .utils import _make_api_request
+
+# Normalized store of raw upstream records, shared by every service function
+# that needs a bill, amendment or nomination. Keys are (kind, congress, type,
+# number) regardless of which endpoint asked, so a detail page fill serves
+# later list enrichment and vice versa. Records carry the versions of their
+# congress and bill cache tags and are dropped once either is invalidated.
+# Bills kept current by the bill sync (bill_store) are read from it first.
+
+# kind -> (endpoint template, key of the record in the response)
+ENTITY_KINDS = {
+    "bill": ("/bill/{congress}/{type}/{number}", "bill"),
+    "amendment": ("/amendment/{congress}/{type}/{number}", "amendment"),
+    "nomination": ("/nomination/{congress}/{number}", "nomination"),
+}
+
+_stats = {"hit": 0, "synced_hit": 0, "miss": 0, "invalidated": 0}
+_stats_lock = threading.Lock()
+
+
+def _count(outcome, n=1):
+    with _stats_lock:
+        _stats[outcome] += n
+
+
+def entity_key(kind, congress, type_, number):
+    """Cache key for one entity; type is case-insensitive and may be None."""
+    return f"entity:{kind}:{congress}:{(type_ or '-').lower()}:{number}"
+
+
+def entity_tags(kind, congress, type_, number):
+    """Cache tags of an entity: its congress, plus its identity for bills."""
+    tags = [cache_tags.congress_tag(congress)]
+    if kind in ("bill", "amendment"):
+        tags.append(cache_tags.bill_tag(congress, type_, number))
+    return tags
+
+
+def _get_stored(key):
+    entry = cache.get(key)
+    if not isinstance(entry, dict) or "record" not in entry:
+        return None
+    if cache_tags.outdated(entry.get("tags")):
+        return None
+    return entry["record"]
+
+
+def get_entity(kind, congress, type_, number):
+    """Returns the stored raw record, or None."""
+    return _get_stored(entity_key(kind, congress, type_, number))
+
+
+def put_entity(kind, congress, type_, number, record, timeout=None, tag_snapshot=None):
+    """Stores a raw record unless a newer one (by updateDate) is already held."""
+    key = entity_key(kind, congress, type_, number)
+    current = _get_stored(key)
+    if current and str(current.get("updateDate") or "") > str(
+        record.get("updateDate") or ""
+    ):
+        return False
+    if tag_snapshot is None:
+        tag_snapshot = cache_tags.snapshot(entity_tags(kind, congress, type_, number))
+    return cache.set(key, {"record": record, "tags": tag_snapshot}, timeout=timeout)
+
+
+def fetch_entity(kind, congress, type_, number, timeout=None):
+    """Returns ``(record, error)`` from the store, fetching it on a miss.
+
+    ``timeout`` is the store TTL in seconds, or a callable computing it from
+    the fetched record.
+    """
+    if kind == "bill":
+        record = bill_store.get_stored_bill(congress, type_, number)
+        if record is not None:
+            _count("synced_hit")
+            return record, None
+    record = get_entity(kind, congress, type_, number)
+    if record is not None:
+        _count("hit")
+        return record, None
+    _count("miss")
+    tag_snapshot = cache_tags.snapshot(entity_tags(kind, congress, type_, number))
+    endpoint_template, record_key = ENTITY_KINDS[kind]
+    endpoint = endpoint_template.format(
+        congress=congress, type=(type_ or "").lower(), number=number
+    )
+    data, error = _make_api_request(endpoint)
+    if error:
+        return None, error
+    if not data or not isinstance(data.get(record_key), dict):
+        return None, None
+    record = data[record_key]
+    if kind == "bill":
+        bill_search.index_bills([record])
+    ttl = timeout(record) if callable(timeout) else timeout
+    put_entity(
+        kind, congress, type_, number, record, timeout=ttl, tag_snapshot=tag_snapshot
+    )
+    return record, None
+
+
+def observe_entity_summaries(kind, items):
+    """Drops stored records that list summaries show to be out of date.
+
+    List endpoints return summaries carrying ``updateDate``; a summary newer
+    than the stored record means the record changed upstream, so it is
+    evicted and refetched on next use.
+    """
+    if kind == "bill":
+        bill_store.discard_outdated(items)
+    stale_keys = []
+    for item in items or []:
+        if not isinstance(item, dict) or not item.get("updateDate"):
+            continue
+        key = entity_key(
+            kind, item.get("congress"), item.get("type"), item.get("number")
+        )
+        current = _get_stored(key)
+        if current and str(item["updateDate"]) > str(current.get("updateDate") or ""):
+            stale_keys.append(key)
+    if stale_keys:
+        cache.delete_many(*stale_keys)
+        _count("invalidated", len(stale_keys))
+        current_app.logger.info(f"Invalidated {len(stale_keys)} stale {kind} records.")
+    return len(stale_keys)
+
+
+def entity_stats():
+    """Returns this worker's entity store hit/miss/invalidation counters."""
+    with _stats_lock:
+        return dict(_stats)
@@ -0,0 +1,83 @@
+# FILE: app/local_db.py
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from flask import current_app
+
+# Local SQLite database for data the app keeps in queryable form (the member
+# mirror), as opposed to the opaque key/value cache. One file shared by all
+# workers in WAL mode; each thread of each process has its own connection.
+
+_databases = {}  # (pid, path) -> LocalDatabase
+_databases_lock = threading.Lock()
+
+
+class LocalDatabase:
+    """Per-thread connections to one SQLite file, plus schema setup."""
+
+    def __init__(self, path, busy_timeout=10.0):
+        self.path = path
+        self.busy_timeout = busy_timeout
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._local = threading.local()
+        self._schemas = set()
+        self._schema_lock = threading.Lock()
+
+    def connection(self):
+        """Returns this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path,
+                timeout=self.busy_timeout,
+                isolation_level=None,  # Autocommit; writes use transaction()
+                check_same_thread=False,
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def transaction(self):
+        """Runs the block in one write transaction, rolled back on error."""
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def ensure_schema(self, name, statements):
+        """Runs a feature's CREATE ... IF NOT EXISTS statements once per process."""
+        if name in self._schemas:
+            return
+        with self._schema_lock:
+            if name in self._schemas:
+                return
+            with self.transaction() as conn:
+                for statement in statements:
+                    conn.execute(statement)
+            self._schemas.add(name)
+
+
+def get_local_db():
+    """Returns this worker process's handle on the configured local database."""
+    config = current_app.config
+    path = config.get("LOCAL_DB_PATH") or os.path.join(
+        config.get("CACHE_DIR") or "flask_cache", "civictrack.sqlite3"
+    )
+    key = (os.getpid(), path)
+    db = _databases.get(key)
+    if db is not None:
+        return db
+    with _databases_lock:
+        if key not in _databases:
+            _databases[key] = LocalDatabase(
+                path, busy_timeout=config.get("LOCAL_DB_BUSY_TIMEOUT", 10.0)
+            )
+        return _databases[key]
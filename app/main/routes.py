@@ -1,19 +1,26 @@
 # FILE: app/main/routes.py
-from flask import Blueprint, jsonify, request, current_app, g  # Import g
-from app.services import get_congress_list, load_congress_members
+from flask import Blueprint, jsonify, request, current_app, url_for
+from app.congress_registry import get_congress_registry
+from app.member_mirror import SORT_KEYS
+from app.services import (
+    load_congress_members,
+    query_congress_members,
+    search_member_names,
+)
 
 main_bp = Blueprint("main", __name__)
 
-
-# Use before_request to load data into the 'g' object for the duration of the request
-@main_bp.before_request
-def load_congress_data_for_request():
-    """Load congress list into request context (g)."""
-    if "available_congresses" not in g:
-        g.available_congresses = get_congress_list() or []
-        g.default_congress = (
-            g.available_congresses[0]["number"] if g.available_congresses else 118
-        )
+# Any of these on /api/members returns one filtered page instead of the roster
+MEMBER_QUERY_PARAMS = (
+    "state",
+    "party_code",
+    "chamber",
+    "name",
+    "sort",
+    "order",
+    "offset",
+    "limit",
+)
 
 
 # --- MODIFIED: Root route now returns JSON ---
@@ -27,27 +34,10 @@ def api_root():
 @main_bp.route("/api/members")
 def get_members_list_data_api():
     """API endpoint to fetch member list based on filters."""
-    # Access data from g instead of module-level globals
-    available_congresses = g.get("available_congresses", [])
-    default_congress = g.get("default_congress", 118)
-
-    congress_filter = request.args.get("congress") or str(default_congress)
+    registry = get_congress_registry()
+    congress_filter = request.args.get("congress") or str(registry.current_congress())
     # --- Validation ---
-    valid_congress_numbers = [c.get("number") for c in available_congresses]
-    is_valid_request = False
-    try:
-        congress_num_int = int(congress_filter)
-        if congress_num_int in valid_congress_numbers:
-            is_valid_request = True
-        elif not available_congresses:  # Cannot validate if list failed loading
-            current_app.logger.warning(
-                f"Cannot validate congress '{congress_filter}' - list unavailable. Proceeding."
-            )
-            is_valid_request = True  # Allow request if validation isn't possible
-    except ValueError:
-        pass  # Handled below
-
-    if not is_valid_request:
+    if not registry.is_valid_congress(congress_filter):
         current_app.logger.warning(
             f"Invalid congress number/format: '{congress_filter}'. Returning 400."
         )
@@ -60,6 +50,9 @@ def get_members_list_data_api():
             400,
         )
 
+    if any(param in request.args for param in MEMBER_QUERY_PARAMS):
+        return _get_members_page(congress_filter)
+
     current_app.logger.info(
         f"API: Loading members list for congress: {congress_filter}"
     )
@@ -70,3 +63,79 @@ def get_members_list_data_api():
         return jsonify({"error": error_msg}), 503
     # Return empty list if 0 members found (members_dict == {})
     return jsonify(list(members_dict.values()) if members_dict else []), 200
+
+
+@main_bp.route("/api/members/search")
+def search_members_api():
+    """API endpoint for typo-tolerant name search across all Congresses."""
+    query = request.args.get("q", default="", type=str).strip()
+    limit = request.args.get("limit", default=20, type=int)
+
+    # Validation
+    if len(query) < 2:
+        return (
+            jsonify(
+                {"error": "Search query (q) needs 2 or more characters.", "members": []}
+            ),
+            400,
+        )
+    if limit > 100 or limit < 1:
+        limit = 20
+
+    result = search_member_names(query, limit=limit)  # Use service
+    if result.get("error"):
+        return jsonify(result), 503
+    return jsonify(result), 200
+
+
+def _filter_arg(name):
+    """A filter query parameter, or None when empty or "ALL"."""
+    value = (request.args.get(name) or "").strip()
+    return None if not value or value.upper() == "ALL" else value
+
+
+def _get_members_page(congress_filter):
+    """Server-side filtered, sorted and paginated slice of a member roster."""
+    sort = request.args.get("sort", default="name", type=str).lower()
+    if sort not in SORT_KEYS:
+        return (
+            jsonify(
+                {
+                    "error": f"Invalid sort '{sort}'. Use one of: {', '.join(SORT_KEYS)}.",
+                    "members": [],
+                    "pagination": None,
+                }
+            ),
+            400,
+        )
+    descending = request.args.get("order", default="asc", type=str).lower() == "desc"
+    offset = request.args.get("offset", default=0, type=int)
+    limit = request.args.get("limit", default=50, type=int)
+    if limit > 250 or limit < 1:
+        limit = 50
+    if offset < 0:
+        offset = 0
+
+    current_app.logger.info(
+        f"API: Querying members: C={congress_filter}, args={request.args.to_dict()}"
+    )
+    members, total, error = query_congress_members(
+        congress_filter,
+        state=_filter_arg("state"),
+        party_code=_filter_arg("party_code"),
+        chamber=_filter_arg("chamber"),
+        name_prefix=_filter_arg("name"),
+        sort=sort,
+        descending=descending,
+        offset=offset,
+        limit=limit,
+    )
+    if error:
+        return jsonify({"error": error, "members": [], "pagination": None}), 503
+
+    pagination = {"count": total}
+    if offset + limit < total:
+        next_args = request.args.to_dict()
+        next_args.update(offset=offset + limit, limit=limit)
+        pagination["next"] = url_for(request.endpoint, **next_args)
+    return jsonify({"members": members, "pagination": pagination, "error": None}), 200
@@ -0,0 +1,172 @@
+# FILE: app/member_mirror.py
+import json
+import time
+
+from .local_db import get_local_db
+
+# Member rosters as returned by load_congress_members, mirrored into indexed
+# SQLite tables so /api/members can filter, sort and page server-side instead
+# of shipping a whole Congress to the browser. A roster is one Congress's
+# members, or the all-Congress directory (ALL_CONGRESSES); it is replaced as
+# a whole whenever it is re-synced.
+
+ALL_CONGRESSES = 0
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS members ("
+    " roster INTEGER NOT NULL,"
+    " bioguide_id TEXT NOT NULL,"
+    " name TEXT,"
+    " name_key TEXT NOT NULL,"  # Lower-cased name, for prefix range scans
+    " state TEXT COLLATE NOCASE,"
+    " party TEXT,"
+    " party_code TEXT COLLATE NOCASE,"
+    " chamber TEXT COLLATE NOCASE,"
+    " congress INTEGER,"
+    " PRIMARY KEY (roster, bioguide_id)"
+    ")",
+    "CREATE INDEX IF NOT EXISTS members_name"
+    " ON members (roster, name_key, bioguide_id)",
+    "CREATE INDEX IF NOT EXISTS members_state"
+    " ON members (roster, state, name_key, bioguide_id)",
+    "CREATE INDEX IF NOT EXISTS members_party"
+    " ON members (roster, party_code, name_key, bioguide_id)",
+    "CREATE INDEX IF NOT EXISTS members_chamber"
+    " ON members (roster, chamber, name_key, bioguide_id)",
+    "CREATE TABLE IF NOT EXISTS member_rosters ("
+    " roster INTEGER PRIMARY KEY,"
+    " synced_at REAL NOT NULL,"
+    " member_count INTEGER NOT NULL,"
+    " tags TEXT"  # JSON cache tag snapshot taken before the roster was loaded
+    ")",
+)
+
+# ?sort= value -> ORDER BY columns; ties break on name, then id, so pages are stable
+SORT_KEYS = {
+    "name": ("name_key", "bioguide_id"),
+    "state": ("state", "name_key", "bioguide_id"),
+    "party": ("party_code", "name_key", "bioguide_id"),
+    "chamber": ("chamber", "name_key", "bioguide_id"),
+}
+
+_COLUMNS = (
+    "bioguide_id",
+    "name",
+    "state",
+    "party",
+    "party_code",
+    "chamber",
+    "congress",
+)
+
+
+def _db():
+    db = get_local_db()
+    db.ensure_schema("members", _SCHEMA)
+    return db
+
+
+def roster_state(roster):
+    """Returns ``(synced_at, tag snapshot)`` for a mirrored roster, or None."""
+    row = (
+        _db()
+        .connection()
+        .execute(
+            "SELECT synced_at, tags FROM member_rosters WHERE roster = ?", (roster,)
+        )
+        .fetchone()
+    )
+    if row is None:
+        return None
+    return row["synced_at"], json.loads(row["tags"] or "{}")
+
+
+def sync_roster(roster, members, tag_snapshot=None):
+    """Replaces a roster with ``members`` (load_congress_members' dict)."""
+    rows = [
+        (
+            roster,
+            bioguide_id,
+            member.get("name"),
+            (member.get("name") or "").lower(),
+            member.get("state"),
+            member.get("party"),
+            member.get("party_code"),
+            member.get("chamber"),
+            member.get("congress"),
+        )
+        for bioguide_id, member in members.items()
+    ]
+    with _db().transaction() as conn:
+        conn.execute("DELETE FROM members WHERE roster = ?", (roster,))
+        conn.executemany(
+            "INSERT INTO members (roster, bioguide_id, name, name_key, state,"
+            " party, party_code, chamber, congress)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO member_rosters"
+            " (roster, synced_at, member_count, tags) VALUES (?, ?, ?, ?)",
+            (roster, time.time(), len(rows), json.dumps(tag_snapshot or {})),
+        )
+    return len(rows)
+
+
+def query_roster(
+    roster,
+    state=None,
+    party_code=None,
+    chamber=None,
+    name_prefix=None,
+    sort="name",
+    descending=False,
+    offset=0,
+    limit=50,
+):
+    """Returns ``(members, total)`` for one page of a filtered roster.
+
+    Filters are case-insensitive; ``name_prefix`` matches the start of the
+    name as listed ("Last, First").
+    """
+    where, params = ["roster = ?"], [roster]
+    for column, value in (
+        ("state", state),
+        ("party_code", party_code),
+        ("chamber", chamber),
+    ):
+        if value:
+            where.append(f"{column} = ?")
+            params.append(value)
+    if name_prefix:
+        prefix = name_prefix.lower()
+        where.append("name_key >= ? AND name_key < ?")
+        params.extend((prefix, prefix + "\uffff"))
+    where_sql = " AND ".join(where)
+    direction = " DESC" if descending else ""
+    order_sql = ", ".join(f"{column}{direction}" for column in SORT_KEYS[sort])
+    conn = _db().connection()
+    total = conn.execute(
+        f"SELECT COUNT(*) FROM members WHERE {where_sql}", params
+    ).fetchone()[0]
+    rows = conn.execute(
+        f"SELECT {', '.join(_COLUMNS)} FROM members WHERE {where_sql}"
+        f" ORDER BY {order_sql} LIMIT ? OFFSET ?",
+        params + [limit, offset],
+    ).fetchall()
+    return [dict(row) for row in rows], total
+
+
+def roster_members(roster):
+    """Returns every member of a mirrored roster, in name order."""
+    rows = (
+        _db()
+        .connection()
+        .execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM members WHERE roster = ?"
+            " ORDER BY name_key, bioguide_id",
+            (roster,),
+        )
+        .fetchall()
+    )
+    return [dict(row) for row in rows]
@@ -0,0 +1,259 @@
+# FILE: app/member_search.py
+import math
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import namedtuple
+
+# Typo-tolerant member name search over the all-Congress directory. Each
+# worker keeps an in-memory trigram index built from the member mirror's
+# directory roster, so a lookup does no I/O. Postings are bitsets (Python
+# ints, bit n = member n); a search adds up its trigrams' bitsets with a
+# bit-sliced counter and reads matches off the resulting "shares k trigrams"
+# masks, best first, in a few dozen big-int operations whatever the number
+# of matches. Like the Congress registry, the index is an immutable snapshot
+# that updates replace wholesale, so searches read it without locks.
+
+MIN_SIMILARITY = 0.35  # Share of the query's trigrams a name must contain
+REBUILD_SHARE = 0.25  # Renumber everything once this share of members changed
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+# docs[n] is member n (None once removed); ids maps bioguide_id -> n
+_Snapshot = namedtuple("_Snapshot", "docs ids postings universe appended version")
+_EMPTY = _Snapshot(docs=(), ids={}, postings={}, universe=0, appended=0, version=None)
+_Doc = namedtuple("_Doc", "member grams")
+
+_index = None
+_index_pid = None
+_index_lock = threading.Lock()
+
+
+def _words(text):
+    """Lower-cased words of ``text`` with accents stripped ("Velázquez" -> velazquez)."""
+    decomposed = unicodedata.normalize("NFKD", str(text or "").lower())
+    return _WORD_RE.findall(
+        "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    )
+
+
+def trigrams(text, prefix=False):
+    """Trigrams of each word padded as "  word ", as pg_trgm pads them.
+
+    With ``prefix`` the last word gets no end padding, so a partly typed
+    word matches names that continue it (search-as-you-type).
+    """
+    words = _words(text)
+    grams = set()
+    for i, word in enumerate(words):
+        padded = f"  {word}" if prefix and i == len(words) - 1 else f"  {word} "
+        grams.update(padded[j : j + 3] for j in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+def _new_doc(member):
+    return _Doc(member, trigrams(member.get("name")))
+
+
+def _tie_order(doc):
+    """Among equal scores, names with fewer extra trigrams (closer matches) first."""
+    name = (doc.member.get("name") or "").lower()
+    return len(doc.grams), name, doc.member["bioguide_id"]
+
+
+def _build(members, version):
+    """A snapshot of ``members`` numbered in tie-break order."""
+    docs = sorted(map(_new_doc, members), key=_tie_order)
+    numbers = {}  # trigram -> member numbers
+    for n, doc in enumerate(docs):
+        for gram in doc.grams:
+            numbers.setdefault(gram, []).append(n)
+    postings = {}
+    for gram, members_with_gram in numbers.items():
+        bits = bytearray((len(docs) + 7) // 8)
+        for n in members_with_gram:
+            bits[n >> 3] |= 1 << (n & 7)
+        postings[gram] = int.from_bytes(bits, "little")
+    return _Snapshot(
+        docs=tuple(docs),
+        ids={doc.member["bioguide_id"]: n for n, doc in enumerate(docs)},
+        postings=postings,
+        universe=(1 << len(docs)) - 1,
+        appended=0,
+        version=version,
+    )
+
+
+def _patch(current, removed, added, changed, version):
+    """A copy of ``current`` with members removed, added and changed.
+
+    Renamed members are re-added under a new number; other changes only
+    replace the stored row.
+    """
+    docs, ids, postings = list(current.docs), dict(current.ids), dict(current.postings)
+    appended = current.appended
+
+    def clear(n):
+        bit = 1 << n
+        for gram in docs[n].grams:
+            remaining = postings[gram] & ~bit
+            if remaining:
+                postings[gram] = remaining
+            else:
+                del postings[gram]
+        docs[n] = None
+
+    def append(doc):
+        n = len(docs)
+        docs.append(doc)
+        ids[doc.member["bioguide_id"]] = n
+        for gram in doc.grams:
+            postings[gram] = postings.get(gram, 0) | (1 << n)
+
+    for bioguide_id in removed:
+        clear(ids.pop(bioguide_id))
+    for n, member in changed:
+        if docs[n].member.get("name") == member.get("name"):
+            docs[n] = docs[n]._replace(member=member)
+        else:
+            clear(n)
+            append(_new_doc(member))
+            appended += 1
+    for member in added:
+        append(_new_doc(member))
+        appended += 1
+    return _Snapshot(
+        docs=tuple(docs),
+        ids=ids,
+        postings=postings,
+        universe=(1 << len(docs)) - 1,
+        appended=appended,
+        version=version,
+    )
+
+
+class MemberNameIndex:
+    """Trigram index over member names for one worker process."""
+
+    def __init__(self):
+        self._snapshot = _EMPTY
+        self._checked_at = 0.0
+        self._lock = threading.Lock()  # One update at a time; searches never wait
+        self._claim_lock = threading.Lock()
+
+    @property
+    def version(self):
+        """synced_at of the mirrored roster last applied; None until first built."""
+        return self._snapshot.version
+
+    def claim_refresh(self, interval):
+        """True for one caller once ``interval`` seconds passed since the last check."""
+        with self._claim_lock:
+            now = time.monotonic()
+            if now - self._checked_at < interval:
+                return False
+            self._checked_at = now
+            return True
+
+    # --- Updates ---
+    def update(self, members, version=None):
+        """Brings the index in line with ``members`` (member_mirror rows).
+
+        Only members that were added, removed or changed are touched. New
+        and renamed members are numbered after the rest, so they lose score
+        ties until enough has changed (REBUILD_SHARE) to renumber everything.
+        Returns counts.
+        """
+        incoming = {m["bioguide_id"]: m for m in members if m.get("bioguide_id")}
+        with self._lock:
+            current = self._snapshot
+            removed = [b for b in current.ids if b not in incoming]
+            added, changed = [], []
+            for bioguide_id, member in incoming.items():
+                n = current.ids.get(bioguide_id)
+                if n is None:
+                    added.append(member)
+                elif current.docs[n].member != member:
+                    changed.append((n, member))
+            renamed = sum(
+                current.docs[n].member.get("name") != member.get("name")
+                for n, member in changed
+            )
+            churn = current.appended + len(added) + len(removed) + renamed
+            rebuilt = not current.docs or churn > REBUILD_SHARE * len(incoming)
+            if not (rebuilt or removed or added or changed):
+                self._snapshot = current._replace(version=version)
+            elif rebuilt:
+                self._snapshot = _build(incoming.values(), version)
+            else:
+                self._snapshot = _patch(current, removed, added, changed, version)
+            self._checked_at = time.monotonic()
+        return {
+            "added": len(added),
+            "removed": len(removed),
+            "changed": len(changed),
+            "members": len(incoming),
+            "rebuilt": rebuilt,
+        }
+
+    # --- Queries ---
+    def search(self, query, limit=20):
+        """Returns up to ``limit`` members, best match first, each with a ``score``.
+
+        The score is the share of the query's trigrams found in the name
+        (1.0 when every one is); names need MIN_SIMILARITY to match.
+        """
+        snapshot = self._snapshot
+        grams = trigrams(query, prefix=True)
+        if not grams or not snapshot.docs:
+            return []
+        # planes[i] holds bit i of every member's count of shared trigrams
+        planes = []
+        for gram in grams:
+            carry = snapshot.postings.get(gram, 0)
+            for i, plane in enumerate(planes):
+                if not carry:
+                    break
+                planes[i], carry = plane ^ carry, plane & carry
+            if carry:
+                planes.append(carry)
+        needed = max(1, math.ceil(MIN_SIMILARITY * len(grams)))
+        most = min(len(grams), (1 << len(planes)) - 1)
+        results = []
+        for shared in range(most, needed - 1, -1):
+            matches = snapshot.universe
+            for i, plane in enumerate(planes):
+                matches &= plane if shared >> i & 1 else ~plane
+            while matches and len(results) < limit:
+                lowest = matches & -matches  # Lowest number first: the tie order
+                matches ^= lowest
+                result = dict(snapshot.docs[lowest.bit_length() - 1].member)
+                result["score"] = round(shared / len(grams), 3)
+                results.append(result)
+            if len(results) >= limit:
+                break
+        return results
+
+    def snapshot(self):
+        snapshot = self._snapshot
+        return {
+            "members": len(snapshot.ids),
+            "trigrams": len(snapshot.postings),
+            "appended": snapshot.appended,
+            "version": snapshot.version,
+            "pid": os.getpid(),
+        }
+
+
+def get_member_index():
+    """Returns this worker process's member name index (empty until first built)."""
+    global _index, _index_pid
+    pid = os.getpid()
+    if _index is not None and _index_pid == pid:
+        return _index
+    with _index_lock:
+        if _index is None or _index_pid != pid:
+            _index, _index_pid = MemberNameIndex(), pid
+    return _index
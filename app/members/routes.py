@@ -1,14 +1,30 @@
 # FILE: app/members/routes.py
-from flask import Blueprint, jsonify, request, current_app
+import json
+from flask import (
+    Blueprint,
+    Response,
+    jsonify,
+    request,
+    current_app,
+    stream_with_context,
+)
 from app.services import (
+    FETCH_ALL_LIMIT,
+    iter_member_legislation,
     get_member_details,
     get_detailed_sponsored_legislation,
     get_detailed_cosponsored_legislation,
+    get_sponsored_legislation_lite,
+    get_cosponsored_legislation_lite,
+    get_legislation_counts,
 )
+from app.utils import _decode_cursor, _encode_cursor, set_request_deadline
 
 # Blueprint prefix '/api/member' is set during registration in app/__init__.py
 members_bp = Blueprint("members", __name__)
 
+LEGISLATION_MODES = {"full", "lite"}
+
 # --- API Routes specific to a Member ID ---
 
 
@@ -34,44 +50,186 @@ def get_member_details_api(bioguide_id):
     return jsonify(details_data), status
 
 
+def _parse_legislation_args():
+    """Parses mode/cursor/limit query args; returns (mode, offset, limit, error)."""
+    mode = request.args.get("mode", "full").lower()
+    if mode not in LEGISLATION_MODES:
+        return None, None, None, f"Invalid mode: {mode}."
+    offset = 0
+    cursor = request.args.get("cursor")
+    if cursor:
+        offset = _decode_cursor(cursor)
+        if offset is None:
+            return None, None, None, "Invalid cursor."
+    limit = request.args.get("limit", default=FETCH_ALL_LIMIT, type=int)
+    if limit > FETCH_ALL_LIMIT or limit < 1:
+        limit = FETCH_ALL_LIMIT
+    return mode, offset, limit, None
+
+
+def _with_next_cursor(page_data):
+    """Swaps the service's raw next_offset for an opaque next_cursor."""
+    payload = dict(page_data)
+    next_offset = payload.pop("next_offset", None)
+    payload["next_cursor"] = (
+        _encode_cursor(next_offset) if next_offset is not None else None
+    )
+    return payload
+
+
+def _stream_legislation(bioguide_id, kind):
+    """Returns an NDJSON response streaming a member's whole legislation list."""
+    mode, offset, _, error = _parse_legislation_args()
+    if error:
+        return jsonify({"error": error}), 400
+
+    def generate():
+        # A full stream outlives REQUEST_DEADLINE by design; each upstream call
+        # is still bounded by its own timeout and the circuit breakers.
+        set_request_deadline(None)
+        for event in iter_member_legislation(
+            bioguide_id, kind, lite=(mode == "lite"), offset=offset
+        ):
+            if event["type"] == "end":
+                next_offset = event.pop("next_offset")
+                event["next_cursor"] = (
+                    _encode_cursor(next_offset) if next_offset is not None else None
+                )
+            yield json.dumps(event) + "\n"
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="application/x-ndjson",
+        headers={"X-Accel-Buffering": "no"},  # Don't let proxies hold back lines
+    )
+
+
 @members_bp.route("/<bioguide_id>/sponsored")
 def get_member_sponsored_api(bioguide_id):
-    """API: Fetches a large batch of sponsored legislation for a member."""
+    """API: Fetches one page (up to 250 items) of sponsored legislation for a member.
+
+    Follow ``next_cursor`` via ``?cursor=`` to walk the member's full list.
+    """
     if not bioguide_id or len(bioguide_id) != 7:
         return (
             jsonify({"error": "Invalid Bioguide ID format.", "items": [], "count": 0}),
             400,
         )
 
-    current_app.logger.info(f"API: Fetching sponsored for {bioguide_id} (large batch)")
-    # --- FIX: Call service without limit/offset ---
-    sponsored_data = get_detailed_sponsored_legislation(bioguide_id)
+    mode, offset, limit, error = _parse_legislation_args()
+    if error:
+        return jsonify({"error": error, "items": [], "count": 0}), 400
+
+    current_app.logger.info(
+        f"API: Fetching sponsored for {bioguide_id} (offset {offset}, {mode})"
+    )
+    if mode == "lite":
+        sponsored_data = get_sponsored_legislation_lite(bioguide_id, offset, limit)
+    else:
+        sponsored_data = get_detailed_sponsored_legislation(bioguide_id, offset, limit)
 
     status = 200
     if sponsored_data.get("error"):
         status = 500  # ... (error status handling) ...
-    return jsonify(sponsored_data), status  # Returns {items, count, error}
+    # Returns {items, count, next_cursor, error}
+    return jsonify(_with_next_cursor(sponsored_data)), status
 
 
 @members_bp.route("/<bioguide_id>/cosponsored")
 def get_member_cosponsored_api(bioguide_id):
-    """API: Fetches a large batch of cosponsored legislation for a member."""
+    """API: Fetches one page (up to 250 items) of cosponsored legislation for a member.
+
+    Follow ``next_cursor`` via ``?cursor=`` to walk the member's full list.
+    """
     if not bioguide_id or len(bioguide_id) != 7:
         return (
             jsonify({"error": "Invalid Bioguide ID format.", "items": [], "count": 0}),
             400,
         )
 
+    mode, offset, limit, error = _parse_legislation_args()
+    if error:
+        return jsonify({"error": error, "items": [], "count": 0}), 400
+
     current_app.logger.info(
-        f"API: Fetching cosponsored for {bioguide_id} (large batch)"
+        f"API: Fetching cosponsored for {bioguide_id} (offset {offset}, {mode})"
     )
-    # --- FIX: Call service without limit/offset ---
-    cosponsored_data = get_detailed_cosponsored_legislation(bioguide_id)
+    if mode == "lite":
+        cosponsored_data = get_cosponsored_legislation_lite(bioguide_id, offset, limit)
+    else:
+        cosponsored_data = get_detailed_cosponsored_legislation(
+            bioguide_id, offset, limit
+        )
 
     status = 200
     if cosponsored_data.get("error"):
         status = 500  # ... (error status handling) ...
-    return jsonify(cosponsored_data), status
+    return jsonify(_with_next_cursor(cosponsored_data)), status
+
+
+@members_bp.route("/<bioguide_id>/sponsored/stream")
+def stream_member_sponsored_api(bioguide_id):
+    """API: Streams all sponsored legislation for a member as NDJSON."""
+    if not bioguide_id or len(bioguide_id) != 7:
+        return jsonify({"error": "Invalid Bioguide ID format."}), 400
+    current_app.logger.info(f"API: Streaming sponsored for {bioguide_id}")
+    return _stream_legislation(bioguide_id, "sponsored")
+
+
+@members_bp.route("/<bioguide_id>/cosponsored/stream")
+def stream_member_cosponsored_api(bioguide_id):
+    """API: Streams all cosponsored legislation for a member as NDJSON."""
+    if not bioguide_id or len(bioguide_id) != 7:
+        return jsonify({"error": "Invalid Bioguide ID format."}), 400
+    current_app.logger.info(f"API: Streaming cosponsored for {bioguide_id}")
+    return _stream_legislation(bioguide_id, "cosponsored")
+
+
+@members_bp.route("/legislation/counts", methods=["POST"])
+def get_legislation_counts_api():
+    """API: Returns cosponsor/action counts for items listed in lite mode.
+
+    Expects a JSON body ``{"items": [{"congress", "type", "number", "item_type"}]}``.
+    """
+    body = request.get_json(silent=True) or {}
+    raw_items = body.get("items")
+    if not isinstance(raw_items, list):
+        return (
+            jsonify(
+                {"error": "Request body must contain an 'items' list.", "counts": []}
+            ),
+            400,
+        )
+    if len(raw_items) > FETCH_ALL_LIMIT:
+        return (
+            jsonify(
+                {
+                    "error": f"At most {FETCH_ALL_LIMIT} items per request.",
+                    "counts": [],
+                }
+            ),
+            400,
+        )
+
+    identities = []
+    for raw in raw_items:
+        if not isinstance(raw, dict):
+            continue
+        try:
+            identity = {
+                "congress": int(raw["congress"]),
+                "type": str(raw["type"]).upper(),
+                "number": int(raw["number"]),
+                "item_type": raw.get("item_type", "Bill"),
+            }
+        except (KeyError, TypeError, ValueError):
+            continue
+        if identity["item_type"] in ("Bill", "Amendment"):
+            identities.append(identity)
+
+    current_app.logger.info(f"API: Fetching counts for {len(identities)} items")
+    counts = [c for c in get_legislation_counts(identities) if c]
+    return jsonify({"counts": counts, "error": None}), 200
 
 
 @members_bp.route(
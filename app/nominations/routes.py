@@ -1,24 +1,11 @@
 # FILE: app/nominations/routes.py
 from flask import Blueprint, jsonify, request, current_app
-from app.services import get_congress_list, get_nominations_list, get_nomination_details
+from app.congress_registry import get_congress_registry
+from app.services import get_nominations_list, get_nomination_details
 
 # Blueprint prefix '/api' is set during registration
 nominations_bp = Blueprint("nominations", __name__)
 
-AVAILABLE_CONGRESSES = None
-DEFAULT_CONGRESS = None
-
-
-@nominations_bp.before_request
-def load_nomination_config_data():
-    global AVAILABLE_CONGRESSES, DEFAULT_CONGRESS
-    AVAILABLE_CONGRESSES = get_congress_list() or []
-    DEFAULT_CONGRESS = (
-        AVAILABLE_CONGRESSES[0]["number"] if AVAILABLE_CONGRESSES else 118
-    )
-    current_app.logger.info("Nomination Blueprint: Loaded Congress list and default.")
-
-
 # --- REMOVED Page Route: /nominations ---
 
 
@@ -26,15 +13,15 @@ def load_nomination_config_data():
 @nominations_bp.route("/nominations")  # Accessible at /api/nominations
 def get_nominations_list_api():
     """API endpoint to fetch list of nominations."""
-    global AVAILABLE_CONGRESSES  # Use loaded list
     congress = request.args.get("congress", default=None, type=str)
     offset = request.args.get("offset", default=0, type=int)
     limit = request.args.get("limit", default=25, type=int)
 
     # Validation
     if congress:
-        valid_congress_numbers = [c.get("number") for c in AVAILABLE_CONGRESSES]
-        if not congress.isdigit() or int(congress) not in valid_congress_numbers:
+        if not congress.isdigit() or not get_congress_registry().is_valid_congress(
+            congress
+        ):
             congress = None
     if limit > 100 or limit < 1:
         limit = 25
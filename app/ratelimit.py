@@ -0,0 +1,134 @@
+# FILE: app/ratelimit.py
+import os
+import threading
+import time
+from flask import current_app
+
+_limiter = None
+_limiter_pid = None
+_limiter_lock = threading.Lock()
+
+
+class TokenBucket:
+    """Token bucket sized to the Congress.gov hourly quota for one API key.
+
+    Tokens refill continuously at ``capacity / 3600`` per second. The quota is
+    shared by every worker using the key, so whenever a response carries the
+    upstream ``X-RateLimit-Remaining`` header the local bucket is clamped to
+    it; that keeps each worker honest about calls made by the others.
+
+    Background callers are shed once the bucket falls to the reserve kept for
+    interactive traffic; interactive callers wait (up to ``max_wait``) for a
+    token instead.
+    """
+
+    def __init__(self, capacity, background_reserve=0.2, max_wait=5.0):
+        self.capacity = float(capacity)
+        self.refill_per_second = self.capacity / 3600.0
+        self.background_reserve = background_reserve
+        self.max_wait = max_wait
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._cond = threading.Condition()
+        self.upstream_limit = None
+        self.upstream_remaining = None
+        self.upstream_seen_at = None
+        self.granted_total = 0
+        self.shed_total = 0
+        self.waited_total = 0
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.refill_per_second
+        )
+        self._updated = now
+
+    def acquire(self, background=False, max_wait=None):
+        """Takes one token; returns False if the call should not be made.
+
+        ``max_wait`` can only shorten the configured wait for interactive calls.
+        """
+        if max_wait is None or max_wait > self.max_wait:
+            max_wait = self.max_wait
+        with self._cond:
+            self._refill()
+            if background:
+                if self._tokens - 1 < self.capacity * self.background_reserve:
+                    self.shed_total += 1
+                    return False
+            elif self._tokens < 1:
+                self.waited_total += 1
+                deadline = time.monotonic() + max_wait
+                while self._tokens < 1:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.shed_total += 1
+                        return False
+                    needed = (1 - self._tokens) / self.refill_per_second
+                    self._cond.wait(min(remaining, needed))
+                    self._refill()
+            self._tokens -= 1
+            self.granted_total += 1
+            return True
+
+    def observe_response(self, headers, status_code):
+        """Syncs the bucket with the quota headers on an upstream response."""
+        limit = _int_header(headers, "X-RateLimit-Limit")
+        remaining = _int_header(headers, "X-RateLimit-Remaining")
+        with self._cond:
+            self._refill()
+            if limit:
+                self.upstream_limit = limit
+                if limit != self.capacity:
+                    self.capacity = float(limit)
+                    self.refill_per_second = self.capacity / 3600.0
+            if remaining is not None:
+                self.upstream_remaining = remaining
+                self.upstream_seen_at = time.time()
+                self._tokens = min(self._tokens, float(remaining))
+            if status_code == 429:
+                self._tokens = 0.0  # Upstream says we're out; stop until refill
+            self._cond.notify_all()
+
+    def snapshot(self):
+        with self._cond:
+            self._refill()
+            return {
+                "capacity": int(self.capacity),
+                "tokens": round(self._tokens, 2),
+                "refill_per_second": round(self.refill_per_second, 4),
+                "background_reserve": int(self.capacity * self.background_reserve),
+                "upstream_limit": self.upstream_limit,
+                "upstream_remaining": self.upstream_remaining,
+                "upstream_seen_at": self.upstream_seen_at,
+                "granted_total": self.granted_total,
+                "shed_total": self.shed_total,
+                "waited_total": self.waited_total,
+                "pid": os.getpid(),
+            }
+
+
+def _int_header(headers, name):
+    try:
+        return int(headers.get(name))
+    except (TypeError, ValueError):
+        return None
+
+
+def get_rate_limiter():
+    """Returns this worker process's token bucket, creating it on first use."""
+    global _limiter, _limiter_pid
+    pid = os.getpid()
+    if _limiter is not None and _limiter_pid == pid:
+        return _limiter
+    with _limiter_lock:
+        if _limiter is None or _limiter_pid != pid:
+            config = current_app.config
+            _limiter = TokenBucket(
+                capacity=config.get("API_HOURLY_QUOTA", 5000),
+                background_reserve=config.get("API_BACKGROUND_RESERVE", 0.2),
+                max_wait=config.get("API_RATE_LIMIT_MAX_WAIT", 5.0),
+            )
+            _limiter_pid = pid
+    return _limiter
@@ -0,0 +1,140 @@
+# FILE: app/scheduler.py
+import heapq
+import itertools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from flask import current_app
+
+PRIORITY_INTERACTIVE = "interactive"  # Work a user is waiting on
+PRIORITY_BACKGROUND = "background"  # Warming, refreshes, syncs
+
+# Lower rank is served first
+PRIORITY_RANKS = {PRIORITY_INTERACTIVE: 0, PRIORITY_BACKGROUND: 1}
+
+_scheduler = None
+_scheduler_pid = None
+_scheduler_lock = threading.Lock()
+
+
+class UpstreamScheduler:
+    """Admits at most ``max_concurrent`` upstream calls at a time, by priority.
+
+    Waiting callers are served strictly by priority class, then arrival order,
+    so an interactive request never waits behind queued background fetches.
+    Queue depth and wait times are tracked per class for diagnostics.
+    """
+
+    def __init__(self, max_concurrent, max_wait=30.0):
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_wait = max_wait
+        self._cond = threading.Condition()
+        self._active = 0
+        self._waiting = []  # heap of (rank, seq)
+        self._seq = itertools.count()
+        self._stats = {
+            name: {
+                "queued": 0,
+                "max_queued": 0,
+                "admitted": 0,
+                "rejected": 0,
+                "waited": 0,
+                "wait_seconds_total": 0.0,
+                "wait_seconds_max": 0.0,
+            }
+            for name in PRIORITY_RANKS
+        }
+
+    def acquire(self, priority, max_wait=None):
+        """Blocks until a slot is free for this caller; False on timeout.
+
+        ``max_wait`` can only shorten the configured wait (e.g. to fit a
+        request deadline), never extend it.
+        """
+        priority = priority if priority in PRIORITY_RANKS else PRIORITY_INTERACTIVE
+        stats = self._stats[priority]
+        started = time.monotonic()
+        if max_wait is None or max_wait > self.max_wait:
+            max_wait = self.max_wait
+        with self._cond:
+            ticket = (PRIORITY_RANKS[priority], next(self._seq))
+            heapq.heappush(self._waiting, ticket)
+            stats["queued"] += 1
+            stats["max_queued"] = max(stats["max_queued"], stats["queued"])
+            try:
+                deadline = started + max_wait
+                while self._active >= self.max_concurrent or self._waiting[0] != ticket:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._waiting.remove(ticket)
+                        heapq.heapify(self._waiting)
+                        stats["rejected"] += 1
+                        self._cond.notify_all()
+                        return False
+                    self._cond.wait(remaining)
+                heapq.heappop(self._waiting)
+                self._active += 1
+            finally:
+                stats["queued"] -= 1
+            waited = time.monotonic() - started
+            stats["admitted"] += 1
+            if waited > 0.001:
+                stats["waited"] += 1
+            stats["wait_seconds_total"] += waited
+            stats["wait_seconds_max"] = max(stats["wait_seconds_max"], waited)
+            self._cond.notify_all()  # The next ticket may now be at the head
+            return True
+
+    def release(self):
+        with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, priority, max_wait=None):
+        """Context manager form of acquire/release; yields whether admitted."""
+        admitted = self.acquire(priority, max_wait=max_wait)
+        try:
+            yield admitted
+        finally:
+            if admitted:
+                self.release()
+
+    def snapshot(self):
+        with self._cond:
+            classes = {}
+            for name, stats in self._stats.items():
+                entry = dict(stats)
+                entry["wait_seconds_avg"] = (
+                    stats["wait_seconds_total"] / stats["admitted"]
+                    if stats["admitted"]
+                    else 0.0
+                )
+                classes[name] = entry
+            return {
+                "max_concurrent": self.max_concurrent,
+                "active": self._active,
+                "queue_depth": len(self._waiting),
+                "classes": classes,
+                "pid": os.getpid(),
+            }
+
+
+def get_scheduler():
+    """Returns this worker process's upstream scheduler, creating it on first use."""
+    global _scheduler, _scheduler_pid
+    pid = os.getpid()
+    if _scheduler is not None and _scheduler_pid == pid:
+        return _scheduler
+    with _scheduler_lock:
+        if _scheduler is None or _scheduler_pid != pid:
+            config = current_app.config
+            _scheduler = UpstreamScheduler(
+                max_concurrent=config.get(
+                    "API_MAX_CONCURRENT", config.get("API_POOL_SIZE", 20)
+                ),
+                max_wait=config.get("API_SCHEDULER_MAX_WAIT", 30.0),
+            )
+            _scheduler_pid = pid
+    return _scheduler
@@ -0,0 +1,48 @@
+# FILE: app/search/routes.py
+from flask import Blueprint, jsonify, request, current_app, url_for
+from app.congress_registry import get_congress_registry
+from app.services import search_bill_index
+
+# Blueprint prefix '/api/search' is set during registration
+search_bp = Blueprint("search", __name__)
+
+
+@search_bp.route("/bills")  # Accessible at /api/search/bills
+def search_bills_api():
+    """API endpoint for ranked full-text search over bill titles and summaries."""
+    query = request.args.get("q", default="", type=str).strip()
+    congress = request.args.get("congress", default=None, type=str)
+    bill_type = request.args.get("billType", default=None, type=str)
+    offset = request.args.get("offset", default=0, type=int)
+    limit = request.args.get("limit", default=20, type=int)
+
+    # Validation
+    if not query:
+        return jsonify({"error": "Missing search query (q).", "results": []}), 400
+    if congress and (
+        not congress.isdigit()
+        or not get_congress_registry().is_valid_congress(congress)
+    ):
+        return jsonify({"error": f"Invalid congress: {congress}", "results": []}), 400
+    if bill_type and bill_type.lower() not in current_app.config["BILL_TYPES"]:
+        return jsonify({"error": f"Invalid bill type: {bill_type}", "results": []}), 400
+    if limit > 100 or limit < 1:
+        limit = 20
+    if offset < 0:
+        offset = 0
+
+    result = search_bill_index(
+        query, congress=congress, bill_type=bill_type, offset=offset, limit=limit
+    )  # Use service
+    if result.get("error"):
+        result["pagination"] = None
+        del result["total"]
+        return jsonify(result), 503
+
+    pagination = {"count": result.pop("total")}
+    if offset + limit < pagination["count"]:
+        next_args = request.args.to_dict()
+        next_args.update(offset=offset + limit, limit=limit)
+        pagination["next"] = url_for(request.endpoint, **next_args)
+    result["pagination"] = pagination
+    return jsonify(result), 200
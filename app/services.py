@@ -1,12 +1,28 @@
 # FILE: app/services.py
+import re
+import sqlite3
+import time
+from datetime import date
+from functools import partial
 from flask import current_app
 from urllib.parse import urlparse
 
 # Import shared components
-from . import cache
-from .utils import _make_api_request
+from . import bill_search, bill_store, cache_tags, member_mirror
+from .cache_tags import bill_tag, congress_tag, member_tag
+from .caching import RESULT_TRANSIENT, classify_result, memoize, submit_background
+from .congress_registry import get_congress_registry
+from .entities import fetch_entity, observe_entity_summaries
+from .member_search import get_member_index
+from .utils import (
+    _fetch_sections,
+    _iter_concurrently,
+    _make_api_request,
+    _run_concurrently,
+)
 
 FETCH_ALL_LIMIT = 250
+MEMBER_PAGE_SIZE = 250  # Largest page the /member endpoints allow
 
 
 # --- Helper to fetch sub-resources ---
@@ -106,8 +122,133 @@ def _fetch_sub_resource(base_item, resource_key, api_path_segment_base, limit=20
         return None
 
 
+def _fetch_sub_resources(base_item, api_path_segment_base, limits):
+    """Fetches several sub-resources of one item concurrently.
+
+    ``limits`` maps each resource key to its fetch limit. Returns
+    ``(lists, section_errors)`` where ``lists`` holds whatever arrived before the
+    detail deadline and ``section_errors`` flags sections that timed out or failed.
+    """
+    tasks = {
+        key: partial(
+            _fetch_sub_resource, base_item, key, api_path_segment_base, limit=limit
+        )
+        for key, limit in limits.items()
+    }
+    lists, section_errors = _fetch_sections(tasks)
+    for key, value in lists.items():
+        resource_info = base_item.get(key)
+        # None with a URL present means the fetch itself failed
+        if (
+            value is None
+            and isinstance(resource_info, dict)
+            and resource_info.get("url")
+        ):
+            section_errors[key] = "error"
+    return lists, section_errors
+
+
+def _is_complete_package(package):
+    """Response filter: only cache packages with every section and item loaded."""
+    return not (
+        isinstance(package, dict)
+        and (package.get("sectionErrors") or package.get("itemErrors"))
+    )
+
+
+# --- Adaptive cache TTLs ---
+def _adaptive_ttl(congress, latest_action_date):
+    """Cache TTL for an entity from its Congress and its latest action date.
+
+    Returns None (the default TTL) when the Congress is unknown.
+    """
+    config = current_app.config
+    try:
+        congress = int(congress)
+    except (TypeError, ValueError):
+        return None
+    current = get_congress_registry().current_congress()
+    if current and congress < current:
+        return config.get("CACHE_TTL_CLOSED_CONGRESS", 21 * 86400)
+    try:
+        action_date = date.fromisoformat(str(latest_action_date)[:10])
+    except ValueError:
+        return config.get("CACHE_TTL_WARM", 7200)
+    days_quiet = (date.today() - action_date).days
+    if days_quiet <= config.get("CACHE_TTL_HOT_DAYS", 3):
+        return config.get("CACHE_TTL_HOT", 600)
+    if days_quiet <= config.get("CACHE_TTL_WARM_DAYS", 30):
+        return config.get("CACHE_TTL_WARM", 7200)
+    return config.get("CACHE_TTL_COLD", 43200)
+
+
+def _list_item_ttl(details):
+    """memoize timeout for get_bill_details/get_amendment_details results."""
+    return _adaptive_ttl(details.get("congress"), details.get("latest_action_date"))
+
+
+def _record_ttl(record):
+    """Entity store timeout for a raw bill/amendment/nomination record."""
+    latest_action = record.get("latestAction") or {}
+    return _adaptive_ttl(record.get("congress"), latest_action.get("actionDate"))
+
+
+def _package_ttl(entity_key):
+    """memoize timeout for detail packages holding the raw entity at ``entity_key``."""
+
+    def ttl(package):
+        return _record_ttl(package.get(entity_key) or {})
+
+    return ttl
+
+
+# --- Cache tags (see cache_tags); called with the call's arguments by name ---
+def _member_tags(bioguide_id, **_):
+    return [member_tag(bioguide_id)]
+
+
+def _members_list_tags(congress_num=None):
+    return [congress_tag(congress_num)] if congress_num else []
+
+
+def _congress_tags(congress=None, **_):
+    return [congress_tag(congress)] if congress else []
+
+
+def _bill_tags(congress, bill_type, bill_number):
+    return [congress_tag(congress), bill_tag(congress, bill_type, bill_number)]
+
+
+def _amendment_tags(congress, amendment_type, amendment_number):
+    return _bill_tags(congress, amendment_type, amendment_number)
+
+
+def _item_number(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return value  # Left for the function to reject
+
+
+def _bill_args(congress, bill_type, bill_number):
+    """Canonical bill arguments: routes pass "hr", list items "HR"."""
+    return {
+        "congress": _item_number(congress),
+        "bill_type": str(bill_type).lower(),
+        "bill_number": _item_number(bill_number),
+    }
+
+
+def _amendment_args(congress, amendment_type, amendment_number):
+    return {
+        "congress": _item_number(congress),
+        "amendment_type": str(amendment_type).lower(),
+        "amendment_number": _item_number(amendment_number),
+    }
+
+
 # --- Congress List ---
-@cache.memoize(timeout=86400)
+@memoize(timeout=86400)
 def get_congress_list():
     """Fetches the list of available Congresses."""
     current_app.logger.info("Fetching Congress list...")
@@ -159,45 +300,76 @@ def get_congress_list():
 
 
 # --- Member Data ---
-@cache.memoize(timeout=43200)
+@memoize(timeout=43200, tags=_members_list_tags)
 def load_congress_members(congress_num=None):
     """Loads member list, optionally filtered by Congress."""
     current_app.logger.info(f"Loading members (Congress: {congress_num or 'All'})...")
     members_data = {}
-    limit = 250
-    offset = 0
-    all_members = []
-    first_error = None
+    limit = MEMBER_PAGE_SIZE
     endpoint = "/member"
     if congress_num:
         endpoint = f"/member/congress/{congress_num}"
-    while True:
-        params = {"limit": limit, "offset": offset}
-        data, error = _make_api_request(endpoint, params=params)
+
+    def _fetch_members_page(offset):
+        data, error = _make_api_request(
+            endpoint, params={"limit": limit, "offset": offset}
+        )
         if error:
             current_app.logger.error(
                 f"ERROR loading members batch (offset {offset}): {error}"
             )
-            if first_error is None:
-                first_error = error
-            if "API Key missing" in error:
-                return None
-            break
+            return None, error
         if not data or "members" not in data or not isinstance(data["members"], list):
-            break
-        members_batch = data["members"]
-        if not members_batch:
-            break
-        all_members.extend(members_batch)
-        offset += limit
-        if len(members_batch) < limit:
-            break
-        if offset >= 3000:
-            current_app.logger.warning("WARN: Member fetch limit (3000).")
-            break
+            return [], None
+        return data["members"], None
+
+    # First page tells us the total; the rest are fetched concurrently
+    first_data, first_error = _make_api_request(
+        endpoint, params={"limit": limit, "offset": 0}
+    )
     if first_error:
-        current_app.logger.error(f"Returning None due to fetch error: {first_error}")
+        current_app.logger.error(
+            f"ERROR loading members batch (offset 0), returning None: {first_error}"
+        )
         return None
+    if (
+        not first_data
+        or "members" not in first_data
+        or not isinstance(first_data["members"], list)
+    ):
+        first_data = {"members": []}
+    all_members = list(first_data["members"])
+    total = (first_data.get("pagination") or {}).get("count")
+
+    if isinstance(total, int) and total > limit and len(all_members) >= limit:
+        offsets = range(limit, total, limit)
+        pages = _run_concurrently(
+            _fetch_members_page,
+            offsets,
+            max_workers=current_app.config.get("MEMBER_PAGE_MAX_WORKERS", 6),
+        )
+        for offset, page in zip(offsets, pages):
+            members_batch, error = page or (None, "Page fetch raised an exception.")
+            if error:
+                current_app.logger.error(
+                    f"Returning None due to fetch error at offset {offset}: {error}"
+                )
+                return None
+            all_members.extend(members_batch)
+    elif len(all_members) >= limit:
+        # No usable total in the response; fall back to walking pages in order
+        offset = limit
+        while True:
+            members_batch, error = _fetch_members_page(offset)
+            if error:
+                current_app.logger.error(f"Returning None due to fetch error: {error}")
+                return None
+            if not members_batch:
+                break
+            all_members.extend(members_batch)
+            offset += limit
+            if len(members_batch) < limit:
+                break
 
     current_app.logger.info(
         f"Processing {len(all_members)} total members fetched for Congress {congress_num}..."
@@ -253,7 +425,121 @@ def load_congress_members(congress_num=None):
     return members_data
 
 
-@cache.memoize(timeout=3600)
+def _member_roster_is_fresh(state):
+    if state is None:
+        return False
+    synced_at, tag_snapshot = state
+    max_age = current_app.config.get("MEMBER_MIRROR_TTL", 900)
+    if time.time() - synced_at >= max_age:
+        return False
+    return not cache_tags.outdated(tag_snapshot)
+
+
+def _sync_member_roster(congress_num=None):
+    """Re-syncs a roster's mirror if it is stale; returns ``(roster, error)``.
+
+    A failed reload keeps the previous mirror; ``error`` is set only when
+    there is none.
+    """
+    roster = int(congress_num) if congress_num else member_mirror.ALL_CONGRESSES
+    mirror_state = member_mirror.roster_state(roster)
+    if not _member_roster_is_fresh(mirror_state):
+        tag_snapshot = cache_tags.snapshot(_members_list_tags(congress_num))
+        members = load_congress_members(congress_num)
+        if members is not None:
+            count = member_mirror.sync_roster(roster, members, tag_snapshot)
+            current_app.logger.info(
+                f"Member mirror: synced {count} members for Congress {congress_num or 'All'}."
+            )
+        elif mirror_state is None:
+            return (
+                roster,
+                f"Failed to load members for Congress {congress_num}. Check API key/logs.",
+            )
+        else:
+            current_app.logger.warning(
+                f"Member mirror: reload failed; serving the previous roster for Congress {congress_num or 'All'}."
+            )
+    return roster, None
+
+
+def query_congress_members(
+    congress_num=None,
+    state=None,
+    party_code=None,
+    chamber=None,
+    name_prefix=None,
+    sort="name",
+    descending=False,
+    offset=0,
+    limit=50,
+):
+    """Filters, sorts and pages a member roster server-side.
+
+    Served from the local member mirror, which is re-synced from
+    load_congress_members once older than MEMBER_MIRROR_TTL or when the
+    Congress's cache tag is invalidated. If that load fails, the previous
+    mirror is served. Returns ``(members, total, error)``.
+    """
+    roster, error = _sync_member_roster(congress_num)
+    if error:
+        return None, 0, error
+    members, total = member_mirror.query_roster(
+        roster,
+        state=state,
+        party_code=party_code,
+        chamber=chamber,
+        name_prefix=name_prefix,
+        sort=sort,
+        descending=descending,
+        offset=offset,
+        limit=limit,
+    )
+    return members, total, None
+
+
+# --- Member Name Search ---
+def refresh_member_search_index():
+    """Applies directory changes from the member mirror to this worker's index.
+
+    Re-syncs the all-Congress roster first if it is stale. Returns the
+    index's update counts, or None when there was nothing to apply.
+    """
+    index = get_member_index()
+    roster, error = _sync_member_roster(None)
+    mirror_state = member_mirror.roster_state(roster)
+    if mirror_state is None:
+        current_app.logger.warning(f"Member search: no directory to index: {error}")
+        return None
+    synced_at = mirror_state[0]
+    if synced_at == index.version:
+        return None
+    stats = index.update(member_mirror.roster_members(roster), version=synced_at)
+    current_app.logger.info(f"Member search: index updated: {stats}")
+    return stats
+
+
+def search_member_names(query, limit=20):
+    """Typo-tolerant, ranked member name search over the all-Congress directory.
+
+    Served from the in-memory trigram index. The first search in a worker
+    builds it; after that the mirror is checked at most every
+    MEMBER_SEARCH_REFRESH seconds, in the background.
+    """
+    index = get_member_index()
+    if index.version is None:
+        refresh_member_search_index()
+        if index.version is None:
+            return {
+                "members": [],
+                "error": "Failed to load the member directory. Check API key/logs.",
+            }
+    elif index.claim_refresh(current_app.config.get("MEMBER_SEARCH_REFRESH", 60)):
+        submit_background(refresh_member_search_index)
+    return {"members": index.search(query, limit), "error": None}
+
+
+@memoize(timeout=3600, tags=_member_tags)
 def get_member_details(bioguide_id):
     """Fetches detailed info for a member."""
     endpoint = f"/member/{bioguide_id}"
@@ -353,129 +639,248 @@ def _identify_legislation_item(item):
         return None
 
 
-# --- Sponsored/Cosponsored ---
-@cache.memoize()  # Cache based on bioguide_id ONLY now
-def get_detailed_sponsored_legislation(bioguide_id):
-    """Fetches a large batch of DETAILED sponsored legislation."""
-    current_app.logger.info(
-        f"Fetching up to {FETCH_ALL_LIMIT} sponsored items for {bioguide_id}"
-    )
-    endpoint = f"/member/{bioguide_id}/sponsored-legislation"
-    # --- FIX: Use fixed large limit, no offset ---
-    params = {"limit": FETCH_ALL_LIMIT, "offset": 0}
-    list_data, error = _make_api_request(endpoint, params=params)
+def _fetch_identity_details(identity):
+    """Fetches basic (memoized) details for an identified bill or amendment."""
+    details = None
+    if identity["item_type"] == "Bill":
+        details = get_bill_details(
+            identity["congress"], identity["type"], identity["number"]
+        )
+    elif identity["item_type"] == "Amendment":
+        details = get_amendment_details(
+            identity["congress"], identity["type"], identity["number"]
+        )
+    return details
 
-    # Initialize return structure - no pagination object needed
-    result = {"items": [], "error": error, "count": 0}
 
-    if error:
-        return result
+def _fetch_legislation_details(item):
+    """Fetches basic (memoized) details for one sponsored/cosponsored list item.
 
-    if list_data:
-        item_list = None
-        for key in ["sponsoredLegislation", "legislation", "items"]:
-            if key in list_data and isinstance(list_data.get(key), list):
-                item_list = list_data[key]
-                break
+    Returns None if the item can't be identified or doesn't exist upstream,
+    and the ``{"error": ...}`` dict if its details failed transiently.
+    """
+    identity = _identify_legislation_item(item)
+    if not identity:
+        return None
+    details = _fetch_identity_details(identity)
+    if not details:
+        return None
+    if details.get("error"):
+        return details if classify_result(details) == RESULT_TRANSIENT else None
+    details["item_type"] = identity["item_type"]
+    return details
 
-        # Get total count from pagination, even if we don't return pagination itself
-        pagination_info = list_data.get("pagination")
-        if pagination_info:
-            result["count"] = pagination_info.get("count", 0)
-        elif item_list:  # Fallback count
-            result["count"] = len(item_list)
-
-        if item_list:
-            processed_items = []
-            for item in item_list:  # Process the fetched batch
-                identity = _identify_legislation_item(item)
-                if not identity:
-                    continue
-                details = None
-                # Fetch basic details for each item in the batch
-                if identity["item_type"] == "Bill":
-                    details = get_bill_details(
-                        identity["congress"], identity["type"], identity["number"]
-                    )
-                elif identity["item_type"] == "Amendment":
-                    details = get_amendment_details(
-                        identity["congress"], identity["type"], identity["number"]
-                    )
 
-                if details and not details.get("error"):
-                    details["item_type"] = identity["item_type"]
-                    processed_items.append(details)
-                # else: Log errors if needed
+def _build_lite_legislation_item(item):
+    """Builds a list-ready item straight from the list payload (no upstream call).
 
-            result["items"] = processed_items
-        else:
-            result["error"] = "Invalid API response structure (sponsored list)."
-    else:
-        result["error"] = "No data received from sponsored legislation API."
+    Mirrors the shape of get_bill_details/get_amendment_details, except that
+    cosponsor and action counts are unknown (None) until fetched separately.
+    """
+    identity = _identify_legislation_item(item)
+    if not identity:
+        return None
+    BILL_TYPE_PATHS = current_app.config["BILL_TYPE_PATHS"]
+    congress = identity["congress"]
+    number = identity["number"]
+    item_type = identity["type"]
+    path_segment = BILL_TYPE_PATHS.get(item_type)
+    url_kind = "bill" if identity["item_type"] == "Bill" else "amendment"
+    latest_action = item.get("latestAction") or {}
+    title = item.get("title")
+    if not title and identity["item_type"] == "Amendment":
+        title = item.get("description") or f"Amdt {item_type} {number}"
+    return {
+        "congress": congress,
+        "number": str(number),
+        "type": item_type,
+        "title": title or "N/A",
+        "introduced_date": item.get("introducedDate"),
+        "latest_action_text": latest_action.get("text"),
+        "latest_action_date": latest_action.get("actionDate"),
+        "url": (
+            f"https://www.congress.gov/{url_kind}/{congress}th-congress/{path_segment}/{number}"
+            if path_segment
+            else None
+        ),
+        "cosponsors_count": None,
+        "actions_count": None,
+        "item_type": identity["item_type"],
+        "error": None,
+    }
+
+
+# --- Sponsored/Cosponsored ---
+MEMBER_LEGISLATION_KINDS = {
+    # kind -> (endpoint suffix, list key in the response)
+    "sponsored": ("sponsored-legislation", "sponsoredLegislation"),
+    "cosponsored": ("cosponsored-legislation", "cosponsoredLegislation"),
+}
 
+
+def _fetch_member_legislation_list(bioguide_id, kind, offset=0, limit=FETCH_ALL_LIMIT):
+    """Fetches one raw page of a member's sponsored or cosponsored list.
+
+    Returns ``(item_list, count, error)``; ``count`` is the member's total.
+    """
+    endpoint_suffix, list_key = MEMBER_LEGISLATION_KINDS[kind]
+    endpoint = f"/member/{bioguide_id}/{endpoint_suffix}"
+    params = {"limit": limit, "offset": offset}
+    list_data, error = _make_api_request(endpoint, params=params)
+    if error:
+        return None, 0, error
+    if not list_data:
+        return None, 0, f"No data received from {kind} legislation API."
+
+    item_list = None
+    for key in [list_key, "legislation", "items"]:
+        if key in list_data and isinstance(list_data.get(key), list):
+            item_list = list_data[key]
+            break
+    # Get total count from pagination, even if we don't return pagination itself
+    count = 0
+    pagination_info = list_data.get("pagination")
+    if pagination_info:
+        count = pagination_info.get("count", 0)
+    elif item_list:  # Fallback count
+        count = len(item_list)
+    if item_list is None:
+        return None, count, f"Invalid API response structure ({kind} list)."
+    return item_list, count, None
+
+
+def _build_member_legislation(
+    bioguide_id, kind, lite=False, offset=0, limit=FETCH_ALL_LIMIT
+):
+    """Builds the {items, count, next_offset, error} payload for one page.
+
+    Full mode fetches basic details for each item in parallel; lite mode
+    builds items from the list payload alone. ``next_offset`` is None once
+    the member's full list has been covered.
+    """
+    current_app.logger.info(
+        f"Fetching {kind} items {offset}-{offset + limit} for {bioguide_id}"
+        + (" (lite)" if lite else "")
+    )
+    item_list, count, error = _fetch_member_legislation_list(
+        bioguide_id, kind, offset=offset, limit=limit
+    )
+    result = {"items": [], "error": error, "count": count, "next_offset": None}
+    if error:
+        return result
+    if lite:
+        built = [_build_lite_legislation_item(item) for item in item_list]
+    else:
+        built = _run_concurrently(_fetch_legislation_details, item_list)
+        # Items whose details failed transiently; such a page isn't cached
+        result["itemErrors"] = sum(
+            1 for details in built if details and details.get("error")
+        )
+    result["items"] = [
+        details for details in built if details and not details.get("error")
+    ]
+    if item_list and offset + len(item_list) < count:
+        result["next_offset"] = offset + len(item_list)
     return result
 
 
-@cache.memoize()  # Cache based on bioguide_id
-def get_detailed_cosponsored_legislation(bioguide_id):
+@memoize(response_filter=_is_complete_package, tags=_member_tags)
+def get_detailed_sponsored_legislation(bioguide_id, offset=0, limit=FETCH_ALL_LIMIT):
+    """Fetches a large batch of DETAILED sponsored legislation."""
+    return _build_member_legislation(
+        bioguide_id, "sponsored", offset=offset, limit=limit
+    )
+
+
+@memoize(response_filter=_is_complete_package, tags=_member_tags)
+def get_detailed_cosponsored_legislation(bioguide_id, offset=0, limit=FETCH_ALL_LIMIT):
     """Fetches a large batch of DETAILED cosponsored legislation."""
-    current_app.logger.info(
-        f"Fetching up to {FETCH_ALL_LIMIT} cosponsored items for {bioguide_id}"
+    return _build_member_legislation(
+        bioguide_id, "cosponsored", offset=offset, limit=limit
     )
-    endpoint = f"/member/{bioguide_id}/cosponsored-legislation"
-    # --- FIX: Use fixed large limit, no offset ---
-    params = {"limit": FETCH_ALL_LIMIT, "offset": 0}
-    list_data, error = _make_api_request(endpoint, params=params)
 
-    result = {"items": [], "error": error, "count": 0}
 
-    if error:
-        return result
+@memoize(tags=_member_tags)
+def get_sponsored_legislation_lite(bioguide_id, offset=0, limit=FETCH_ALL_LIMIT):
+    """Fetches a large batch of sponsored legislation using only the list payload."""
+    return _build_member_legislation(
+        bioguide_id, "sponsored", lite=True, offset=offset, limit=limit
+    )
 
-    if list_data:
-        item_list = None
-        for key in ["cosponsoredLegislation", "legislation", "items"]:
-            if key in list_data and isinstance(list_data.get(key), list):
-                item_list = list_data[key]
-                break
 
-        pagination_info = list_data.get("pagination")
-        if pagination_info:
-            result["count"] = pagination_info.get("count", 0)
-        elif item_list:
-            result["count"] = len(item_list)
-
-        if item_list:
-            processed_items = []
-            for item in item_list:  # Process the fetched batch
-                identity = _identify_legislation_item(item)
-                if not identity:
-                    continue
-                details = None
-                if identity["item_type"] == "Bill":
-                    details = get_bill_details(
-                        identity["congress"], identity["type"], identity["number"]
-                    )
-                elif identity["item_type"] == "Amendment":
-                    details = get_amendment_details(
-                        identity["congress"], identity["type"], identity["number"]
-                    )
-                if details and not details.get("error"):
-                    details["item_type"] = identity["item_type"]
-                    processed_items.append(details)
-                # else: Log errors
+@memoize(tags=_member_tags)
+def get_cosponsored_legislation_lite(bioguide_id, offset=0, limit=FETCH_ALL_LIMIT):
+    """Fetches a large batch of cosponsored legislation using only the list payload."""
+    return _build_member_legislation(
+        bioguide_id, "cosponsored", lite=True, offset=offset, limit=limit
+    )
+
 
-            result["items"] = processed_items
+def iter_member_legislation(bioguide_id, kind, lite=False, offset=0):
+    """Streams a member's whole sponsored/cosponsored list as event dicts.
+
+    Yields ``{"type": "meta", "count"}`` once the first (small) page arrives,
+    then ``{"type": "item", "item"}`` for each item in order, and finally
+    ``{"type": "end", "next_offset", "error"}``. Only one upstream page and a
+    bounded window of detail fetches are held at a time.
+    """
+    first_page_size = current_app.config.get("STREAM_FIRST_PAGE_SIZE", 20)
+    page_size = FETCH_ALL_LIMIT
+    limit = first_page_size
+    meta_sent = False
+    while True:
+        item_list, count, error = _fetch_member_legislation_list(
+            bioguide_id, kind, offset=offset, limit=limit
+        )
+        if error:
+            if not meta_sent:
+                yield {"type": "meta", "count": count}
+            yield {"type": "end", "next_offset": offset, "error": error}
+            return
+        if not meta_sent:
+            yield {"type": "meta", "count": count}
+            meta_sent = True
+        if lite:
+            built = (_build_lite_legislation_item(item) for item in item_list)
         else:
-            result["error"] = "Invalid API response structure (cosponsored list)."
-    else:
-        result["error"] = "No data received from cosponsored legislation API."
+            built = _iter_concurrently(_fetch_legislation_details, item_list)
+        for details in built:
+            if details and not details.get("error"):
+                yield {"type": "item", "item": details}
+        offset += len(item_list)
+        if not item_list or offset >= count:
+            break
+        limit = page_size
+    yield {"type": "end", "next_offset": None, "error": None}
 
-    return result
+
+def get_legislation_counts(identities):
+    """Returns cosponsor/action counts for a batch of bill/amendment identities.
+
+    Each identity is a dict with congress, type, number and item_type (as
+    returned by the lite endpoints). Details are memoized per item, so counts
+    for items already seen by the full endpoints cost no upstream calls.
+    """
+
+    def _counts_for(identity):
+        details = _fetch_identity_details(identity) or {
+            "error": "Unsupported item type."
+        }
+        return {
+            "congress": identity["congress"],
+            "type": identity["type"],
+            "number": str(identity["number"]),
+            "item_type": identity["item_type"],
+            "cosponsors_count": details.get("cosponsors_count"),
+            "actions_count": details.get("actions_count"),
+            "error": details.get("error"),
+        }
+
+    return _run_concurrently(_counts_for, identities)
 
 
 # --- Bill Details ---
-@cache.memoize(timeout=86400)
+@memoize(timeout=_list_item_ttl, tags=_bill_tags, normalize=_bill_args)
 def get_bill_details(congress, bill_type, bill_number):
     """Fetches basic bill details suitable for lists."""
     BILL_TYPES = current_app.config["BILL_TYPES"]
@@ -483,11 +888,11 @@ def get_bill_details(congress, bill_type, bill_number):
     bill_type_lower = bill_type.lower()
     if bill_type_lower not in BILL_TYPES:
         return {"error": f"Invalid bill type: {bill_type}"}
-    endpoint = f"/bill/{congress}/{bill_type_lower}/{bill_number}"
-    base_data, error = _make_api_request(endpoint)
-    if error or not base_data or "bill" not in base_data:
+    bill_data, error = fetch_entity(
+        "bill", congress, bill_type_lower, bill_number, timeout=_record_ttl
+    )
+    if error or not bill_data:
         return {"error": error or "Bill data not found."}
-    bill_data = base_data["bill"]
     latest_action = bill_data.get("latestAction", {})
     path_segment = BILL_TYPE_PATHS.get(bill_data.get("type"))
     item_url = (
@@ -510,7 +915,7 @@ def get_bill_details(congress, bill_type, bill_number):
     }
 
 
-@cache.memoize(timeout=86400)
+@memoize(timeout=_list_item_ttl, tags=_amendment_tags, normalize=_amendment_args)
 def get_amendment_details(congress, amendment_type, amendment_number):
     """Fetches basic amendment details suitable for lists."""
     AMENDMENT_TYPES = current_app.config["AMENDMENT_TYPES"]
@@ -518,11 +923,15 @@ def get_amendment_details(congress, amendment_type, amendment_number):
     amendment_type_lower = amendment_type.lower()
     if amendment_type_lower not in AMENDMENT_TYPES:
         return {"error": f"Invalid amendment type: {amendment_type}"}
-    endpoint = f"/amendment/{congress}/{amendment_type_lower}/{amendment_number}"
-    base_data, error = _make_api_request(endpoint)
-    if error or not base_data or "amendment" not in base_data:
+    amendment_data, error = fetch_entity(
+        "amendment",
+        congress,
+        amendment_type_lower,
+        amendment_number,
+        timeout=_record_ttl,
+    )
+    if error or not amendment_data:
         return {"error": error or "Amendment data not found."}
-    amendment_data = base_data["amendment"]
     latest_action = amendment_data.get("latestAction", {})
     path_segment = BILL_TYPE_PATHS.get(amendment_data.get("type"))
     item_url = (
@@ -549,7 +958,12 @@ def get_amendment_details(congress, amendment_type, amendment_number):
     }
 
 
-@cache.memoize(timeout=7200)
+@memoize(
+    timeout=_package_ttl("bill"),
+    response_filter=_is_complete_package,
+    tags=_bill_tags,
+    normalize=_bill_args,
+)
 def get_full_bill_data(congress, bill_type, bill_number):
     """Fetches comprehensive data for the bill detail page including related items."""
     current_app.logger.info(
@@ -560,7 +974,6 @@ def get_full_bill_data(congress, bill_type, bill_number):
     bill_type_lower = bill_type.lower()
     if bill_type_lower not in BILL_TYPES:
         return {"bill": None, "error": f"Invalid bill type: {bill_type}"}
-    base_endpoint = f"/bill/{congress}/{bill_type_lower}/{bill_number}"
     full_data = {
         "bill": None,
         "actions": [],
@@ -569,20 +982,33 @@ def get_full_bill_data(congress, bill_type, bill_number):
         "relatedBills": [],
         "amendments": [],
         "summaries": [],
+        "sectionErrors": {},  # Section name -> "timeout"/"error" for partial data
         "error": None,
     }  # Default to empty lists
-    base_data, error = _make_api_request(base_endpoint)
-    if error or not base_data or "bill" not in base_data:
+    bill, error = fetch_entity(
+        "bill", congress, bill_type_lower, bill_number, timeout=_record_ttl
+    )
+    if error or not bill:
         full_data["error"] = error or "Bill base data not found or invalid format."
         return full_data
-    bill = base_data["bill"]
     full_data["bill"] = bill
     fetch_limit = 50
-    # Fetch Sub-Resources
-    full_data["actions"] = (
-        _fetch_sub_resource(bill, "actions", "bill", limit=fetch_limit) or []
+    # Fetch Sub-Resources concurrently; late sections come back flagged
+    sub_lists, section_errors = _fetch_sub_resources(
+        bill,
+        "bill",
+        {
+            "actions": fetch_limit,
+            "cosponsors": fetch_limit,
+            "committees": fetch_limit,
+            "relatedBills": fetch_limit,
+            "amendments": fetch_limit,
+            "summaries": 1,
+        },
     )
-    cosponsors_list = _fetch_sub_resource(bill, "cosponsors", "bill", limit=fetch_limit)
+    full_data["sectionErrors"] = section_errors
+    full_data["actions"] = sub_lists.get("actions") or []
+    cosponsors_list = sub_lists.get("cosponsors")
     full_data["cosponsors"] = (
         [
             {
@@ -597,7 +1023,7 @@ def get_full_bill_data(congress, bill_type, bill_number):
         if cosponsors_list
         else []
     )
-    committees_list = _fetch_sub_resource(bill, "committees", "bill", limit=fetch_limit)
+    committees_list = sub_lists.get("committees")
     full_data["committees"] = (
         [
             {
@@ -616,9 +1042,7 @@ def get_full_bill_data(congress, bill_type, bill_number):
         if committees_list
         else []
     )
-    related_bills_list = _fetch_sub_resource(
-        bill, "relatedBills", "bill", limit=fetch_limit
-    )
+    related_bills_list = sub_lists.get("relatedBills")
     full_data["relatedBills"] = (
         [
             {
@@ -638,7 +1062,7 @@ def get_full_bill_data(congress, bill_type, bill_number):
         if related_bills_list
         else []
     )
-    amendments_list = _fetch_sub_resource(bill, "amendments", "bill", limit=fetch_limit)
+    amendments_list = sub_lists.get("amendments")
     full_data["amendments"] = (
         [
             {
@@ -662,9 +1086,8 @@ def get_full_bill_data(congress, bill_type, bill_number):
         if amendments_list
         else []
     )
-    full_data["summaries"] = (
-        _fetch_sub_resource(bill, "summaries", "bill", limit=1) or []
-    )
+    full_data["summaries"] = sub_lists.get("summaries") or []
+    bill_search.index_bill_summary(bill, full_data["summaries"])
     # Add Congress.gov URL
     if full_data["bill"]:
         path_segment = BILL_TYPE_PATHS.get(full_data["bill"].get("type"))
@@ -676,8 +1099,126 @@ def get_full_bill_data(congress, bill_type, bill_number):
     return full_data
 
 
+# --- Block-aligned list pages ---
+_LIST_ENTITY_KINDS = {"bills": "bill", "nominations": "nomination"}
+
+
+def _list_block_ttl(block):
+    """memoize timeout for a list block: long for closed Congresses."""
+    config = current_app.config
+    try:
+        congress = int(block.get("congress"))
+    except (TypeError, ValueError):
+        congress = None
+    if congress and congress < get_congress_registry().current_congress():
+        return config.get("CACHE_TTL_CLOSED_CONGRESS", 21 * 86400)
+    return config.get("LIST_BLOCK_TTL", 1800)
+
+
+@memoize(timeout=_list_block_ttl, tags=_congress_tags)
+def _get_list_block(endpoint, list_key, block_offset, block_size, congress=None):
+    """Fetches one canonical upstream page of a list endpoint.
+
+    Blocks always start at a multiple of ``block_size``, so every offset/limit
+    window a client asks for is served from the same few cached pages.
+    """
+    data, error = _make_api_request(
+        endpoint, params={"offset": block_offset, "limit": block_size}
+    )
+    if error:
+        return {"error": error}
+    if not data or not isinstance(data.get(list_key), list):
+        err_msg = (
+            data.get("message", "Invalid list format")
+            if isinstance(data, dict)
+            else "Invalid list format"
+        )
+        return {"error": err_msg}
+    if list_key in _LIST_ENTITY_KINDS:
+        observe_entity_summaries(_LIST_ENTITY_KINDS[list_key], data[list_key])
+    if list_key == "bills":
+        bill_search.index_bills(data[list_key])
+    return {
+        "items": data[list_key],
+        "count": (data.get("pagination") or {}).get("count"),
+        "congress": congress,
+        "error": None,
+    }
+
+
+def _get_list_window(endpoint, list_key, offset, limit, congress=None):
+    """Returns ``(items, pagination, error)`` for rows [offset, offset + limit).
+
+    The rows are sliced from cached LIST_BLOCK_SIZE blocks. Pagination mirrors
+    Congress.gov's: ``count`` and a ``next`` URL carrying the next offset.
+    """
+    block_size = current_app.config.get("LIST_BLOCK_SIZE", 250)
+    first_block = offset // block_size
+    last_block = (offset + limit - 1) // block_size
+    rows, count = [], None
+    for block in range(first_block, last_block + 1):
+        page = _get_list_block(
+            endpoint, list_key, block * block_size, block_size, congress
+        )
+        if page.get("error"):
+            return None, None, page["error"]
+        if count is None:
+            count = page.get("count")
+        rows.extend(page["items"])
+        if len(page["items"]) < block_size:
+            break  # Last block of the list
+    start = offset - first_block * block_size
+    items = rows[start : start + limit]
+    pagination = {"count": count}
+    if len(items) == limit and (count is None or offset + limit < count):
+        pagination["next"] = (
+            f"{current_app.config['API_BASE_URL']}{endpoint}"
+            f"?offset={offset + limit}&limit={limit}&format=json"
+        )
+    return items, pagination, None
+
+
+# --- Bill Lists ---
+def get_bills_list(congress, bill_type=None, offset=0, limit=20):
+    """Fetches a list of bills for a Congress, optionally of one bill type."""
+    BILL_TYPE_PATHS = current_app.config["BILL_TYPE_PATHS"]
+    current_app.logger.info(
+        f"Fetching bills list: Congress={congress}, Type={bill_type}, Offset={offset}, Limit={limit}"
+    )
+    endpoint = f"/bill/{congress}"
+    if bill_type:
+        endpoint += f"/{bill_type.lower()}"
+    bills, pagination, error = _get_list_window(
+        endpoint, "bills", offset, limit, congress=congress
+    )
+    if error:
+        return {"bills": [], "pagination": None, "error": error}
+    processed_bills = []
+    for bill in bills:
+        if isinstance(bill, dict):
+            b_type = bill.get("type")
+            b_num = bill.get("number")
+            b_cong = bill.get("congress")
+            path_segment = BILL_TYPE_PATHS.get(b_type)
+            # Add API detail path AND internal detail page URL
+            if b_type and b_num is not None and b_cong is not None:
+                # Internal link for React Router
+                bill["detailPageUrl"] = f"/bill/{b_cong}/{b_type}/{b_num}"
+                # External link
+                if path_segment:
+                    bill["congressDotGovUrl"] = (
+                        f"https://www.congress.gov/bill/{b_cong}th-congress/{path_segment}/{b_num}"
+                    )
+                else:
+                    bill["congressDotGovUrl"] = None
+            else:
+                bill["detailPageUrl"] = None  # Set to None if parts are missing
+                bill["congressDotGovUrl"] = None
+            processed_bills.append(bill)
+    return {"bills": processed_bills, "pagination": pagination, "error": None}
+
+
 # --- Committee Data ---
-@cache.memoize(timeout=3600)
 def get_committees_list(congress=None, chamber=None, offset=0, limit=20):
     """Fetches a list of committees based on optional filters."""
     current_app.logger.info(
@@ -691,19 +1232,13 @@ def get_committees_list(congress=None, chamber=None, offset=0, limit=20):
         endpoint = f"/committee/{chamber.lower()}"
     else:
         endpoint = "/committee"
-    params = {"offset": offset, "limit": limit}
-    data, error = _make_api_request(endpoint, params=params)
+    committees, pagination, error = _get_list_window(
+        endpoint, "committees", offset, limit, congress=congress
+    )
     if error:
         return {"committees": [], "pagination": None, "error": error}
-    if not data or not isinstance(data.get("committees"), list):
-        err_msg = (
-            data.get("message", "Invalid list format")
-            if isinstance(data, dict)
-            else "Invalid list format"
-        )
-        return {"committees": [], "pagination": None, "error": err_msg}
     processed_committees = []
-    for committee in data.get("committees", []):
+    for committee in committees:
         if isinstance(committee, dict):
             comm_chamber = committee.get("chamber")
             comm_code = committee.get("systemCode")
@@ -715,12 +1250,12 @@ def get_committees_list(congress=None, chamber=None, offset=0, limit=20):
             processed_committees.append(committee)
     return {
         "committees": processed_committees,
-        "pagination": data.get("pagination"),
+        "pagination": pagination,
         "error": None,
     }
 
 
-@cache.memoize(timeout=7200)
+@memoize(timeout=7200, response_filter=_is_complete_package)
 def get_committee_details(chamber, committee_code):
     """Fetches detailed information for a specific committee, including associated items."""
     current_app.logger.info(
@@ -748,37 +1283,29 @@ def get_committee_details(chamber, committee_code):
     # --- FIX: Removed unused variable assignment below ---
     # BILL_TYPE_PATHS = current_app.config['BILL_TYPE_PATHS'] # <<< REMOVED THIS LINE
 
-    # --- Fetch Associated Items using Helper ---
-    associated_bills = _fetch_sub_resource(
-        committee, "bills", "committee", limit=fetch_limit
-    )
-    committee_reports = _fetch_sub_resource(
-        committee, "reports", "committee", limit=fetch_limit
-    )
-    associated_nominations = None
+    # --- Fetch Associated Items concurrently using Helper ---
+    limits = {"bills": fetch_limit, "reports": fetch_limit}
     if chamber_lower != "house":
-        associated_nominations = _fetch_sub_resource(
-            committee, "nominations", "committee", limit=fetch_limit
-        )
-    associated_communications = None
+        limits["nominations"] = fetch_limit
     comm_key = "communications"
     comm_url_info = committee.get(comm_key, {})
     if isinstance(comm_url_info, dict) and comm_url_info.get("url"):
-        comm_url = comm_url_info["url"]
-        comm_api_path = urlparse(comm_url).path
-        comm_base_segment = "committee"
-        if "house-communication" in comm_api_path:
-            associated_communications = _fetch_sub_resource(
-                committee, comm_key, comm_base_segment, limit=fetch_limit
-            )
-        elif "senate-communication" in comm_api_path:
-            associated_communications = _fetch_sub_resource(
-                committee, comm_key, comm_base_segment, limit=fetch_limit
-            )
+        comm_api_path = urlparse(comm_url_info["url"]).path
+        if (
+            "house-communication" in comm_api_path
+            or "senate-communication" in comm_api_path
+        ):
+            limits[comm_key] = fetch_limit
+    sub_lists, section_errors = _fetch_sub_resources(committee, "committee", limits)
+    associated_bills = sub_lists.get("bills")
+    committee_reports = sub_lists.get("reports")
+    associated_nominations = sub_lists.get("nominations")
+    associated_communications = sub_lists.get(comm_key)
 
     # --- Process Fetched Lists (Add Links) ---
     processed_bills = []
     if associated_bills:
+        observe_entity_summaries("bill", associated_bills)
         for bill in associated_bills:
             if isinstance(bill, dict):
                 b_cong = bill.get("congress")
@@ -855,31 +1382,25 @@ def get_committee_details(chamber, committee_code):
         "committee_reports": processed_reports,
         "associated_nominations": processed_nominations,
         "associated_communications": processed_communications,
+        "sectionErrors": section_errors,
         "error": None,
     }
 
 
 # --- Nomination Data ---
-@cache.memoize(timeout=1800)
 def get_nominations_list(congress=None, offset=0, limit=20):
     """Fetches a list of nominations, optionally filtered by Congress."""
     current_app.logger.info(
         f"Fetching nominations list: Congress={congress}, Offset={offset}, Limit={limit}"
     )
     endpoint = f"/nomination/{congress}" if congress else "/nomination"
-    params = {"offset": offset, "limit": limit}
-    data, error = _make_api_request(endpoint, params=params)
+    nominations, pagination, error = _get_list_window(
+        endpoint, "nominations", offset, limit, congress=congress
+    )
     if error:
         return {"nominations": [], "pagination": None, "error": error}
-    if not data or not isinstance(data.get("nominations"), list):
-        err_msg = (
-            data.get("message", "Invalid list format")
-            if isinstance(data, dict)
-            else "Invalid list format"
-        )
-        return {"nominations": [], "pagination": None, "error": err_msg}
     processed_nominations = []
-    for nom in data.get("nominations", []):
+    for nom in nominations:
         if isinstance(nom, dict):
             nom_cong = nom.get("congress")
             nom_num = nom.get("number")
@@ -894,40 +1415,36 @@ def get_nominations_list(congress=None, offset=0, limit=20):
             processed_nominations.append(nom)
     return {
         "nominations": processed_nominations,
-        "pagination": data.get("pagination"),
+        "pagination": pagination,
         "error": None,
     }
 
 
-@cache.memoize(timeout=7200)
+@memoize(
+    timeout=_package_ttl("nomination"),
+    response_filter=_is_complete_package,
+    tags=_congress_tags,
+)
 def get_nomination_details(congress, nomination_number):
     """Fetches detailed information for a specific nomination."""
     current_app.logger.info(
         f"Fetching nomination details for: {congress}/{nomination_number}"
     )
-    endpoint = f"/nomination/{congress}/{nomination_number}"
-    data, error = _make_api_request(endpoint)
+    nomination_data, error = fetch_entity(
+        "nomination", congress, None, nomination_number, timeout=_record_ttl
+    )
     if error:
         return {"nomination": None, "error": error}
-    if not data or not isinstance(data.get("nomination"), dict):
-        err_msg = (
-            data.get("message", "Invalid detail format")
-            if isinstance(data, dict)
-            else "Invalid detail format"
-        )
-        return {"nomination": None, "error": err_msg}
-    nomination_data = data["nomination"]
+    if not nomination_data:
+        return {"nomination": None, "error": "Invalid detail format"}
     fetch_limit = 50
-    actions_data = (
-        _fetch_sub_resource(nomination_data, "actions", "nomination", limit=fetch_limit)
-        or []
-    )
-    committees_raw = (
-        _fetch_sub_resource(
-            nomination_data, "committees", "nomination", limit=fetch_limit
-        )
-        or []
+    sub_lists, section_errors = _fetch_sub_resources(
+        nomination_data,
+        "nomination",
+        {"actions": fetch_limit, "committees": fetch_limit},
     )
+    actions_data = sub_lists.get("actions") or []
+    committees_raw = sub_lists.get("committees") or []
     committees_data = []
     for comm in committees_raw:
         if isinstance(comm, dict):
@@ -947,5 +1464,110 @@ def get_nomination_details(congress, nomination_number):
         "nomination": nomination_data,
         "actions": actions_data,
         "committees": committees_data,
+        "sectionErrors": section_errors,
         "error": None,
     }
+
+
+# --- Bill Search ---
+def search_bill_index(query, congress=None, bill_type=None, offset=0, limit=20):
+    """Ranked full-text search over indexed bill titles and summaries."""
+    BILL_TYPE_PATHS = current_app.config["BILL_TYPE_PATHS"]
+    current_app.logger.info(
+        f"Searching bills: Q={query!r}, Congress={congress}, Type={bill_type}, Offset={offset}, Limit={limit}"
+    )
+    try:
+        results, total = bill_search.search_bills(
+            query, congress=congress, bill_type=bill_type, offset=offset, limit=limit
+        )
+    except sqlite3.Error as e:
+        current_app.logger.error(f"Bill search failed: {e}")
+        return {"results": [], "total": 0, "error": f"Search index unavailable: {e}"}
+    for result in results:
+        b_type = result.pop("bill_type").upper()
+        b_num, b_cong = result["number"], result["congress"]
+        result["type"] = b_type
+        result["detailPageUrl"] = f"/bill/{b_cong}/{b_type}/{b_num}"
+        path_segment = BILL_TYPE_PATHS.get(b_type)
+        result["congressDotGovUrl"] = (
+            f"https://www.congress.gov/bill/{b_cong}th-congress/{path_segment}/{b_num}"
+            if path_segment
+            else None
+        )
+    return {"results": results, "total": total, "error": None}
+
+
+# --- Cache invalidation ---
+_TAG_PATTERNS = (
+    re.compile(r"^all$"),
+    re.compile(r"^congress:\d+$"),
+    re.compile(r"^member:[A-Z]\d{6}$"),
+    re.compile(r"^bill:\d+:[a-z]+:\d+$"),
+)
+
+
+def normalize_cache_tag(tag):
+    """Returns the canonical form of a cache tag, or None if it isn't valid."""
+    kind, _, rest = str(tag).strip().partition(":")
+    try:
+        if kind == cache_tags.ALL_TAG and not rest:
+            tag = kind
+        elif kind == "congress":
+            tag = congress_tag(rest)
+        elif kind == "member":
+            tag = member_tag(rest)
+        elif kind == "bill":
+            congress, item_type, number = rest.split(":")
+            tag = bill_tag(congress, item_type, int(number))
+        else:
+            return None
+    except ValueError:
+        return None
+    return tag if any(p.match(tag) for p in _TAG_PATTERNS) else None
+
+
+def rewarm_cache_tags(tags):
+    """Recomputes the main cached views behind each tag (call at background priority)."""
+    AMENDMENT_TYPES = current_app.config["AMENDMENT_TYPES"]
+    for tag in tags:
+        kind, _, rest = tag.partition(":")
+        if kind == cache_tags.ALL_TAG:
+            continue  # Too broad to recompute; views refill as they're read
+        if kind == "congress":
+            get_congress_list()
+            load_congress_members(rest)
+        elif kind == "member":
+            get_member_details(rest)
+            get_detailed_sponsored_legislation(rest)
+            get_detailed_cosponsored_legislation(rest)
+        elif kind == "bill":
+            congress, item_type, number = rest.split(":")
+            if item_type in AMENDMENT_TYPES:
+                get_amendment_details(int(congress), item_type, int(number))
+            else:
+                get_bill_details(int(congress), item_type, int(number))
+                get_full_bill_data(int(congress), item_type, int(number))
+        current_app.logger.info(f"Re-warmed cache for tag {tag}.")
+
+
+def invalidate_cache_tags(tags, mode=cache_tags.MODE_PURGE, rewarm=False):
+    """Purges or refreshes every cached entry carrying any of ``tags``.
+
+    With ``rewarm`` the main views behind the tags are recomputed on the
+    background pool. Returns ``(normalized tags, error)``.
+    """
+    normalized = [normalize_cache_tag(tag) for tag in tags]
+    invalid = [tag for tag, norm in zip(tags, normalized) if norm is None]
+    if invalid or not normalized:
+        return (
+            None,
+            f"Invalid cache tags: {', '.join(map(str, invalid)) or 'none given'}",
+        )
+    if mode not in cache_tags.INVALIDATION_MODES:
+        return None, f"Invalid mode: {mode}"
+    cache_tags.invalidate(normalized, mode=mode)
+    bill_store.discard_tagged(normalized)  # Synced copies would outlive the purge
+    current_app.logger.info(f"Cache tags invalidated ({mode}): {normalized}")
+    if rewarm:
+        submit_background(rewarm_cache_tags, normalized)
+    return normalized, None
@@ -1,11 +1,285 @@
 # FILE: app/utils.py
+import base64
+import contextvars
+import pickle
+import os
+import threading
+import time
 import requests
 import json
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, wait
 from flask import current_app
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, ReadTimeoutError, ResponseError
+from urllib3.util.retry import Retry
 
+from .circuit import CIRCUIT_OPEN_ERROR, endpoint_family, get_breaker
+from .ratelimit import get_rate_limiter
+from .scheduler import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, get_scheduler
 
-def _make_api_request(endpoint, params=None, timeout=15):
-    """Makes a request to the Congress.gov API."""
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+# --- In-process request coalescing ---
+_NO_RESULT = object()
+_NOT_SHARED = object()
+
+
+class SingleFlight:
+    """Collapses concurrent calls with the same key into one execution.
+
+    The first caller (the leader) runs the function; callers arriving while
+    it is in flight wait for it. The leader's result is pickled before they
+    are woken and each of them unpickles its own copy, so no two callers
+    ever share a mutable object, even while the leader changes its own.
+    Exceptions propagate to all. A result that ``shareable`` rejects is not
+    handed on; the waiting callers start a new flight instead.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}  # key -> [done event, pickled result, exception, waiters]
+
+    def do(self, key, fn, shareable=None):
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = [threading.Event(), None, None, 0]
+                    self._calls[key] = call
+                else:
+                    call[3] += 1
+            if leader:
+                return self._lead(key, call, fn, shareable)
+            call[0].wait()
+            if call[2] is not None:
+                raise call[2]
+            if call[1] is not _NOT_SHARED:
+                return pickle.loads(call[1])
+
+    def _lead(self, key, call, fn, shareable):
+        result = _NO_RESULT
+        try:
+            result = fn()
+            return result
+        except Exception as e:
+            call[2] = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)  # No new waiters from here on
+            if call[2] is None and call[3]:
+                try:
+                    if result is _NO_RESULT:
+                        raise RuntimeError(f"Coalesced call {key!r} was aborted")
+                    if shareable is not None and not shareable(result):
+                        call[1] = _NOT_SHARED
+                    else:
+                        call[1] = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+                except Exception as e:
+                    call[2] = e
+            call[0].set()
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._calls)
+
+
+_api_single_flight = SingleFlight()
+
+
+# --- Upstream call priority ---
+_upstream_priority = contextvars.ContextVar(
+    "upstream_priority", default=PRIORITY_INTERACTIVE
+)
+
+
+@contextmanager
+def background_priority():
+    """Marks upstream calls made inside the block as background work.
+
+    Background calls queue behind interactive ones for upstream slots and
+    are the first to be shed when the API quota runs low.
+    """
+    token = _upstream_priority.set(PRIORITY_BACKGROUND)
+    try:
+        yield
+    finally:
+        _upstream_priority.reset(token)
+
+
+# --- Per-incoming-request deadline ---
+# Absolute time.monotonic() by which every upstream call triggered by the
+# current request must finish; None means no deadline (CLI, background jobs).
+_request_deadline = contextvars.ContextVar("request_deadline", default=None)
+MIN_UPSTREAM_BUDGET = 0.1  # Seconds; with less left an upstream call is skipped
+# Errors starting with this were caused by the caller's own deadline, not by
+# the upstream; coalesced callers with more time left don't inherit them.
+DEADLINE_EXCEEDED_ERROR = "Request deadline exceeded"
+
+
+def set_request_deadline(seconds):
+    """Starts a deadline ``seconds`` from now for upstream calls (None clears it)."""
+    _request_deadline.set(None if seconds is None else time.monotonic() + seconds)
+
+
+def _deadline_remaining():
+    """Seconds left in the current request's budget, or None if unbounded."""
+    deadline = _request_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def init_request_deadlines(app):
+    """Gives every incoming request a REQUEST_DEADLINE budget for upstream calls."""
+
+    @app.before_request
+    def _start_request_deadline():
+        set_request_deadline(app.config.get("REQUEST_DEADLINE"))
+
+    @app.teardown_request
+    def _clear_request_deadline(exc=None):
+        set_request_deadline(None)
+
+
+# --- Pooled HTTP sessions (one per worker process) ---
+_http_sessions = {}  # pid -> session
+_http_session_lock = threading.Lock()
+
+
+class _CappedRetry(Retry):
+    """Retry policy that never sleeps longer than the configured Retry-After cap.
+
+    Under a request deadline a retry is only made if its wait (Retry-After
+    or backoff) still leaves MIN_UPSTREAM_BUDGET for the attempt; otherwise
+    the last response or error is returned as if retries ran out.
+    """
+
+    def __init__(self, *args, retry_after_cap=10, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.retry_after_cap = retry_after_cap
+
+    def new(self, **kw):
+        # increment() builds each next Retry through new(); carry the cap over
+        kw.setdefault("retry_after_cap", self.retry_after_cap)
+        return super().new(**kw)
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.retry_after_cap)
+
+    def increment(self, method=None, url=None, response=None, error=None, **kw):
+        retry = super().increment(method, url, response=response, error=error, **kw)
+        remaining = _deadline_remaining()
+        if remaining is None:
+            return retry
+        wait = None
+        if response is not None and retry.respect_retry_after_header:
+            wait = retry.get_retry_after(response)
+        if wait is None:
+            wait = retry.get_backoff_time()
+        if remaining - wait < MIN_UPSTREAM_BUDGET:
+            reason = error or ResponseError(
+                ResponseError.SPECIFIC_ERROR.format(
+                    status_code=getattr(response, "status", None)
+                )
+            )
+            raise MaxRetryError(kw.get("_pool"), url, reason) from reason
+        return retry
+
+
+def _build_http_session(config):
+    """Creates a keep-alive session with a bounded connection pool and retries."""
+    pool_size = config.get("API_POOL_SIZE", 20)
+    retry = _CappedRetry(
+        total=config.get("API_MAX_RETRIES", 3),
+        backoff_factor=config.get("API_RETRY_BACKOFF", 0.5),
+        backoff_jitter=config.get("API_RETRY_JITTER", 0.5),
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,  # Hand the final response to raise_for_status()
+        retry_after_cap=config.get("API_RETRY_AFTER_CAP", 10),
+    )
+    adapter = HTTPAdapter(
+        pool_connections=4,  # Distinct hosts; only api.congress.gov in practice
+        pool_maxsize=pool_size,
+        pool_block=False,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.headers.update({"Accept": "application/json"})
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _get_http_session():
+    """Returns the process-wide pooled session, rebuilding it after a fork."""
+    pid = os.getpid()
+    session = _http_sessions.get(pid)
+    if session is not None:
+        return session
+    with _http_session_lock:
+        if pid not in _http_sessions:
+            # Sessions inherited from a gunicorn master must not be shared
+            # with the parent, so each worker builds its own pools.
+            _http_sessions.clear()
+            _http_sessions[pid] = _build_http_session(current_app.config)
+        return _http_sessions[pid]
+
+
+def _make_api_request(endpoint, params=None, timeout=None):
+    """Makes a request to the Congress.gov API.
+
+    ``timeout`` overrides the configured read timeout; the connect timeout is
+    always taken from ``API_CONNECT_TIMEOUT``. Both are cut short to fit the
+    current request's deadline. Identical requests already in flight in this
+    process are coalesced into a single upstream call, calls are admitted by
+    the priority scheduler (interactive first), and a call to an endpoint
+    family whose circuit breaker is open fails fast.
+    """
+    priority = _upstream_priority.get()
+    flight_key = (endpoint, tuple(sorted((params or {}).items())), timeout, priority)
+    return _api_single_flight.do(
+        flight_key,
+        lambda: _scheduled_api_request(endpoint, params, timeout, priority),
+        shareable=lambda result: not _is_deadline_error(result[1]),
+    )
+
+
+def _is_deadline_error(error):
+    return bool(error) and str(error).startswith(DEADLINE_EXCEEDED_ERROR)
+
+
+def _scheduled_api_request(endpoint, params, timeout, priority):
+    """Waits for an upstream slot at ``priority``, then performs the request."""
+    remaining = _deadline_remaining()
+    if remaining is not None and remaining < MIN_UPSTREAM_BUDGET:
+        error_msg = f"{DEADLINE_EXCEEDED_ERROR}; skipped {endpoint}"
+        current_app.logger.warning(error_msg)
+        return None, error_msg
+    scheduler = get_scheduler()
+    with scheduler.slot(priority, max_wait=remaining) as admitted:
+        if not admitted:
+            if remaining is not None and remaining < scheduler.max_wait:
+                reason = f"{DEADLINE_EXCEEDED_ERROR} in the upstream queue"
+            else:
+                reason = "Upstream queue wait exceeded"
+            error_msg = f"{reason}; skipped {endpoint}"
+            current_app.logger.warning(f"{error_msg} ({priority})")
+            return None, error_msg
+        return _do_api_request(endpoint, params, timeout)
+
+
+def _do_api_request(endpoint, params, timeout):
+    """Performs one upstream GET; see _make_api_request."""
     api_key = current_app.config.get("CONGRESS_GOV_API_KEY")
     base_url = current_app.config.get("API_BASE_URL")
 
@@ -24,17 +298,56 @@ def _make_api_request(endpoint, params=None, timeout=15):
     log_params["api_key"] = "***MASKED***"
     # current_app.logger.debug(f"API Request: GET {url} PARAMS: {log_params}")
 
-    headers = {"Accept": "application/json"}
+    connect_timeout = current_app.config.get("API_CONNECT_TIMEOUT", 3.05)
+    if timeout is None:
+        timeout = current_app.config.get("API_READ_TIMEOUT", 15)
+    deadline_clamped = False  # Timeouts cut short by our deadline
+    remaining = _deadline_remaining()
+    if remaining is not None:
+        if remaining < MIN_UPSTREAM_BUDGET:
+            error_msg = f"{DEADLINE_EXCEEDED_ERROR}; skipped {endpoint}"
+            current_app.logger.warning(error_msg)
+            return None, error_msg
+        deadline_clamped = remaining < max(connect_timeout, timeout)
+        connect_timeout = min(connect_timeout, remaining)
+        timeout = round(min(timeout, remaining), 2)
+
+    family = endpoint_family(endpoint)
+    breaker = get_breaker(family)
+    if not breaker.allow():
+        error_msg = f"{CIRCUIT_OPEN_ERROR} for {family} API; skipped {endpoint}"
+        current_app.logger.warning(error_msg)
+        return None, error_msg
+
+    limiter = get_rate_limiter()
+    background = _upstream_priority.get() == PRIORITY_BACKGROUND
+    if not limiter.acquire(background=background, max_wait=remaining):
+        breaker.cancel()
+        if not background and remaining is not None and remaining < limiter.max_wait:
+            reason = f"{DEADLINE_EXCEEDED_ERROR} waiting for API rate limit budget"
+        else:
+            reason = "API rate limit budget exhausted"
+        error_msg = f"{reason}; skipped {endpoint}"
+        current_app.logger.warning(
+            f"{error_msg} ({'background' if background else 'interactive'})"
+        )
+        return None, error_msg
+
     response = None
+    upstream_failed = True  # Until a response (other than a 5xx) arrives
+    timed_out = False
     try:
-        response = requests.get(
-            url, headers=headers, params=request_params, timeout=timeout
+        response = _get_http_session().get(
+            url, params=request_params, timeout=(connect_timeout, timeout)
         )
+        upstream_failed = response.status_code >= 500
+        limiter.observe_response(response.headers, response.status_code)
         response.raise_for_status()
         data = response.json()
         return data, None
     except requests.exceptions.Timeout:
-        error_msg = f"Timeout ({timeout}s) for {endpoint}"
+        timed_out = True
+        error_msg = _timeout_error(endpoint, timeout, deadline_clamped)
         current_app.logger.error(error_msg)
         return None, error_msg
     except requests.exceptions.HTTPError as e:
@@ -51,6 +364,12 @@ def _make_api_request(endpoint, params=None, timeout=15):
         current_app.logger.error(error_msg)
         return None, f"API HTTP {status_code}: {error_msg}"  # Pass back status info
     except requests.exceptions.RequestException as e:
+        reason = getattr(e.args[0], "reason", None) if e.args else None
+        if isinstance(reason, ReadTimeoutError):  # Read timeout after retries
+            timed_out = True
+            error_msg = _timeout_error(endpoint, timeout, deadline_clamped)
+            current_app.logger.error(error_msg)
+            return None, error_msg
         error_msg = f"Network error for {endpoint}: {e}"
         current_app.logger.error(error_msg)
         return None, error_msg
@@ -63,3 +382,165 @@ def _make_api_request(endpoint, params=None, timeout=15):
         error_msg = f"Unexpected error during API request for {endpoint}: {e}"
         current_app.logger.exception(error_msg)
         return None, error_msg
+    finally:
+        if timed_out and deadline_clamped:
+            # A timeout our own deadline shortened says nothing about the
+            # upstream's health, so it doesn't count against the breaker
+            breaker.cancel()
+        elif upstream_failed:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+
+def _timeout_error(endpoint, timeout, deadline_clamped):
+    if deadline_clamped:
+        return f"{DEADLINE_EXCEEDED_ERROR}: timed out after {timeout}s on {endpoint}"
+    return f"Timeout ({timeout}s) for {endpoint}"
+
+
+# --- Bounded concurrency helper ---
+def _run_concurrently(func, items, max_workers=None):
+    """Applies ``func`` to every item on a bounded thread pool.
+
+    Results come back in input order. An exception raised for one item is
+    logged and leaves ``None`` in that slot rather than failing the batch.
+    Each worker runs in a copy of the caller's context with the app context
+    pushed, so memoized service functions and config work as usual.
+    """
+    items = list(items)
+    if not items:
+        return []
+    app = current_app._get_current_object()
+    if max_workers is None:
+        max_workers = app.config.get("ENRICHMENT_MAX_WORKERS", 8)
+    max_workers = max(1, min(max_workers, len(items)))
+
+    def _call(item):
+        with app.app_context():
+            try:
+                return func(item)
+            except Exception as e:
+                app.logger.exception(f"Concurrent task {func.__name__} failed: {e}")
+                return None
+
+    if max_workers == 1:
+        return [_call(item) for item in items]
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="civictrack-fetch"
+    ) as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, _call, item)
+            for item in items
+        ]
+        return [future.result() for future in futures]
+
+
+def _iter_concurrently(func, items, max_workers=None):
+    """Like _run_concurrently, but yields results in input order as they finish.
+
+    At most ``2 * max_workers`` tasks are in flight at once, so memory stays
+    bounded however long ``items`` is, and the first result can be sent to the
+    client before the rest of the batch completes.
+    """
+    app = current_app._get_current_object()
+    if max_workers is None:
+        max_workers = app.config.get("ENRICHMENT_MAX_WORKERS", 8)
+    max_workers = max(1, max_workers)
+
+    def _call(item):
+        with app.app_context():
+            try:
+                return func(item)
+            except Exception as e:
+                app.logger.exception(f"Concurrent task {func.__name__} failed: {e}")
+                return None
+
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="civictrack-stream"
+    )
+    pending = deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(contextvars.copy_context().run, _call, item))
+            if len(pending) >= 2 * max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # Also reached when a streaming client disconnects mid-way
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _fetch_sections(tasks, deadline=None, max_workers=None):
+    """Runs named sub-resource fetches concurrently under one shared deadline.
+
+    ``tasks`` maps a section name to a zero-argument callable. Returns
+    ``(results, section_errors)``: ``results`` holds the value of every section
+    that finished in time, ``section_errors`` maps the others to ``"timeout"``
+    or ``"error"``. Sections still running at the deadline are abandoned
+    rather than awaited, so one slow upstream call can't hold up the response.
+    """
+    results, section_errors = {}, {}
+    if not tasks:
+        return results, section_errors
+    app = current_app._get_current_object()
+    if deadline is None:
+        deadline = app.config.get("DETAIL_FETCH_DEADLINE", 10)
+    remaining = _deadline_remaining()
+    if remaining is not None:
+        deadline = max(0, min(deadline, remaining))
+    if max_workers is None:
+        max_workers = app.config.get("SUB_RESOURCE_MAX_WORKERS", 6)
+
+    def _call(fn):
+        with app.app_context():
+            return fn()
+
+    started = time.monotonic()
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(tasks))),
+        thread_name_prefix="civictrack-section",
+    )
+    try:
+        futures = {
+            name: executor.submit(contextvars.copy_context().run, _call, fn)
+            for name, fn in tasks.items()
+        }
+        wait(futures.values(), timeout=deadline)
+        for name, future in futures.items():
+            if not future.done():
+                section_errors[name] = "timeout"
+                continue
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                app.logger.exception(f"Section '{name}' failed: {e}")
+                section_errors[name] = "error"
+    finally:
+        # Don't block on stragglers; their results are simply discarded.
+        executor.shutdown(wait=False, cancel_futures=True)
+    if section_errors:
+        app.logger.warning(
+            f"Partial data after {time.monotonic() - started:.2f}s, sections: {section_errors}"
+        )
+    return results, section_errors
+
+
+# --- Opaque pagination cursors ---
+def _encode_cursor(offset):
+    """Encodes an upstream offset as an opaque, URL-safe cursor string."""
+    return base64.urlsafe_b64encode(f"o:{offset}".encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor):
+    """Decodes a cursor from _encode_cursor; returns None if it is invalid."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        prefix, _, value = base64.urlsafe_b64decode(padded).decode().partition(":")
+        offset = int(value)
+    except (ValueError, UnicodeDecodeError, TypeError):
+        return None
+    if prefix != "o" or offset < 0:
+        return None
+    return offset
@@ -0,0 +1,141 @@
+# FILE: benchmarks/bench_bill_search.py
+"""Query latency of /api/search/bills' FTS5 index over a full Congress.
+
+Builds the index for ``--bills`` synthetic bills (a Congress is ~15k) the
+way the app fills it: titles in 250-row list blocks, then one summary per
+bill as detail pages load. Words are drawn Zipf-style from a legislative
+vocabulary so common terms match thousands of bills and rare ones a few.
+Each query runs ``--runs`` times through bill_search.search_bills (capped
+count + first page, ranked); a LIKE scan over the same rows is shown for
+scale.
+
+Usage:
+    python benchmarks/bench_bill_search.py [--bills 15000] [--runs 50]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests"),
+)
+
+from stub_api import make_app, start_stub_server  # noqa: E402
+
+from app import bill_search  # noqa: E402
+from app.local_db import get_local_db  # noqa: E402
+
+WORDS = (
+    "act amend appropriations authorize bill committee congress defense energy "
+    "federal funding health housing infrastructure national program provide "
+    "public report require secretary security service states support united "
+    "veterans water year education tax credit medicare medicaid rural small "
+    "business agriculture forest wildfire border immigration cybersecurity "
+    "transportation highway broadband tribal pension retirement opioid "
+    "treatment research grant disaster relief flood insurance election "
+    "firearms privacy consumer protection climate emissions nuclear"
+).split()
+# Long tail of rarer words, as in real bill text (tens of thousands of terms)
+WORDS += [f"{word}{i}" for i in range(200) for word in ("sec", "usc", "title")]
+WEIGHTS = [1 / (rank + 1) for rank in range(len(WORDS))]
+BILL_TYPES = ["hr"] * 6 + ["s"] * 3 + ["hres", "sres", "hjres"]
+
+QUERIES = (
+    ("common term", "act", {}),
+    ("two terms", "veterans health", {}),
+    ("three terms", "rural broadband grant", {}),
+    ("rare term", "title150", {}),
+    ("prefix (typing)", "cybersec", {}),
+    ("type filter", "health", {"bill_type": "s"}),
+    ("no match", "zeppelin", {}),
+)
+
+
+def _text(rng, words):
+    return " ".join(rng.choices(WORDS, WEIGHTS, k=words))
+
+
+def build_index(count, congress=119, seed=7):
+    rng = random.Random(seed)
+    bills = [
+        {
+            "congress": congress,
+            "type": rng.choice(BILL_TYPES).upper(),
+            "number": str(n),
+            "title": _text(rng, rng.randint(6, 18)).capitalize(),
+            "latestAction": {"actionDate": "2025-03-01"},
+        }
+        for n in range(1, count + 1)
+    ]
+    start = time.perf_counter()
+    for i in range(0, count, 250):
+        bill_search.index_bills(bills[i : i + 250])
+    titles = time.perf_counter() - start
+    start = time.perf_counter()
+    for bill in bills:
+        summary = f"<p>{_text(rng, rng.randint(60, 200))}.</p>"
+        bill_search.index_bill_summary(bill, [{"text": summary, "actionDate": "x"}])
+    summaries = time.perf_counter() - start
+    return titles, summaries
+
+
+def time_query(func, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return result, statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bills", type=int, default=15000)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    server = start_stub_server(lambda path, query: None)
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = os.path.join(workdir, "civictrack.sqlite3")
+        app = make_app(server, LOCAL_DB_PATH=db_path)
+        with app.app_context():
+            titles, summaries = build_index(args.bills)
+            print(
+                f"\nIndexed {args.bills} bills: titles {titles:.2f} s "
+                f"(250-row blocks), summaries {summaries:.2f} s (one per bill); "
+                f"database {os.path.getsize(db_path) / 2**20:.1f} MiB"
+            )
+            conn = get_local_db().connection()
+            print(f"\n{'query':<18} {'q':<22} {'matches':>7}  {'p50':>8}  {'p95':>8}")
+            for label, query, filters in QUERIES:
+                (_, total), p50, p95 = time_query(
+                    lambda: bill_search.search_bills(query, **filters), args.runs
+                )
+                print(
+                    f"{label:<18} {query!r:<22} {total:7d}  "
+                    f"{p50 * 1000:6.2f}ms  {p95 * 1000:6.2f}ms"
+                )
+            term = QUERIES[1][1].split()[0]
+            _, p50, p95 = time_query(
+                lambda: conn.execute(
+                    "SELECT COUNT(*) FROM bill_docs WHERE title LIKE ? OR summary LIKE ?",
+                    (f"%{term}%", f"%{term}%"),
+                ).fetchone(),
+                max(5, args.runs // 10),
+            )
+            print(
+                f"{'LIKE scan':<18} {term!r:<22} {'':>7}  "
+                f"{p50 * 1000:6.2f}ms  {p95 * 1000:6.2f}ms"
+            )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+# FILE: benchmarks/bench_cache_serializer.py
+"""Bytes stored and hit latency per cache serializer, vs. plain pickle.
+
+Payloads are captured by running the real service functions (uncached)
+against the stub API, which serves Congress.gov-shaped records: a full bill
+package, a 250-item detailed sponsored list, the member directory and a
+member profile. Real captures can be added with ``--payload-dir``: every
+``*.json`` file in it is one payload (e.g. saved Congress.gov responses).
+
+Each serializer writes all payloads to a fresh SQLiteCache (the L2 backend)
+and then reads them back ``--reads`` times; hit latency includes the SQLite
+read and the decode.
+
+Usage:
+    python benchmarks/bench_cache_serializer.py [--reads 200] [--payload-dir DIR]
+"""
+
+import argparse
+import glob
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests"),
+)
+
+from stub_api import make_app, start_stub_server  # noqa: E402
+
+from app import services  # noqa: E402
+from app.cache_backends import SQLiteCache  # noqa: E402
+from app.cache_serializers import SERIALIZERS, make_serializer  # noqa: E402
+
+WORDS = (
+    "act amend appropriations authorize bill committee congress defense energy "
+    "federal funding health housing infrastructure national program provide "
+    "public report require secretary security service states support united "
+    "veterans water year referred subcommittee introduced passed house senate"
+).split()
+
+
+def _text(rng, words):
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def make_route(seed=7):
+    def route(path, query):
+        rng = random.Random(f"{seed}:{path}:{sorted(query.items())}")
+        offset = int(query.get("offset", 0))
+        limit = int(query.get("limit", 20))
+        parts = [p for p in path.split("/") if p]
+        if parts[:1] == ["member"] and len(parts) == 3:  # sponsored list
+            total = 250
+            return {
+                "sponsoredLegislation": [
+                    {
+                        "congress": 118,
+                        "type": "HR",
+                        "number": str(i + 1),
+                        "title": _text(rng, 14),
+                        "introducedDate": "2023-03-01",
+                        "latestAction": {
+                            "actionDate": "2023-03-02",
+                            "text": _text(rng, 8),
+                        },
+                        "url": f"https://api.congress.gov/v3/bill/118/hr/{i + 1}",
+                    }
+                    for i in range(offset, min(offset + limit, total))
+                ],
+                "pagination": {"count": total},
+            }
+        if parts[:1] == ["member"] and len(parts) == 2:  # member profile
+            return {
+                "member": {
+                    "bioguideId": parts[1],
+                    "directOrderName": "Jane Q. Public",
+                    "state": "Ohio",
+                    "partyHistory": [{"partyName": "Democratic", "startYear": 2013}],
+                    "terms": [
+                        {"chamber": "House of Representatives", "congress": c}
+                        for c in range(113, 119)
+                    ],
+                    "depiction": {
+                        "imageUrl": "https://www.congress.gov/img/member/x.jpg"
+                    },
+                }
+            }
+        if parts[:1] == ["member"]:  # directory
+            total = 2600
+            return {
+                "members": [
+                    {
+                        "bioguideId": f"B{i:06d}",
+                        "name": f"{_text(rng, 1)}, {_text(rng, 1)}",
+                        "partyName": rng.choice(["Democratic", "Republican"]),
+                        "state": rng.choice(["Ohio", "Texas", "Maine", "Iowa"]),
+                        "district": rng.randint(1, 20),
+                        "terms": {
+                            "item": [
+                                {
+                                    "chamber": "House of Representatives",
+                                    "startYear": 2021,
+                                }
+                            ]
+                        },
+                    }
+                    for i in range(offset, min(offset + limit, total))
+                ],
+                "pagination": {"count": total},
+            }
+        if parts[:1] == ["bill"] and len(parts) == 4:
+            base = f"https://api.congress.gov/v3/{'/'.join(parts)}"
+            return {
+                "bill": {
+                    "congress": int(parts[1]),
+                    "type": parts[2].upper(),
+                    "number": parts[3],
+                    "title": _text(rng, 16),
+                    "introducedDate": "2023-03-01",
+                    "policyArea": {"name": "Health"},
+                    "latestAction": {
+                        "actionDate": "2023-09-12",
+                        "text": _text(rng, 10),
+                    },
+                    **{
+                        key: {"count": 50, "url": f"{base}/{key.lower()}"}
+                        for key in (
+                            "actions",
+                            "cosponsors",
+                            "relatedBills",
+                            "amendments",
+                        )
+                    },
+                    "committees": {"count": 3, "url": f"{base}/committees"},
+                    "summaries": {"count": 3, "url": f"{base}/summaries"},
+                }
+            }
+        if parts[:1] == ["bill"] and len(parts) == 5:
+            sub = parts[4]
+            count = 3 if sub in ("committees", "summaries") else min(limit, 50)
+            items = []
+            for i in range(count):
+                if sub == "summaries":
+                    items.append(
+                        {
+                            "actionDate": "2023-03-01",
+                            "text": "<p>" + _text(rng, 180) + "</p>",
+                            "versionCode": "00",
+                        }
+                    )
+                elif sub == "cosponsors":
+                    items.append(
+                        {
+                            "bioguideId": f"C{i:06d}",
+                            "fullName": f"Rep. {_text(rng, 2)} [D-OH-{i % 15 + 1}]",
+                            "party": "D",
+                            "state": "OH",
+                            "sponsorshipDate": "2023-03-01",
+                            "isOriginalCosponsor": i < 10,
+                        }
+                    )
+                elif sub == "committees":
+                    items.append(
+                        {
+                            "name": _text(rng, 3) + " Committee",
+                            "chamber": "House",
+                            "systemCode": f"hs{i:02d}00",
+                            "activities": [
+                                {"name": "Referred To", "date": "2023-03-01"}
+                            ],
+                        }
+                    )
+                else:
+                    items.append(
+                        {
+                            "actionDate": "2023-03-01",
+                            "text": _text(rng, 12),
+                            "type": "IntroReferral",
+                            "congress": 118,
+                            "number": str(i + 1),
+                        }
+                    )
+            key = {"relatedbills": "relatedBills"}.get(sub, sub)
+            return {key: items}
+        return None
+
+    return route
+
+
+def capture_payloads(server):
+    app = make_app(server)
+    with app.app_context():
+        return {
+            "full bill package": services.get_full_bill_data.uncached(118, "hr", 1),
+            "sponsored list (250, detailed)": (
+                services.get_detailed_sponsored_legislation.uncached("A000001")
+            ),
+            "member directory (2600)": services.load_congress_members.uncached(None),
+            "member profile": services.get_member_details.uncached("A000001"),
+        }
+
+
+def bench(serializer, payloads, reads):
+    with tempfile.TemporaryDirectory() as workdir:
+        backend = SQLiteCache(
+            os.path.join(workdir, "cache.sqlite3"), serializer=serializer
+        )
+        results = {}
+        for label, payload in payloads.items():
+            start = time.perf_counter()
+            stored = serializer.dumps(payload)
+            encode = time.perf_counter() - start
+            backend.set(label, payload, timeout=0)
+            start = time.perf_counter()
+            for _ in range(reads):
+                backend.get(label)
+            hit = (time.perf_counter() - start) / reads
+            results[label] = (len(stored), encode, hit)
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reads", type=int, default=200)
+    parser.add_argument("--payload-dir", help="Directory of captured *.json payloads")
+    parser.add_argument("--min-bytes", type=int, default=1024)
+    args = parser.parse_args()
+
+    server = start_stub_server(make_route())
+    payloads = capture_payloads(server)
+    server.shutdown()
+    if args.payload_dir:
+        for path in sorted(glob.glob(os.path.join(args.payload_dir, "*.json"))):
+            with open(path) as f:
+                payloads[os.path.basename(path)] = json.load(f)
+
+    baseline = None
+    for name in SERIALIZERS:
+        try:
+            serializer = make_serializer(name, min_bytes=args.min_bytes)
+        except RuntimeError as e:
+            print(f"\n{name}: skipped ({e})")
+            continue
+        results = bench(serializer, payloads, args.reads)
+        baseline = baseline or results
+        print(f"\n{name}")
+        for label, (size, encode, hit) in results.items():
+            base_size, _, base_hit = baseline[label]
+            print(
+                f"  {label:<32} {size:9d} B ({size / base_size:6.1%})  "
+                f"encode {encode * 1000:7.2f} ms  hit {hit * 1000:7.3f} ms "
+                f"({hit / base_hit:5.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# FILE: benchmarks/bench_http_pool.py
+"""Compares one-connection-per-call requests against the pooled API session.
+
+Runs a local stub of the Congress.gov API and issues the same number of
+bill detail calls twice: once with a bare ``requests.get`` per call (the old
+behaviour) and once through ``_make_api_request``. The stub counts accepted
+connections so the handshake savings are visible next to the timings.
+
+Usage:
+    python benchmarks/bench_http_pool.py [--calls 250] [--tls]
+
+``--tls`` generates a throwaway self-signed certificate with ``openssl`` so
+the TLS handshake cost is included, as it is against api.congress.gov.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import requests
+
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests"),
+)
+
+from stub_api import make_app, make_tls_context, start_stub_server  # noqa: E402
+
+from app import utils  # noqa: E402
+from app.congress_registry import get_congress_registry  # noqa: E402
+from app.utils import _make_api_request  # noqa: E402
+
+
+def route(path, query):
+    if path == "/congress":
+        return {"congresses": [{"name": "119th Congress", "number": 119}]}
+    return {
+        "bill": {
+            "congress": 118,
+            "type": "HR",
+            "number": path.rsplit("/", 1)[-1],
+            "title": "Stub bill",
+            "latestAction": {"actionDate": "2024-01-01", "text": "Introduced"},
+        }
+    }
+
+
+def run(label, server, fn, calls):
+    before = server.connections
+    start = time.perf_counter()
+    for i in range(calls):
+        fn(i)
+    elapsed = time.perf_counter() - start
+    opened = server.connections - before
+    print(
+        f"{label:<28} {elapsed * 1000:9.1f} ms total  "
+        f"{elapsed * 1000 / calls:7.2f} ms/call  {opened:5d} connections"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=250)
+    parser.add_argument("--tls", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        tls_context = None
+        if args.tls:
+            tls_context, cert = make_tls_context(workdir)
+            os.environ["REQUESTS_CA_BUNDLE"] = cert
+        server = start_stub_server(route, tls_context=tls_context)
+        scheme = "https" if args.tls else "http"
+        app = make_app(server, scheme=scheme)
+        base_url = app.config["API_BASE_URL"]
+
+        def unpooled(i):
+            response = requests.get(
+                f"{base_url}/bill/118/hr/{i}",
+                params={"api_key": "bench", "format": "json"},
+                timeout=15,
+            )
+            response.raise_for_status()
+            response.json()
+
+        def pooled(i):
+            data, error = _make_api_request(f"/bill/118/hr/{i}")
+            if error:
+                raise RuntimeError(error)
+
+        with app.app_context():
+            # The Congress registry's first load runs in the background on
+            # the pooled session; let it finish, then start from cold pools
+            # so the pooled run's connection count includes its own setup.
+            registry = get_congress_registry()
+            deadline = time.monotonic() + 10
+            while not registry.loaded and time.monotonic() < deadline:
+                time.sleep(0.05)
+            for session in utils._http_sessions.values():
+                session.close()
+            utils._http_sessions.clear()
+
+        print(f"\n{args.calls} sequential calls against {base_url}")
+        run("requests.get per call", server, unpooled, args.calls)
+        with app.app_context():
+            run("pooled _make_api_request", server, pooled, args.calls)
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# FILE: benchmarks/bench_member_directory.py
+"""Cold-load time of load_congress_members: serial pages vs concurrent pages.
+
+The stub serves a ~540-member congress roster and a full historical
+directory, each page delayed by ``--latency`` seconds to mimic Congress.gov.
+"Serial" runs with MEMBER_PAGE_MAX_WORKERS=1, which walks the pages one at a
+time like the old loop did.
+
+Usage:
+    python benchmarks/bench_member_directory.py [--latency 0.4] [--all-count 2600]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests"),
+)
+
+from stub_api import make_app, start_stub_server  # noqa: E402
+
+from app.services import load_congress_members  # noqa: E402
+
+
+def make_route(congress_count, all_count):
+    def route(path, query):
+        if path.startswith("/member/congress/"):
+            total = congress_count
+        elif path == "/member":
+            total = all_count
+        else:
+            return None
+        offset = int(query.get("offset", 0))
+        limit = int(query.get("limit", 20))
+        members = [
+            {
+                "bioguideId": f"B{i:06d}",
+                "name": f"Member{i}, Test",
+                "partyName": "Democratic" if i % 2 else "Republican",
+                "state": "Ohio",
+                "district": (i % 15) or None,
+                "terms": {
+                    "item": [{"chamber": "House of Representatives", "startYear": 2023}]
+                },
+            }
+            for i in range(offset, min(offset + limit, total))
+        ]
+        return {"members": members, "pagination": {"count": total}}
+
+    return route
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.4)
+    parser.add_argument("--congress-count", type=int, default=540)
+    parser.add_argument("--all-count", type=int, default=2600)
+    args = parser.parse_args()
+
+    server = start_stub_server(
+        make_route(args.congress_count, args.all_count), latency=args.latency
+    )
+    print(f"\nPer-page upstream latency: {args.latency * 1000:.0f} ms")
+    for label, workers in (("serial", 1), ("concurrent", None)):
+        overrides = {"MEMBER_PAGE_MAX_WORKERS": workers} if workers else {}
+        app = make_app(server, **overrides)
+        for congress in ("118", None):
+            with app.app_context():
+                before = server.requests
+                start = time.perf_counter()
+                members = load_congress_members(congress)
+                elapsed = time.perf_counter() - start
+            print(
+                f"{label:<11} congress={congress or 'All':<4} "
+                f"{len(members or {}):6d} members  {server.requests - before:3d} pages  "
+                f"{elapsed * 1000:8.1f} ms"
+            )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# FILE: benchmarks/bench_member_search.py
+"""Query latency of /api/members/search's in-memory trigram index.
+
+Indexes ``--members`` synthetic directory rows (the all-Congress directory
+is ~12k) whose first names repeat as often as real ones do, so common
+names and short prefixes match thousands of members and surnames a few.
+Each query runs ``--runs`` times through MemberNameIndex.search; a plain
+substring scan over the same names is shown for scale. Also times the
+full build and an incremental update touching a handful of members.
+
+Usage:
+    python benchmarks/bench_member_search.py [--members 12000] [--runs 500]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.member_search import MemberNameIndex  # noqa: E402
+
+FIRST = (
+    "John William James Thomas George Charles Robert Joseph Samuel Henry David "
+    "Edward Richard Mary Nancy Elizabeth Margaret Patricia Lisa Nydia Mitch"
+).split()
+KNOWN = [
+    "Pelosi, Nancy",
+    "McConnell, Mitch",
+    "Velázquez, Nydia M.",
+    "Washington, George",
+]
+
+QUERIES = (
+    ("exact surname", "pelosi"),
+    ("typo", "mcconel"),
+    ("accent-free", "velazquez"),
+    ("full name typo", "washingtn george"),
+    ("common first name", "john"),
+    ("prefix (typing)", "jo"),
+    ("no match", "zzqqx"),
+)
+
+
+def make_members(count, seed=11):
+    rng = random.Random(seed)
+    letters = "abcdefghiklmnoprstuvwy"
+    surnames = [
+        "".join(rng.choice(letters) for _ in range(rng.randint(4, 10))).capitalize()
+        for _ in range(count // 3)
+    ]
+    names = KNOWN + [
+        f"{rng.choice(surnames)}, {rng.choice(FIRST)}"
+        for _ in range(count - len(KNOWN))
+    ]
+    return [
+        {"bioguide_id": f"B{n:06d}", "name": name, "state": "Ohio", "party": "D"}
+        for n, name in enumerate(names)
+    ]
+
+
+def time_query(func, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return result, statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=12000)
+    parser.add_argument("--runs", type=int, default=500)
+    args = parser.parse_args()
+
+    members = make_members(args.members)
+    index = MemberNameIndex()
+    start = time.perf_counter()
+    index.update(members, version=1)
+    built = time.perf_counter() - start
+
+    changed = [dict(m) for m in members]
+    changed[10]["party"] = "I"
+    changed[11]["name"] = "Renamed, Member"
+    del changed[12]
+    changed.append({"bioguide_id": "Z000001", "name": "Newcomer, Ann"})
+    start = time.perf_counter()
+    stats = index.update(changed, version=2)
+    patched = time.perf_counter() - start
+    print(
+        f"\nIndexed {args.members} members in {built * 1000:.0f} ms; "
+        f"update of 4 members {patched * 1000:.1f} ms ({stats})"
+    )
+
+    print(f"\n{'query':<18} {'q':<20} {'top match':<22} {'p50':>8}  {'p95':>8}")
+    for label, query in QUERIES:
+        results, p50, p95 = time_query(lambda: index.search(query, 20), args.runs)
+        top = results[0]["name"] if results else "-"
+        print(
+            f"{label:<18} {query!r:<20} {top:<22} "
+            f"{p50 * 1e6:6.0f}us  {p95 * 1e6:6.0f}us"
+        )
+    names = [m["name"].lower() for m in changed]
+    _, p50, p95 = time_query(
+        lambda: [name for name in names if "pelosi" in name], args.runs
+    )
+    print(
+        f"{'substring scan':<18} {'pelosi':<20} {'':<22} "
+        f"{p50 * 1e6:6.0f}us  {p95 * 1e6:6.0f}us"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -61,7 +61,7 @@ function MemberFilters({
           type="text"
           id="name-search"
           name="name"
-          placeholder="Enter name..."
+          placeholder="Last name starts with..."
           value={filters.name}
           onChange={handleNameChange} // Use debounced handler later
           disabled={isLoading}
@@ -2,7 +2,8 @@
 import React from "react";
 
 function MemberSelect({
-  members, // The filtered list of members
+  members, // The current page of matching members
+  total, // Number of matching members across all pages
   selectedMemberBioguide,
   onMemberSelect,
   isLoading,
@@ -23,7 +24,7 @@ function MemberSelect({
   } else {
     options = (
       <>
-        <option value="">-- Select Member ({members.length}) --</option>
+        <option value="">-- Select Member ({total ?? members.length}) --</option>
         {members.map((m) => (
           <option key={m.bioguide_id} value={m.bioguide_id}>
             {m.name}
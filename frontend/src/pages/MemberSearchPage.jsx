@@ -1,12 +1,13 @@
 // FILE: frontend/src/pages/MemberSearchPage.jsx
 import React, { useState, useEffect, useCallback, useRef } from "react";
 import { useLocation, useNavigate } from "react-router-dom";
-import { fetchMembers /*, fetchCongresses */ } from "../services/api"; // Assuming fetchCongresses might be added later
+import { fetchMembersPage /*, fetchCongresses */ } from "../services/api"; // Assuming fetchCongresses might be added later
 import LoadingSpinner from "../components/LoadingSpinner";
 import ErrorMessage from "../components/ErrorMessage";
 import MemberFilters from "../components/MemberFilters";
 import MemberSelect from "../components/MemberSelect";
 import MemberInfoDisplay from "../components/MemberInfoDisplay";
+import Pagination from "../components/Pagination";
 import "../styles/MemberSearchPage.css"; // Import specific styles if created
 
 // --- Mock/Placeholder Data ---
@@ -80,6 +81,14 @@ const MOCK_STATES = [
   "Virgin Islands",
 ].sort();
 const MOCK_CHAMBERS = ["House", "Senate"]; // Static is fine
+const DEFAULT_FILTERS = {
+  name: "",
+  party: "ALL",
+  chamber: "ALL",
+  state: "ALL",
+};
+const MEMBERS_PER_PAGE = 100; // Backend allows up to 250
+const NAME_DEBOUNCE_MS = 300;
 
 function MemberSearchPage() {
   // --- State Variables ---
@@ -87,27 +96,27 @@ function MemberSearchPage() {
   const [states] = useState(MOCK_STATES);
   const [chambers] = useState(MOCK_CHAMBERS);
 
-  const [allMembersForCongress, setAllMembersForCongress] = useState([]); // Raw list from API for selected congress
-  const [filteredMembers, setFilteredMembers] = useState([]); // Members matching UI filters
+  // One page of members matching the filters, filtered and sorted by the backend
+  const [members, setMembers] = useState([]);
+  const [pagination, setPagination] = useState(null); // { count, next } for the whole match
+  const [currentPageOffset, setCurrentPageOffset] = useState(0);
 
   // Filter State - Initialize with default congress
   const [currentCongress, setCurrentCongress] = useState(
     MOCK_CONGRESSES[0]?.number?.toString() || ""
   );
-  const [filters, setFilters] = useState({
-    name: "",
-    party: "ALL",
-    chamber: "ALL",
-    state: "ALL",
-  });
+  const [filters, setFilters] = useState(DEFAULT_FILTERS);
+  const [nameQuery, setNameQuery] = useState(""); // filters.name once typing pauses
 
   // UI State
   const [selectedMemberBioguide, setSelectedMemberBioguide] = useState(""); // Currently selected member ID in dropdown
   const [isInitialLoading, setIsInitialLoading] = useState(true); // Loading indicator for the *first* member list load
+  const [isLoadingMembers, setIsLoadingMembers] = useState(false); // Later page/filter loads
   const [memberListError, setMemberListError] = useState(null); // Error specific to member list fetching
 
   // --- Refs ---
   const memberSelectRef = useRef(null); // To reset dropdown selection visually if needed
+  const latestRequestRef = useRef(0); // Ignore responses to superseded requests
 
   // --- Router Hooks ---
   const location = useLocation();
@@ -116,176 +125,123 @@ function MemberSearchPage() {
 
   // --- Callbacks ---
 
-  // Load list of members for a specific congress
-  const loadMemberList = useCallback(async (congressNum) => {
-    if (!congressNum) {
-      setAllMembersForCongress([]);
-      setFilteredMembers([]);
-      setMemberListError("Please select a Congress.");
-      setIsInitialLoading(false); // Stop initial load indicator
-      return;
-    }
-    console.log(`Requesting members for Congress: ${congressNum}`);
-    // Keep isInitialLoading true only on first load, not subsequent congress changes
-    // setIsLoadingMembers(true); // Using isInitialLoading for the very first time
-    setMemberListError(null);
-    setAllMembersForCongress([]); // Clear previous data immediately
-    setFilteredMembers([]);
-
-    const { data, error } = await fetchMembers(congressNum); // Call API service
-
-    if (error) {
-      setMemberListError(`Error loading members: ${error}`);
-      setAllMembersForCongress([]);
-    } else if (data && Array.isArray(data)) {
-      // Check if data is an array
-      setAllMembersForCongress(data);
-      setMemberListError(null); // Clear previous errors
-    } else {
-      // Handle case where data is not an array (e.g., empty response or unexpected format)
-      setMemberListError(
-        "Received unexpected data structure for members list."
-      );
-      setAllMembersForCongress([]);
-      console.warn("Received non-array or missing data for members:", data);
-    }
-    setIsInitialLoading(false); // Turn off initial loading indicator after first successful/failed load
-  }, []); // Empty dependency array, relies on congressNum arg
-
-  // Filter the raw member list based on current UI filter state
-  const applyFilters = useCallback(() => {
-    const { name, party, chamber, state } = filters;
-    const nameLower = name.toLowerCase().trim();
-
-    const matching = allMembersForCongress
-      .filter((m) => {
-        if (!m) return false;
-        const nameMatch =
-          !nameLower || m.name?.toLowerCase().includes(nameLower);
-        const stateMatch = state === "ALL" || m.state === state;
-        const chamberMatch =
-          chamber === "ALL" ||
-          m.chamber?.toUpperCase() === chamber.toUpperCase();
-        const partyCode = m.party_code || "ID";
-        const partyMatch =
-          party === "ALL" ||
-          (party === "ID"
-            ? !["D", "R"].includes(partyCode)
-            : partyCode === party);
-        return nameMatch && stateMatch && chamberMatch && partyMatch;
-      })
-      .sort((a, b) => (a.name || "").localeCompare(b.name || ""));
+  // Load one page of members matching the current filters
+  const loadMemberPage = useCallback(
+    async (offset = 0) => {
+      if (!currentCongress) {
+        setMembers([]);
+        setPagination(null);
+        setMemberListError("Please select a Congress.");
+        setIsInitialLoading(false); // Stop initial load indicator
+        return;
+      }
+      const requestId = ++latestRequestRef.current;
+      setIsLoadingMembers(true);
+      setMemberListError(null);
 
-    setFilteredMembers(matching);
+      const { data, error } = await fetchMembersPage(currentCongress, {
+        name: nameQuery.trim(),
+        state: filters.state,
+        party_code: filters.party,
+        chamber: filters.chamber,
+        sort: "name",
+        offset,
+        limit: MEMBERS_PER_PAGE,
+      });
+      if (requestId !== latestRequestRef.current) return; // A newer request is in flight
 
-    // Clear selection if the selected member is filtered out
-    if (
-      selectedMemberBioguide &&
-      !matching.some((m) => m.bioguide_id === selectedMemberBioguide)
-    ) {
-      console.log(
-        "Selected member",
-        selectedMemberBioguide,
-        "filtered out. Clearing selection."
-      );
-      setSelectedMemberBioguide("");
-      if (memberSelectRef.current) {
-        memberSelectRef.current.value = "";
+      if (error) {
+        setMemberListError(`Error loading members: ${error}`);
+        setMembers([]);
+        setPagination(null);
+      } else if (data && Array.isArray(data.members)) {
+        setMembers(data.members);
+        setPagination(data.pagination || null);
+        setMemberListError(null); // Clear previous errors
+      } else {
+        setMemberListError(
+          "Received unexpected data structure for members list."
+        );
+        setMembers([]);
+        setPagination(null);
+        console.warn("Received unexpected data for members page:", data);
       }
-    }
-  }, [allMembersForCongress, filters, selectedMemberBioguide]);
+      setCurrentPageOffset(offset);
+      setIsLoadingMembers(false);
+      setIsInitialLoading(false); // Turn off initial loading indicator after first successful/failed load
+    },
+    [currentCongress, nameQuery, filters.state, filters.party, filters.chamber]
+  );
 
   // --- Effects ---
 
   // TODO: Fetch Congress list dynamically
   // useEffect(() => { fetchCongresses()... }, []);
 
-  // Load members when selected congress changes
+  // Wait for typing to pause before searching by name
   useEffect(() => {
-    if (currentCongress) {
-      setIsInitialLoading(true); // Set loading true when congress changes
-      loadMemberList(currentCongress);
-    } else {
-      // Handle case where no congress is selected (e.g., if 'All Congresses' was an option)
-      setAllMembersForCongress([]);
-      setFilteredMembers([]);
-      setIsInitialLoading(false);
-    }
-  }, [currentCongress, loadMemberList]); // Rerun when congress changes
+    const timer = setTimeout(
+      () => setNameQuery(filters.name),
+      NAME_DEBOUNCE_MS
+    );
+    return () => clearTimeout(timer);
+  }, [filters.name]);
 
-  // Apply filters when raw list or filters change
+  // Load the first page when the congress or filters change
   useEffect(() => {
-    // Check if members have loaded before applying filters
-    if (!isInitialLoading || allMembersForCongress.length > 0) {
-      applyFilters();
-    }
-  }, [allMembersForCongress, filters, applyFilters, isInitialLoading]);
+    loadMemberPage(0);
+  }, [loadMemberPage]);
 
   // Handle initial member selection via URL hash
   useEffect(() => {
-    // Process only once after the initial members have potentially loaded
-    if (
-      !initialHashProcessed &&
-      !isInitialLoading &&
-      allMembersForCongress.length > 0
-    ) {
+    // Process only once, after the first page has loaded
+    if (!initialHashProcessed && !isInitialLoading) {
       const hash = location.hash;
       if (hash && hash.startsWith("#member=")) {
         const bioguideIdFromHash = hash.substring(8);
-        console.log(
-          "Hash detected, attempting to select member:",
-          bioguideIdFromHash
-        );
-
-        const memberExists = allMembersForCongress.some(
-          (m) => m.bioguide_id === bioguideIdFromHash
-        );
-        if (memberExists) {
-          console.log(
-            "Member found in list, setting selected ID and clearing hash."
-          );
-          setSelectedMemberBioguide(bioguideIdFromHash);
-          navigate(location.pathname, { replace: true }); // Clear hash
-        } else {
-          console.warn("Member from hash not found in current Congress list.");
-          setMemberListError(
-            `Member ${bioguideIdFromHash} from link not found in Congress ${currentCongress}.`
-          );
-          navigate(location.pathname, { replace: true }); // Clear hash anyway
-        }
+        // The member may be on another page, so select it directly;
+        // MemberInfoDisplay reports an unknown ID
+        console.log("Hash detected, selecting member:", bioguideIdFromHash);
+        setSelectedMemberBioguide(bioguideIdFromHash);
+        navigate(location.pathname, { replace: true }); // Clear hash
       }
       setInitialHashProcessed(true); // Mark hash as processed for this load
     }
-  }, [
-    location,
-    navigate,
-    allMembersForCongress,
-    isInitialLoading,
-    initialHashProcessed,
-  ]); // Depend on loading state
+  }, [location, navigate, isInitialLoading, initialHashProcessed]);
 
   // --- Event Handlers ---
   const handleCongressChange = (event) => {
     const newCongress = event.target.value;
     setCurrentCongress(newCongress);
     // Reset filters and clear selection when congress changes
-    setFilters({ name: "", party: "ALL", chamber: "ALL", state: "ALL" });
+    setFilters(DEFAULT_FILTERS);
+    setNameQuery("");
     setSelectedMemberBioguide("");
+    setIsInitialLoading(true);
     setInitialHashProcessed(false); // Allow hash processing again for new congress
-    // loadMemberList is triggered by useEffect
+    // loadMemberPage is triggered by useEffect
   };
 
   const handleFilterChange = (newFilters) => {
-    setFilters(newFilters); // Update filter state which triggers applyFilters effect
+    setFilters(newFilters); // Triggers a reload from the first page
+    setSelectedMemberBioguide(""); // It may not match the new filters
+    if (memberSelectRef.current) {
+      memberSelectRef.current.value = "";
+    }
   };
 
   const handleMemberSelect = (bioguideId) => {
     setSelectedMemberBioguide(bioguideId); // Update selected member ID
   };
 
+  const handlePageChange = (newOffset) => {
+    if (newOffset !== null && newOffset !== currentPageOffset) {
+      loadMemberPage(newOffset);
+    }
+  };
+
   // --- Render ---
   if (isInitialLoading && !memberListError) {
-    // --- FIX: More accurate initial loading message ---
     return (
       <div className="initial-loading-container">
         <LoadingSpinner />
@@ -313,6 +269,8 @@ function MemberSearchPage() {
     );
   }
 
+  const totalMembers = pagination?.count ?? members.length;
+
   // --- Main Render after initial load ---
   return (
     <div className="member-search-container">
@@ -328,13 +286,20 @@ function MemberSearchPage() {
       />
 
       <MemberSelect
-        members={filteredMembers}
+        members={members}
+        total={totalMembers}
         selectedMemberBioguide={selectedMemberBioguide}
         onMemberSelect={handleMemberSelect}
-        isLoading={false} // Don't disable dropdown, message inside handles state
+        isLoading={isLoadingMembers}
         error={memberListError}
         selectRef={memberSelectRef}
       />
+      <Pagination
+        pagination={pagination}
+        currentPageOffset={currentPageOffset}
+        itemsPerPage={MEMBERS_PER_PAGE}
+        onPageChange={handlePageChange}
+      />
 
       {/* Show list loading error here if it happened *after* initial load (e.g., switching congress failed) */}
       {memberListError && !isInitialLoading && (
@@ -349,17 +314,15 @@ function MemberSearchPage() {
         />
       )}
       {/* Prompt to select member if none selected and no list error */}
-      {!selectedMemberBioguide && !memberListError && (
+      {!selectedMemberBioguide && !memberListError && !isLoadingMembers && (
         <div className="select-member-prompt">
-          {
-            allMembersForCongress.length > 0 && filteredMembers.length === 0
-              ? "No members match the current filters."
-              : allMembersForCongress.length > 0
-              ? "Select a member from the dropdown above to see details."
-              : !isInitialLoading // Only show if not in initial load state
-              ? `No members found or loaded for Congress ${currentCongress}.`
-              : "" // Should be showing initial loader
-          }
+          {totalMembers > 0
+            ? "Select a member from the dropdown above to see details."
+            : Object.entries(DEFAULT_FILTERS).some(
+                ([key, value]) => filters[key] !== value
+              )
+            ? "No members match the current filters."
+            : `No members found or loaded for Congress ${currentCongress}.`}
         </div>
       )}
     </div>
@@ -61,6 +61,20 @@ export const fetchMembers = async (congress) => {
     return { data: null, error: "Congress parameter is required." };
   return await apiRequest("/members", { congress }); // Endpoint registered under main_bp at root /api
 };
+export const fetchMembersPage = async (congress, params = {}) => {
+  // params = { name, state, party_code, chamber, sort, order, offset, limit }
+  // Filtered, sorted and paged by the backend: { members, pagination: { count, next } }
+  if (!congress)
+    return { data: null, error: "Congress parameter is required." };
+  const query = { congress };
+  Object.entries(params).forEach(([key, value]) => {
+    // Skip unset filters; the backend also treats "ALL" as no filter
+    if (value === undefined || value === null || value === "") return;
+    if (value === "ALL") return;
+    query[key] = value;
+  });
+  return await apiRequest("/members", query);
+};
 
 // Member Details (using specific member blueprint endpoints)
 export const fetchMemberDetails = async (bioguideId) => {
@@ -0,0 +1,70 @@
+# FILE: tests/conftest.py
+import time
+from collections import Counter
+
+import pytest
+
+from stub_api import make_app, start_stub_server
+
+from app import cache_tags, utils
+from app.config import Config
+from app.congress_registry import get_congress_registry
+
+
+class StubUpstream:
+    """Canned Congress.gov responses by path, with a count of calls per path.
+
+    A response is a payload (200), a ``(status, payload)`` pair, or a
+    callable taking the query dict and returning either; unknown paths
+    answer 404.
+    """
+
+    def __init__(self):
+        self.responses = {
+            "/congress": {"congresses": [{"name": "119th Congress", "number": 119}]}
+        }
+        self.calls = Counter()
+
+    def route(self, path, query):
+        self.calls[path] += 1
+        response = self.responses.get(path)
+        return response(query) if callable(response) else response
+
+
+@pytest.fixture
+def upstream():
+    stub = StubUpstream()
+    server = start_stub_server(stub.route)
+    stub.server = server
+    yield stub
+    server.shutdown()
+
+
+@pytest.fixture
+def app(upstream, tmp_path):
+    """The app on the real tiered cache, pointed at the stub upstream."""
+    app = make_app(
+        upstream.server,
+        CACHE_TYPE=Config.CACHE_TYPE,
+        CACHE_DIR=str(tmp_path / "cache"),
+        CACHE_LOCK_DIR=str(tmp_path / "locks"),
+        LOCAL_DB_PATH=str(tmp_path / "civictrack.sqlite3"),
+        API_MAX_RETRIES=0,
+        API_READ_TIMEOUT=0.3,
+        CIRCUIT_FAILURE_THRESHOLD=1000,  # Keep breakers out of the way
+    )
+    registry = get_congress_registry()
+    waited_until = time.monotonic() + 5
+    while not registry.loaded and time.monotonic() < waited_until:
+        time.sleep(0.01)  # Its first load would build the session mid-test
+    cache_tags._held_states.clear()  # Tag versions read against another cache
+    _close_http_sessions()  # Built from another test's config
+    with app.app_context():
+        yield app
+    _close_http_sessions()
+
+
+def _close_http_sessions():
+    for session in utils._http_sessions.values():
+        session.close()
+    utils._http_sessions.clear()
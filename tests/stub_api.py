@@ -0,0 +1,113 @@
+# FILE: tests/stub_api.py
+"""Minimal local stand-in for api.congress.gov used by the tests and benchmarks.
+
+``start_stub_server(route)`` serves JSON produced by ``route(path, query)``
+(``query`` is a dict of single values) with keep-alive enabled, an optional
+fixed per-request latency, and a count of accepted connections and requests.
+``route`` returns a payload (200), None (404) or a ``(status, payload)``
+pair to simulate upstream errors.
+"""
+
+import json
+import os
+import ssl
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app  # noqa: E402
+from app.config import Config  # noqa: E402
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Required for keep-alive
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.stats_lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        path = parsed.path[3:] if parsed.path.startswith("/v3/") else parsed.path
+        with self.server.stats_lock:
+            self.server.requests += 1
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        payload = self.server.route(path, query)
+        if isinstance(payload, tuple):
+            status, payload = payload
+        else:
+            status = 200 if payload is not None else 404
+        body = json.dumps(payload or {"error": {"message": "Not found"}}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(route, latency=0.0, tls_context=None):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    server.route = route
+    server.latency = latency
+    server.connections = 0
+    server.requests = 0
+    server.stats_lock = threading.Lock()
+    if tls_context:
+        server.socket = tls_context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_tls_context(workdir):
+    """Creates a throwaway self-signed certificate; returns (context, cert path)."""
+    cert = os.path.join(workdir, "cert.pem")
+    key = os.path.join(workdir, "key.pem")
+    subprocess.run(
+        [
+            "openssl",
+            "req",
+            "-x509",
+            "-newkey",
+            "rsa:2048",
+            "-nodes",
+            "-keyout",
+            key,
+            "-out",
+            cert,
+            "-days",
+            "1",
+            "-subj",
+            "/CN=127.0.0.1",
+            "-addext",
+            "subjectAltName=IP:127.0.0.1",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    return context, cert
+
+
+def make_app(server, scheme="http", **overrides):
+    """Builds the Flask app pointed at ``server`` with caching disabled."""
+    attrs = {
+        "CONGRESS_GOV_API_KEY": "bench",
+        "API_BASE_URL": f"{scheme}://127.0.0.1:{server.server_address[1]}/v3",
+        "CACHE_TYPE": "NullCache",
+    }
+    attrs.update(overrides)
+    return create_app(type("BenchConfig", (Config,), attrs))
@@ -0,0 +1,75 @@
+# FILE: tests/test_api_request.py
+"""Upstream calls under a request deadline."""
+
+import threading
+import time
+
+from app.config import Config
+from app.utils import (
+    DEADLINE_EXCEEDED_ERROR,
+    _api_single_flight,
+    _make_api_request,
+    set_request_deadline,
+)
+
+BILL_PATH = "/bill/118/hr/5"
+
+
+def _call(app, results, deadline=None):
+    with app.app_context():
+        set_request_deadline(deadline)
+        try:
+            results.append(_make_api_request(BILL_PATH))
+        finally:
+            set_request_deadline(None)
+
+
+def test_follower_does_not_inherit_leader_deadline(app, upstream):
+    app.config["API_READ_TIMEOUT"] = 2
+
+    def slow(query):
+        time.sleep(0.5)
+        return {"bill": {"number": "5"}}
+
+    upstream.responses[BILL_PATH] = slow
+    short, unbounded = [], []
+    leader = threading.Thread(target=_call, args=(app, short, 0.2))
+    leader.start()
+    while not _api_single_flight.in_flight():
+        time.sleep(0.001)
+    follower = threading.Thread(target=_call, args=(app, unbounded))
+    follower.start()
+    leader.join()
+    follower.join()
+
+    assert short[0][1].startswith(DEADLINE_EXCEEDED_ERROR)
+    assert unbounded[0] == ({"bill": {"number": "5"}}, None)
+    assert upstream.calls[BILL_PATH] == 2
+
+
+def test_interactive_request_retries_server_error(app, upstream):
+    app.config.update(
+        API_MAX_RETRIES=Config.API_MAX_RETRIES,
+        API_READ_TIMEOUT=Config.API_READ_TIMEOUT,
+    )
+    answers = iter([(503, {"error": {"message": "Down"}}), {"bill": {"number": "5"}}])
+    upstream.responses[BILL_PATH] = lambda query: next(answers)
+
+    results = []
+    _call(app, results, Config.REQUEST_DEADLINE)
+
+    assert results == [({"bill": {"number": "5"}}, None)]
+    assert upstream.calls[BILL_PATH] == 2
+
+
+def test_retry_is_skipped_when_its_backoff_misses_the_deadline(app, upstream):
+    app.config.update(API_MAX_RETRIES=3, API_RETRY_BACKOFF=5, API_RETRY_JITTER=0)
+    upstream.responses[BILL_PATH] = (503, {"error": {"message": "Down"}})
+
+    results = []
+    started = time.monotonic()
+    _call(app, results, 2)
+
+    assert "API HTTP 503" in results[0][1]
+    assert upstream.calls[BILL_PATH] == 2  # The first retry has no backoff
+    assert time.monotonic() - started < 1
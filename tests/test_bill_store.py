@@ -0,0 +1,142 @@
+# FILE: tests/test_bill_store.py
+"""Incremental bill sync and the store read in front of the cache."""
+
+import sqlite3
+
+import pytest
+
+from app import bill_store
+from app.services import get_bill_details, invalidate_cache_tags
+
+
+def _stamp(day):
+    return f"2024-01-{day:02d}T00:00:00Z"
+
+
+class BillList:
+    """/bill/118 sorted by updateDate, honouring fromDateTime, offset and limit."""
+
+    def __init__(self, upstream, days):
+        self.upstream = upstream
+        self.updated = {number: _stamp(day) for number, day in days.items()}
+        self.on_list = None  # Called after each list page is served
+        self.title = None  # Title of every record, "Bill <n>" if unset
+        upstream.responses["/bill/118"] = self.list_page
+        for number in days:
+            upstream.responses[f"/bill/118/hr/{number}"] = self.detail(number)
+
+    def list_page(self, query):
+        since = query.get("fromDateTime", "")
+        rows = sorted(
+            (updated, number)
+            for number, updated in self.updated.items()
+            if updated >= since
+        )
+        offset, limit = int(query["offset"]), int(query["limit"])
+        page = [
+            {"congress": 118, "type": "HR", "number": str(n), "updateDate": u}
+            for u, n in rows[offset : offset + limit]
+        ]
+        if self.on_list:
+            self.on_list()
+        return {"bills": page, "pagination": {"count": len(rows)}}
+
+    def detail(self, number):
+        def record(query):
+            return {
+                "bill": {
+                    "congress": 118,
+                    "type": "HR",
+                    "number": str(number),
+                    "title": self.title or f"Bill {number}",
+                    "updateDate": self.updated[number],
+                }
+            }
+
+        return record
+
+
+@pytest.fixture
+def small_pages(monkeypatch):
+    monkeypatch.setattr(bill_store, "SYNC_PAGE_SIZE", 2)
+
+
+def test_bill_updated_mid_sync_is_not_skipped(app, upstream, small_pages):
+    bills = BillList(upstream, {1: 1, 2: 2, 3: 3, 4: 4, 5: 5})
+
+    pages = []
+
+    def update_first_bill():
+        # Bill 1 moves to the end of the list while page 2 is being synced
+        pages.append(1)
+        if len(pages) == 2:
+            bills.updated[1] = _stamp(9)
+
+    bills.on_list = update_first_bill
+    stats = bill_store.sync_bills(118)
+
+    assert stats["error"] is None
+    assert stats["watermark"] == _stamp(9)
+    for number, updated in bills.updated.items():
+        assert bill_store.get_stored_bill(118, "hr", number)["updateDate"] == updated
+    assert upstream.calls["/bill/118/hr/1"] == 2  # Fetched again after its update
+
+
+def test_failed_fetch_holds_watermark_before_it(app, upstream, small_pages):
+    bills = BillList(upstream, {1: 1, 2: 2, 3: 3})
+    upstream.responses["/bill/118/hr/2"] = (503, {"error": {"message": "Down"}})
+
+    stats = bill_store.sync_bills(118)
+    assert stats["failed"] == 1
+    assert stats["watermark"] == _stamp(1)
+    assert bill_store.sync_state(118)["watermark"] == _stamp(1)
+
+    upstream.responses["/bill/118/hr/2"] = bills.detail(2)
+    stats = bill_store.sync_bills(118)
+    assert stats["error"] is None
+    assert stats["watermark"] == _stamp(3)
+    assert bill_store.sync_state(118)["bills"] == 3
+    assert upstream.calls["/bill/118/hr/1"] == 1  # Unchanged, not fetched again
+
+
+def test_unreadable_store_falls_back_to_upstream(app, upstream, monkeypatch):
+    BillList(upstream, {7: 1})
+
+    def locked():
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(bill_store, "_db", locked)
+    assert bill_store.get_stored_bill(118, "hr", 7) is None
+    assert get_bill_details(118, "hr", 7)["title"] == "Bill 7"
+
+
+@pytest.mark.parametrize("tag", ["congress:118", "all"])
+def test_congress_purge_stops_serving_synced_bills(app, upstream, tag):
+    BillList(upstream, {1: 1})
+    bill_store.sync_bills(118)
+    assert bill_store.get_stored_bill(118, "hr", 1) is not None
+
+    invalidate_cache_tags([tag])
+    assert bill_store.get_stored_bill(118, "hr", 1) is None
+
+    bill_store.sync_bills(118)  # A completed sync vouches for them again
+    assert bill_store.get_stored_bill(118, "hr", 1) is not None
+
+
+def test_first_stored_copy_outdates_cached_views(app, upstream):
+    bills = BillList(upstream, {3: 1})
+    assert get_bill_details(118, "hr", 3)["title"] == "Bill 3"
+
+    bills.updated[3] = _stamp(2)
+    bills.title = "Bill 3, amended"
+    bill_store.sync_bills(118)
+    assert get_bill_details(118, "hr", 3)["title"] == "Bill 3, amended"
+
+
+def test_all_tag_purges_every_cached_view(app, upstream):
+    BillList(upstream, {4: 1})
+    get_bill_details(118, "hr", 4)
+
+    invalidate_cache_tags(["all"])
+    get_bill_details(118, "hr", 4)
+    assert upstream.calls["/bill/118/hr/4"] == 2
@@ -0,0 +1,133 @@
+# FILE: tests/test_cache_failures.py
+"""Upstream failures must not poison the cache.
+
+404s are answers and are cached for CACHE_NEGATIVE_TTL; 5xx, timeouts and
+partly failed pages are transient and must be fetched again next time.
+"""
+
+import time
+
+import pytest
+
+from app.caching import (
+    RESULT_NOT_FOUND,
+    RESULT_OK,
+    RESULT_TRANSIENT,
+    classify_result,
+)
+from app.services import get_bill_details, get_detailed_sponsored_legislation
+
+BILL_PATH = "/bill/118/hr/{}"
+
+
+def _bill(number):
+    return {
+        "bill": {
+            "congress": 118,
+            "type": "HR",
+            "number": str(number),
+            "title": f"Bill {number}",
+            "latestAction": {"actionDate": "2024-01-01", "text": "Referred"},
+        }
+    }
+
+
+def test_not_found_is_cached_for_negative_ttl(app, upstream):
+    app.config["CACHE_NEGATIVE_TTL"] = 1
+    path = BILL_PATH.format(404)  # No canned response: the stub answers 404
+
+    first = get_bill_details(118, "hr", 404)
+    second = get_bill_details(118, "hr", 404)
+
+    assert "API HTTP 404" in first["error"]
+    assert second == first
+    assert upstream.calls[path] == 1
+
+    time.sleep(1.1)  # Past CACHE_NEGATIVE_TTL the 404 is asked for again
+    get_bill_details(118, "hr", 404)
+    assert upstream.calls[path] == 2
+
+
+def test_server_error_is_not_cached(app, upstream):
+    path = BILL_PATH.format(503)
+    upstream.responses[path] = (503, {"error": {"message": "Unavailable"}})
+
+    assert "API HTTP 503" in get_bill_details(118, "hr", 503)["error"]
+    upstream.responses[path] = _bill(503)
+    assert get_bill_details(118, "hr", 503)["title"] == "Bill 503"
+    assert upstream.calls[path] == 2
+
+
+def test_read_timeout_is_not_cached(app, upstream):
+    path = BILL_PATH.format(408)
+
+    def slow(query):
+        time.sleep(0.6)  # Longer than API_READ_TIMEOUT (0.3s)
+        return _bill(408)
+
+    upstream.responses[path] = slow
+    assert get_bill_details(118, "hr", 408)["error"].startswith("Timeout")
+    upstream.responses[path] = _bill(408)
+    assert get_bill_details(118, "hr", 408)["title"] == "Bill 408"
+    assert upstream.calls[path] == 2
+
+
+def test_sponsored_page_with_item_errors_is_not_cached(app, upstream):
+    list_path = "/member/S000001/sponsored-legislation"
+    upstream.responses[list_path] = {
+        "sponsoredLegislation": [
+            {
+                "congress": 118,
+                "number": str(number),
+                "url": f"https://api.congress.gov/v3/bill/118/hr/{number}",
+            }
+            for number in (1, 2)
+        ],
+        "pagination": {"count": 2},
+    }
+    upstream.responses[BILL_PATH.format(1)] = _bill(1)
+    upstream.responses[BILL_PATH.format(2)] = (503, {"error": {"message": "Down"}})
+
+    page = get_detailed_sponsored_legislation("S000001")
+    assert page["itemErrors"] == 1
+    assert [item["number"] for item in page["items"]] == ["1"]
+
+    upstream.responses[BILL_PATH.format(2)] = _bill(2)
+    page = get_detailed_sponsored_legislation("S000001")
+    assert page["itemErrors"] == 0
+    assert sorted(item["number"] for item in page["items"]) == ["1", "2"]
+    assert upstream.calls[list_path] == 2  # The partial page wasn't stored
+    assert upstream.calls[BILL_PATH.format(1)] == 1  # Its good item was
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ({"title": "Bill 1", "error": None}, RESULT_OK),
+        ([], RESULT_OK),
+        (
+            {"error": "API HTTP 404: API HTTP 404 for /bill/118/hr/9: Not found"},
+            RESULT_NOT_FOUND,
+        ),
+        (
+            {"error": "API HTTP 503: API HTTP 503 for /bill/118/hr/9: Down"},
+            RESULT_TRANSIENT,
+        ),
+        (
+            {"error": "API HTTP 429: API HTTP 429 for /bill/118/hr/9: Slow down"},
+            RESULT_TRANSIENT,
+        ),
+        ({"error": "Timeout (15s) for /bill/118/hr/9"}, RESULT_TRANSIENT),
+        (
+            {"error": "Circuit open for bill API; skipped /bill/118/hr/9"},
+            RESULT_TRANSIENT,
+        ),
+        (
+            {"error": "Request deadline exceeded; skipped /bill/118/hr/9"},
+            RESULT_TRANSIENT,
+        ),
+        (None, RESULT_TRANSIENT),
+    ],
+)
+def test_classify_result(value, expected):
+    assert classify_result(value) == expected
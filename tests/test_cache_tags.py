@@ -0,0 +1,68 @@
+# FILE: tests/test_cache_tags.py
+"""Tag invalidation, in-process reuse of tag versions, and re-warming."""
+
+import time
+
+from app import cache, cache_tags
+from app.services import get_bill_details, rewarm_cache_tags
+
+
+def _bill(number):
+    return {"bill": {"congress": 118, "type": "HR", "number": str(number)}}
+
+
+def _count_tag_reads(monkeypatch):
+    reads = []
+    get_many = cache.get_many
+
+    def counting_get_many(*keys):
+        reads.extend(k for k in keys if k.startswith(cache_tags.TAG_KEY_PREFIX))
+        return get_many(*keys)
+
+    monkeypatch.setattr(cache, "get_many", counting_get_many)
+    return reads
+
+
+def test_cache_hits_reuse_tag_versions(app, upstream, monkeypatch):
+    upstream.responses["/bill/118/hr/7"] = _bill(7)
+    get_bill_details(118, "hr", 7)
+    reads = _count_tag_reads(monkeypatch)
+
+    for _ in range(5):
+        assert get_bill_details(118, "hr", 7)["number"] == "7"
+    assert reads == []
+    assert upstream.calls["/bill/118/hr/7"] == 1
+
+
+def test_local_invalidation_is_seen_at_once(app, upstream):
+    upstream.responses["/bill/118/hr/8"] = _bill(8)
+    get_bill_details(118, "hr", 8)
+
+    cache_tags.invalidate([cache_tags.bill_tag(118, "hr", 8)])
+    get_bill_details(118, "hr", 8)
+    assert upstream.calls["/bill/118/hr/8"] == 2
+
+
+def test_other_workers_invalidation_is_seen_after_interval(app, upstream):
+    app.config["CACHE_TAG_CHECK_INTERVAL"] = 0.5
+    upstream.responses["/bill/118/hr/9"] = _bill(9)
+    get_bill_details(118, "hr", 9)
+
+    # Another worker bumps the version in the shared cache only
+    tag_key = cache_tags.TAG_KEY_PREFIX + cache_tags.bill_tag(118, "hr", 9)
+    cache.set(tag_key, {"version": time.time_ns(), "mode": "purge"}, timeout=0)
+    get_bill_details(118, "hr", 9)
+    assert upstream.calls["/bill/118/hr/9"] == 1
+
+    time.sleep(0.6)
+    get_bill_details(118, "hr", 9)
+    assert upstream.calls["/bill/118/hr/9"] == 2
+
+
+def test_rewarm_fills_the_entries_callers_read(app, upstream):
+    upstream.responses["/bill/118/hr/6"] = _bill(6)
+    rewarm_cache_tags([cache_tags.bill_tag(118, "hr", 6)])
+
+    key = get_bill_details.make_cache_key(118, "hr", 6)  # As the routes ask
+    assert get_bill_details.make_cache_key("118", "HR", "6") == key  # List items
+    assert cache.get(key) is not None
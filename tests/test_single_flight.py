@@ -0,0 +1,79 @@
+# FILE: tests/test_single_flight.py
+"""Coalesced callers each get their own copy of the leader's result."""
+
+import threading
+import time
+
+from app.utils import SingleFlight
+
+FOLLOWERS = 4
+
+
+def _run_coalesced(flight, fn, on_lead=None):
+    """Runs a leader and FOLLOWERS followers; returns their results and errors."""
+    results, errors, leader_result = [], [], []
+
+    def call(f, into):
+        try:
+            result = flight.do("key", f)
+        except Exception as e:
+            errors.append(e)
+            return
+        into.append(result)
+        if into is leader_result and on_lead:
+            on_lead(result)
+
+    def lead():
+        time.sleep(0.2)  # Long enough for every follower to join the flight
+        return fn()
+
+    threads = [
+        threading.Thread(target=call, args=(fn, results)) for _ in range(FOLLOWERS)
+    ]
+    leader = threading.Thread(target=call, args=(lead, leader_result))
+    leader.start()
+    while not flight.in_flight() and leader.is_alive():
+        time.sleep(0.001)
+    for thread in threads:
+        thread.start()
+    leader.join()
+    for thread in threads:
+        thread.join()
+    return leader_result, results, errors
+
+
+def test_followers_get_private_copies_while_leader_mutates():
+    flight = SingleFlight()
+    original = {f"bill{n}": {"number": n, "actions": [n] * 20} for n in range(20000)}
+    mutated = threading.Event()
+
+    def mutate(result):
+        # As callers do: add fields to the result while followers copy it
+        started = time.monotonic()
+        n = 0
+        while time.monotonic() - started < 0.3:
+            result[f"detailPageUrl{n}"] = n
+            n += 1
+        mutated.set()
+
+    leader_result, followers, errors = _run_coalesced(
+        flight, lambda: {key: dict(value) for key, value in original.items()}, mutate
+    )
+
+    assert mutated.is_set()
+    assert not errors
+    assert len(followers) == FOLLOWERS
+    assert all(result == original for result in followers)
+    assert len({id(r) for r in followers + leader_result}) == FOLLOWERS + 1
+
+
+def test_exceptions_reach_every_caller():
+    flight = SingleFlight()
+
+    def fail():
+        raise ValueError("upstream broke")
+
+    leader_result, followers, errors = _run_coalesced(flight, fail)
+    assert not followers
+    assert len(errors) == FOLLOWERS + 1  # The leader's caller too
+    assert all(isinstance(e, ValueError) for e in errors)